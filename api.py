@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+Recovery Buddy - JSON API server for check-ins (see recovery_buddy/api.py)
+"""
+
+from recovery_buddy.api import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON API throughput and latency
+
+Starts `python api.py` on a scratch database in a subprocess, then drives it
+from asyncio clients, each on one keep-alive connection. Every client
+submits check-ins for its own patients and reads a page of history after
+every fifth submit. Reports requests per second and p50/p95/p99 latency
+per route as the clients saw them (the server's own histograms are on
+/metrics). The server is given a random bearer token that every request
+sends.
+
+Run from the repository root:
+    python benchmarks/bench_api.py [clients] [requests per client]
+"""
+
+import asyncio
+import json
+import math
+import os
+import random
+import secrets
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLIENTS = 32
+REQUESTS = 200
+PROCEDURES = ["rhinoplasty", "breast_augmentation", "tummy_tuck", "liposuction", "facelift"]
+LEVELS = ["none", "mild", "moderate", "severe"]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list"""
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+TOKEN = secrets.token_urlsafe(32)
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: bench\r\nAuthorization: Bearer {TOKEN}\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = int(next(line.split(b":")[1] for line in head.split(b"\r\n") if line.lower().startswith(b"content-length")))
+    await reader.readexactly(length)
+    return status
+
+
+async def client(port, client_id, requests, samples):
+    rng = random.Random(client_id)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    name = f"Bench patient {client_id}"
+    procedure = rng.choice(PROCEDURES)
+    for i in range(requests):
+        if i % 5 == 4:
+            route, args = "GET history", ("GET", f"/patients/{name.replace(' ', '%20')}/checkins?limit=20")
+        else:
+            route, args = "POST checkin", ("POST", "/checkins", {
+                "name": name, "procedure": procedure, "day": 1 + i // 4, "pain_level": rng.randint(1, 10),
+                "swelling": rng.choice(LEVELS), "bruising": rng.choice(LEVELS), "emotional_state": "okay"})
+        start = time.perf_counter()
+        status = await request(reader, writer, *args)
+        samples[route].append(time.perf_counter() - start)
+        if status >= 400:
+            raise RuntimeError(f"{route} answered {status}")
+    writer.close()
+
+
+async def drive(port, clients, requests):
+    samples = defaultdict(list)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, i, requests, samples) for i in range(clients)))
+    return samples, time.perf_counter() - start
+
+
+async def wait_for(port, timeout=15):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main():
+    args = [int(a) for a in sys.argv[1:3]]
+    clients, requests = args + [CLIENTS, REQUESTS][len(args):]
+    port = free_port()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "api.py"), "--port", str(port),
+                                   "--db", os.path.join(scratch, "bench.db")],
+                                  env=dict(os.environ, RECOVERY_BUDDY_API_TOKEN=TOKEN),
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            asyncio.run(wait_for(port))
+            samples, wall = asyncio.run(drive(port, clients, requests))
+        finally:
+            server.terminate()
+            server.wait()
+
+    total = sum(len(times) for times in samples.values())
+    print(f"{clients} keep-alive clients x {requests} requests")
+    print(f"{'route':<14} {'requests':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for route, times in sorted(samples.items()):
+        times.sort()
+        print(f"{route:<14} {len(times):>8} {percentile(times, 50) * 1e3:>8.2f} "
+              f"{percentile(times, 95) * 1e3:>8.2f} {percentile(times, 99) * 1e3:>8.2f}")
+    print(f"{total / wall:,.0f} requests/s over {wall:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
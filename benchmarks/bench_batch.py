@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch check-in throughput of `main.py --batch`
+
+Generates synthetic check-ins (a few thousand people, one check-in a day
+each) as JSON lines, then runs them through main.py's run_batch on one process
+and on a process pool, reporting records per second end to end: reading,
+assessing and writing the results.
+
+Run from the repository root:
+    python benchmarks/bench_batch.py [records] [workers]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main as chatbot  # noqa: E402
+
+RECORDS = 100_000
+PEOPLE = 5_000
+FIRST_DAY = date(2026, 1, 1)
+LEVELS = ["none", "mild", "moderate", "severe"]
+
+
+def write_checkins(path, records):
+    rng = random.Random(42)
+    procedures = list(chatbot.PROCEDURES) + ["other"]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(records):
+            person, day = i % PEOPLE, 1 + (i // PEOPLE) % 365
+            f.write(json.dumps({
+                "name": f"Patient {person}", "procedure": procedures[person % len(procedures)],
+                "day": day, "pain_level": rng.randint(1, 10),
+                "swelling": rng.choice(LEVELS), "bruising": rng.choice(LEVELS),
+                "bleeding": rng.choice(["none", "spotting", "light", "heavy"]),
+                "fever": rng.random() < 0.05, "temperature": "101.2",
+                "emotional_state": rng.choice(["great", "good", "okay", "down"]),
+                "date": (FIRST_DAY + timedelta(days=day - 1)).isoformat(),
+            }) + "\n")
+
+
+def time_batch(path, output, workers):
+    start = time.perf_counter()
+    count, _ = chatbot.run_batch(path, output, workers)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    args = [int(a) for a in sys.argv[1:3]]
+    records, workers = args + [RECORDS, os.cpu_count() or 1][len(args):]
+
+    with tempfile.TemporaryDirectory() as scratch:
+        # run_batch reads the progress file from the working directory
+        cwd = os.getcwd()
+        os.chdir(scratch)
+        try:
+            write_checkins("checkins.jsonl", records)
+            single = time_batch("checkins.jsonl", "results.jsonl", 1)
+            pooled = time_batch("checkins.jsonl", "results.jsonl", workers)
+        finally:
+            os.chdir(cwd)
+
+    print(f"Batch assessment of {records:,} check-ins")
+    print(f"  1 process:             {single:10,.0f} records/s")
+    print(f"  {workers} worker processes:  {pooled:10,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: clinic queries over many patients
+
+Fills a scratch check-in database with the progress entries of many
+patients (imported as the API's --import-progress does), then times the
+clinic view's queries against the patients table and, for comparison, a scan
+of every patient's entries in the progress data for the same "high pain
+today" answer. Reports milliseconds per query.
+
+Run from the repository root:
+    python benchmarks/bench_clinic.py [patients] [check-ins per patient]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from recovery_buddy.checkin_store import CheckInStore  # noqa: E402
+from recovery_buddy.engine import HIGH_PAIN, SEVERITY_HIGH_PAIN, SEVERITY_WATCH  # noqa: E402
+
+PATIENTS = 5_000
+CHECKINS = 20
+REPEATS = 50
+PROCEDURES = ["rhinoplasty", "breast_augmentation", "tummy_tuck", "liposuction", "facelift"]
+TODAY = date(2026, 3, 1)
+
+
+def make_progress(rng, patients, checkins):
+    progress = {}
+    for i in range(patients):
+        last = TODAY - timedelta(days=rng.choice([0, 0, 1, 2, 5]))
+        first_day = rng.randint(1, 60)
+        progress[f"Patient {i:05d}"] = {"procedure": rng.choice(PROCEDURES), "entries": [
+            {"day": first_day + n, "pain_level": rng.randint(1, 10), "swelling": "mild", "emotional_state": "okay",
+             "date": (last - timedelta(days=checkins - 1 - n)).isoformat()} for n in range(checkins)]}
+    return progress
+
+
+def scan(progress, today):
+    """High pain today by reading every patient's entries"""
+    found = []
+    for name, person in progress.items():
+        pains = [e["pain_level"] for e in person["entries"] if e["date"] == today]
+        if pains and max(pains) >= HIGH_PAIN:
+            found.append(name)
+    return sorted(found)
+
+
+def ms_per_call(fn):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = fn()
+    return (time.perf_counter() - start) / REPEATS * 1e3, result
+
+
+def main():
+    args = [int(a) for a in sys.argv[1:3]]
+    patients, checkins = args + [PATIENTS, CHECKINS][len(args):]
+    progress = make_progress(random.Random(42), patients, checkins)
+    today = TODAY.isoformat()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        store = CheckInStore(os.path.join(scratch, "bench.db"))
+        start = time.perf_counter()
+        store.import_progress(progress)
+        loaded = time.perf_counter() - start
+        try:
+            timings = [
+                ("high pain today, page 1", ms_per_call(lambda: store.patients(today, SEVERITY_HIGH_PAIN))),
+                ("high pain today, page 20",
+                 ms_per_call(lambda: store.patients(today, SEVERITY_HIGH_PAIN, offset=19 * 25))),
+                ("above typical, any date", ms_per_call(lambda: store.patients(None, SEVERITY_WATCH))),
+                ("one procedure, days 10-20", ms_per_call(lambda: store.patients(procedure="facelift",
+                                                                                 days=(10, 20)))),
+                ("everyone", ms_per_call(lambda: store.patients())),
+            ]
+            indexed, total = store.patients(today, SEVERITY_HIGH_PAIN, limit=patients)
+        finally:
+            store.close()
+    scanned_ms, scanned = ms_per_call(lambda: scan(progress, today))
+    if sorted(p["name"] for p in indexed) != scanned:
+        raise SystemExit("patients table and scan disagree")
+
+    print(f"{patients:,} patients x {checkins} check-ins (imported in {loaded:.1f}s), "
+          f"{total:,} with high pain today")
+    for name, (ms, _) in timings:
+        print(f"  {name:<28} {ms:8.3f} ms")
+    print(f"  {'scan of every entry':<28} {scanned_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call cost of each check-in engine function
+
+Times every CheckInEngine method (and assess_progress, with a history built
+from scratch and with a DailySeries kept up to date) on a fixed set of
+random check-ins, reporting microseconds per call. Uses the CLI's procedures
+and default tips from main.py.
+
+Run from the repository root:
+    python benchmarks/bench_engine.py
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import ENGINE  # noqa: E402
+from recovery_buddy.engine import assess_progress, build_symptoms  # noqa: E402
+from recovery_buddy.trends import DailySeries  # noqa: E402
+
+CALLS = 20_000
+HISTORY = 60
+LEVELS = ["none", "mild", "moderate", "severe"]
+MOODS = ["great", "good", "okay", "down", "struggling", "anxious"]
+
+
+def make_checkins(rng):
+    procedures = list(ENGINE.procedures) + ["other"]
+    checkins = []
+    for _ in range(CALLS):
+        symptoms = build_symptoms(rng.choice(LEVELS), rng.choice(LEVELS),
+                                  rng.choice(["none", "spotting", "light", "heavy"]),
+                                  rng.random() < 0.1, "101.3", rng.random() < 0.2)
+        checkins.append((rng.choice(procedures), rng.randint(1, 90), symptoms, rng.randint(1, 10), rng.choice(MOODS)))
+    return checkins
+
+
+def make_history(rng):
+    first = date(2026, 1, 1)
+    return [{'day': i + 1, 'pain_level': rng.randint(1, 10), 'swelling': 'mild', 'emotional_state': 'okay',
+             'date': (first + timedelta(days=i)).isoformat()} for i in range(HISTORY)]
+
+
+def per_call(fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(*item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    rng = random.Random(42)
+    checkins = make_checkins(rng)
+    history = make_history(rng)
+    today = (date(2026, 1, 1) + timedelta(days=HISTORY)).isoformat()
+    records = [{'name': 'Pat', 'procedure': p, 'day': d, 'pain_level': pain, 'swelling': s['swelling'],
+                'bleeding': s['bleeding'], 'fever': s['fever'], 'temperature': '101.3', 'date': today}
+               for p, d, s, pain, _ in checkins]
+    series = DailySeries.from_history(history, 'pain_level')
+
+    timings = [
+        ("assess_symptoms", per_call(ENGINE.assess_symptoms, [(p, d, s, pain) for p, d, s, pain, _ in checkins])),
+        ("check_warnings", per_call(ENGINE.check_warnings, [(p, s) for p, _, s, _, _ in checkins])),
+        ("assess_mood", per_call(ENGINE.assess_mood, [(m, p, d) for p, d, _, _, m in checkins])),
+        ("daily_tip", per_call(ENGINE.daily_tip, [(p, d) for p, d, _, _, _ in checkins])),
+        ("parse_checkin", per_call(ENGINE.parse_checkin, [(r, today) for r in records])),
+        (f"assess_progress ({HISTORY} entries)",
+         per_call(assess_progress, [(history, d, pain, s, m, today) for _, d, s, pain, m in checkins[:2000]])),
+        ("assess_progress (kept series)",
+         per_call(assess_progress, [(history, d, pain, s, m, today, series) for _, d, s, pain, m in checkins])),
+    ]
+    check_ins = [ENGINE.parse_checkin(r, today) for r in records]
+    timings.append(("assess (everything)", per_call(ENGINE.assess, [(c, history, series) for c in check_ins])))
+
+    print(f"Check-in engine, microseconds per call ({CALLS:,} random check-ins)")
+    for name, us in timings:
+        print(f"  {name:<34} {us:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: reminder scheduler at tens of thousands of timers
+
+For each timer count, adds that many reminders with random due times to a
+ReminderScheduler, cancels half of them and delivers the rest to a channel
+that drops them, reporting microseconds per add, cancel and delivery. A
+sorted list kept with bisect.insort and list.remove is timed on the same
+timers for comparison; its adds and cancels grow with the number of timers.
+
+Run from the repository root:
+    python benchmarks/bench_reminders.py [timers ...]
+"""
+
+import bisect
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from recovery_buddy.reminders import DAY, MEDICATION, ReminderScheduler  # noqa: E402
+
+SIZES = [10_000, 50_000, 100_000]
+NOW = 1_800_000_000.0
+
+
+class DropChannel:
+    def send(self, reminder):
+        pass
+
+
+def us_per(count, start):
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def bench_scheduler(dues, cancelled):
+    scheduler = ReminderScheduler({"drop": DropChannel()}, clock=lambda: NOW)
+    start = time.perf_counter()
+    for i, due in enumerate(dues):
+        scheduler.add(f"Patient {i % 5000}", MEDICATION, "Time to take your medication", "drop", "x", due)
+    add = us_per(len(dues), start)
+
+    start = time.perf_counter()
+    for i in cancelled:
+        scheduler.cancel(i + 1)
+    cancel = us_per(len(cancelled), start)
+
+    start = time.perf_counter()
+    delivered = scheduler.run_due(NOW + 2 * DAY)
+    deliver = us_per(delivered, start)
+    return add, cancel, deliver
+
+
+def bench_sorted_list(dues, cancelled):
+    timers = []
+    start = time.perf_counter()
+    for i, due in enumerate(dues):
+        bisect.insort(timers, (due, i))
+    add = us_per(len(dues), start)
+
+    start = time.perf_counter()
+    for i in cancelled:
+        timers.remove((dues[i], i))
+    return add, us_per(len(cancelled), start)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    rng = random.Random(42)
+    print(f"{'timers':>8} {'add us':>8} {'cancel us':>10} {'deliver us':>11} "
+          f"{'list add us':>12} {'list cancel us':>15}")
+    for size in sizes:
+        dues = [NOW + rng.random() * DAY for _ in range(size)]
+        cancelled = rng.sample(range(size), size // 2)
+        add, cancel, deliver = bench_scheduler(dues, cancelled)
+        list_add, list_cancel = bench_sorted_list(dues, cancelled)
+        print(f"{size:>8,} {add:>8.2f} {cancel:>10.2f} {deliver:>11.2f} {list_add:>12.2f} {list_cancel:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-rerun script execution, thin shim vs. monolithic app.py
+
+Streamlit re-executes the main script on every rerun. When everything lived
+in app.py, each rerun re-ran every top-level definition (about 60 functions,
+their cache decorators and the content tables) before reaching the page.
+app.py is now a shim that imports the views package once per process.
+
+1. Definitions: executing the views modules' code (what each rerun of the
+   monolithic app.py paid before rendering anything) vs. the shim's import.
+2. Full reruns with AppTest on the welcome page: the shim vs. a generated
+   script that re-executes all of the views code each run, as app.py used to.
+
+Requires streamlit.
+
+Run from the repository root:
+    python benchmarks/bench_script_run.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+VIEWS = ["common", "chrome", "info", "dashboard", "tools", "checkin", "router"]
+DEFINITION_RUNS = 200
+RERUNS = 50
+
+MONOLITH = '''
+import sys
+sys.path[:0] = [{root!r}, {scratch!r}]
+import streamlit as st
+from _monolith_code import code_objects
+
+st.set_page_config(page_title="My Recovery Buddy", page_icon="🌸", layout="wide")
+
+# Every run re-executes all of the page code, as the single-file app.py did
+namespace = {{"__name__": "__monolith__"}}
+for code in code_objects():
+    exec(code, namespace)
+namespace["run"]()
+'''
+
+MONOLITH_CODE = '''
+import os
+from functools import lru_cache
+
+VIEWS = {views!r}
+
+
+@lru_cache(maxsize=None)
+def code_objects():
+    """Compiled once, like Streamlit's cached bytecode for the main script"""
+    codes = []
+    for name in VIEWS:
+        path = os.path.join({root!r}, "views", name + ".py")
+        with open(path, "r", encoding="utf-8") as f:
+            codes.append(compile(f.read(), path, "exec"))
+    return tuple(codes)
+'''
+
+
+def compiled_views():
+    codes = []
+    for name in VIEWS:
+        path = os.path.join(ROOT, "views", name + ".py")
+        with open(path, "r", encoding="utf-8") as f:
+            codes.append(compile(f.read(), path, "exec"))
+    return codes
+
+
+def time_definitions():
+    import views.router  # noqa: F401 - warm the module cache, as after the first run
+
+    codes = compiled_views()
+    start = time.perf_counter()
+    for _ in range(DEFINITION_RUNS):
+        namespace = {"__name__": "__monolith__"}
+        for code in codes:
+            exec(code, namespace)
+    monolith = (time.perf_counter() - start) / DEFINITION_RUNS
+
+    shim = compile("from views.router import run", "app.py", "exec")
+    start = time.perf_counter()
+    for _ in range(DEFINITION_RUNS):
+        exec(shim, {"__name__": "__main__"})
+    imported = (time.perf_counter() - start) / DEFINITION_RUNS
+
+    print(f"Top-level definitions per rerun ({DEFINITION_RUNS} runs)")
+    print(f"  monolithic script:     {monolith * 1e3:8.3f} ms")
+    print(f"  shim + cached modules: {imported * 1e3:8.3f} ms")
+
+
+def time_reruns(script):
+    """Mean warm rerun time of the welcome page"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(script, default_timeout=60)
+    app.run()
+    app.button(key="btn_accept_disclaimer").click().run()
+    app.run()
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        app.run()
+    return (time.perf_counter() - start) / RERUNS
+
+
+def main():
+    time_definitions()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        with open(os.path.join(scratch, "monolith.py"), "w", encoding="utf-8") as f:
+            f.write(MONOLITH.format(root=ROOT, scratch=scratch))
+        with open(os.path.join(scratch, "_monolith_code.py"), "w", encoding="utf-8") as f:
+            f.write(MONOLITH_CODE.format(root=ROOT, views=VIEWS))
+        # Both apps write their progress file to the working directory
+        cwd = os.getcwd()
+        os.chdir(scratch)
+        try:
+            monolith = time_reruns(os.path.join(scratch, "monolith.py"))
+            shim = time_reruns(os.path.join(ROOT, "app.py"))
+        finally:
+            os.chdir(cwd)
+
+    print(f"Full rerun of the welcome page ({RERUNS} reruns, AppTest)")
+    print(f"  monolithic script:     {monolith * 1e3:8.2f} ms")
+    print(f"  shim + cached modules: {shim * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
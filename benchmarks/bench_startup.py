@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start import time, per-rerun literal cost and first render
+
+1. Runs `python -X importtime` on the modules app.py imports and reports the
+   cumulative import time of each, failing when the app's own modules go over
+   IMPORT_BUDGET_MS. Streamlit's own import is reported but not budgeted.
+2. Times building the static copy tables the way app.py used to on every
+   rerun (executing their code) against looking them up in the imported module.
+3. With streamlit installed, times the first render of app.py in a fresh
+   process with AppTest, then a warm rerun.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Budget for importing the app's own modules in a fresh interpreter
+IMPORT_BUDGET_MS = 150
+
+APP_MODULES = [
+    "recovery_buddy.assets", "recovery_buddy.checkin_store", "recovery_buddy.checkins",
+    "recovery_buddy.citations", "recovery_buddy.content_store", "recovery_buddy.copy_text",
+    "recovery_buddy.engine", "recovery_buddy.export", "recovery_buddy.fileio", "recovery_buddy.journal",
+    "recovery_buddy.milestones", "recovery_buddy.photo_compare", "recovery_buddy.photos",
+    "recovery_buddy.profiler", "recovery_buddy.reminders", "recovery_buddy.restore", "recovery_buddy.session",
+    "recovery_buddy.symptom_rules", "recovery_buddy.telemetry", "recovery_buddy.trends",
+    "recovery_buddy.triage",
+]
+RERUNS = 2_000
+
+FIRST_RENDER = """
+import sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(sys.argv[1], default_timeout=60)
+app.run()
+first = time.perf_counter() - start
+start = time.perf_counter()
+app.run()
+print(first, time.perf_counter() - start)
+"""
+
+
+def importable(module):
+    result = subprocess.run([sys.executable, "-c", f"import {module}"], cwd=ROOT, capture_output=True)
+    return result.returncode == 0
+
+
+def import_times(modules):
+    """({module: cumulative microseconds}, total microseconds) from one `python -X importtime` run"""
+    code = "; ".join(f"import {m}" for m in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    times, total = {}, 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        times[name.strip()] = int(cumulative)
+        # Nested imports are indented under the module that triggered them
+        if name[1:2] != " ":
+            total += int(cumulative)
+    return times, total
+
+
+def report_imports():
+    # Modules whose optional dependency (e.g. Pillow) is missing are skipped
+    modules = [m for m in APP_MODULES if importable(m)]
+    skipped = sorted(set(APP_MODULES) - set(modules))
+    times, total = import_times(modules)
+    own = {m: times[m] for m in modules if m in times}
+    total_ms = total / 1000
+
+    print("Import time (cumulative, fresh interpreter)")
+    for module, us in sorted(own.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {module:<34} {us / 1000:8.2f} ms")
+    if skipped:
+        print(f"  skipped (missing dependencies): {', '.join(skipped)}")
+    status = "ok" if total_ms <= IMPORT_BUDGET_MS else "OVER BUDGET"
+    print(f"  app modules total:                 {total_ms:8.2f} ms (budget {IMPORT_BUDGET_MS} ms, {status})")
+
+    if importable("streamlit"):
+        print(f"  streamlit (not budgeted):          {import_times(['streamlit'])[1] / 1000:8.2f} ms")
+    return total_ms <= IMPORT_BUDGET_MS
+
+
+def report_literals():
+    import recovery_buddy.copy_text as copy_text
+
+    with open(copy_text.__file__, 'r', encoding='utf-8') as f:
+        code = compile(f.read(), copy_text.__file__, "exec")
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        exec(code, {})
+    rebuilt = (time.perf_counter() - start) / RERUNS
+
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        from recovery_buddy.copy_text import DAILY_TIPS, EMERGENCY_INFO, SURGEON_TEMPLATES, SURGERY_RESOURCES  # noqa: F401
+    imported = (time.perf_counter() - start) / RERUNS
+
+    print(f"Static copy tables per rerun ({RERUNS:,} reruns)")
+    print(f"  built in the script:   {rebuilt * 1e6:8.2f} us")
+    print(f"  imported module:       {imported * 1e6:8.2f} us")
+
+
+def report_first_render():
+    if not importable("streamlit"):
+        print("First render: skipped (streamlit is not installed)")
+        return
+    result = subprocess.run([sys.executable, "-c", FIRST_RENDER, os.path.join(ROOT, "app.py")],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    first, warm = (float(value) for value in result.stdout.split()[-2:])
+    print("First render (AppTest, fresh process)")
+    print(f"  cold first run:        {first * 1e3:8.1f} ms")
+    print(f"  warm rerun:            {warm * 1e3:8.1f} ms")
+
+
+def main():
+    within_budget = report_imports()
+    report_literals()
+    report_first_render()
+    if not within_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark: symptom triage with bitsets vs. scanning (severity, symptom) tuples
+
+Run from the repository root:
+    python benchmarks/bench_triage.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recovery_buddy.triage import SYMPTOM_CHECKER, TIERS, SymptomTriage
+
+CHECKINS = 100_000
+
+
+def scan_tuples(selected):
+    """The original approach: build a list of tuples and scan it per tier"""
+    severities = [s[0] for s in selected]
+    if 'urgent' in severities:
+        return 'urgent'
+    if 'call_soon' in severities:
+        return 'call_soon'
+    if severities:
+        return 'normal'
+    return None
+
+
+def main():
+    triage = SymptomTriage(SYMPTOM_CHECKER)
+    rng = random.Random(42)
+    all_symptoms = [(tier, s) for tier in TIERS for s in SYMPTOM_CHECKER[tier]["symptoms"]]
+    selections = [rng.sample(all_symptoms, rng.randint(0, 4)) for _ in range(CHECKINS)]
+    masks = [triage.encode(s for _, s in selected) for selected in selections]
+
+    start = time.perf_counter()
+    expected = [scan_tuples(selected) for selected in selections]
+    tuple_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [triage.classify(mask) for mask in masks]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = triage.classify_many(masks)
+    batch_time = time.perf_counter() - start
+
+    assert expected == single == batch
+    print(f"{CHECKINS:,} check-ins")
+    print(f"  tuple scan:        {tuple_time * 1000:8.1f} ms")
+    print(f"  bitset classify:   {single_time * 1000:8.1f} ms")
+    print(f"  bitset batch:      {batch_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
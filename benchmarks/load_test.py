@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Load test: simulated users walking the check-in flow headlessly
+
+Each simulated user drives app.py with Streamlit's AppTest through the whole
+STEPS flow (welcome -> get_info -> physical_checkin -> symptom_results ->
+emotional_checkin -> daily_tip -> complete), filling in the forms and
+clicking the same buttons a person would. Users run in parallel across a
+process pool; each worker process gets its own scratch directory so progress,
+photo and journal files never collide, and users within a worker run one
+after another, each starting from an empty progress file. Cached resources
+(content, journal and photo stores) are shared by the users of a worker, as
+they are by the sessions of one server.
+
+For every action the harness records the page it landed on, the script time
+(including any st.rerun() the action triggered), how many script runs the
+action took and the size of the rendered element tree. The report gives
+p50/p95/p99 script time, mean runs per action and mean bytes per page.
+
+Requires streamlit (AppTest ships with streamlit >= 1.28).
+
+Run from the repository root:
+    python benchmarks/load_test.py [users] [workers] [check-ins per user]
+"""
+
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP = os.path.join(ROOT, "app.py")
+USERS = 20
+WORKERS = 4
+CHECK_INS = 2
+TIMEOUT = 60
+
+PROCEDURES = ["rhinoplasty", "breast_augmentation", "tummy_tuck", "liposuction", "facelift"]
+MOODS = ["Great", "Good", "Okay", "Down", "Struggling"]
+PAGE_ORDER = ["welcome", "get_info", "physical_checkin", "symptom_results",
+              "emotional_checkin", "daily_tip", "complete"]
+
+# st.rerun() calls made by the current action, counted in the worker process
+_reruns = 0
+
+
+def _count_reruns():
+    """Wrap st.rerun so each action can report how many runs it caused"""
+    import streamlit as st
+
+    original = st.rerun
+
+    def rerun(*args, **kwargs):
+        global _reruns
+        _reruns += 1
+        return original(*args, **kwargs)
+
+    st.rerun = rerun
+
+
+def _init_worker():
+    os.chdir(tempfile.mkdtemp(prefix="recovery_load_"))
+    _count_reruns()
+
+
+def tree_bytes(node):
+    """Serialized size of every element and block proto under a node"""
+    proto = getattr(node, "proto", None)
+    total = proto.ByteSize() if proto is not None else 0
+    children = getattr(node, "children", None) or {}
+    for child in children.values():
+        total += tree_bytes(child)
+    return total
+
+
+class SimulatedUser:
+    """One person clicking through the app, timing every action"""
+
+    def __init__(self, user_id, rng):
+        from streamlit.testing.v1 import AppTest
+
+        self.user_id = user_id
+        self.rng = rng
+        self.app = AppTest.from_file(APP, default_timeout=TIMEOUT)
+        self.samples = []  # (page, seconds, runs, bytes)
+
+    def _page(self):
+        state = self.app.session_state["recovery"] if "recovery" in self.app.session_state else None
+        return state.step if state is not None else "disclaimer"
+
+    def act(self, action):
+        """Run one action (a widget interaction, or None for the first load) and record it"""
+        global _reruns
+        _reruns = 0
+        start = time.perf_counter()
+        if action is None:
+            self.app.run()
+        else:
+            action(self.app).run()
+        elapsed = time.perf_counter() - start
+        if self.app.exception:
+            raise RuntimeError(f"user {self.user_id} on {self._page()}: {self.app.exception[0].message}")
+        self.samples.append((self._page(), elapsed, 1 + _reruns, tree_bytes(self.app._tree)))
+
+    def click(self, key):
+        self.act(lambda app: app.button(key=key).click())
+
+    def check_in(self, name, procedure):
+        rng = self.rng
+        self.click("nav_checkin")
+        self.act(lambda app: app.text_input(key="input_name").input(name))
+        self.click(f"proc_{procedure}")
+        self.act(lambda app: app.number_input(key="input_day").set_value(rng.randint(1, 60)))
+        self.click("btn_continue_info")
+        self.act(lambda app: app.slider(key="slider_pain_level").set_value(rng.randint(1, 10)))
+        self.act(lambda app: app.selectbox(key="select_swelling").select_index(rng.randint(0, 3)))
+        self.click("btn_see_assessment")
+        self.click("btn_emotional")
+        self.click(f"mood_{rng.choice(MOODS)}")
+        self.click("btn_daily_tips")
+        self.click("btn_complete")
+        self.click("nav_home")
+
+    def run(self, check_ins):
+        name = f"User{self.user_id}"
+        procedure = self.rng.choice(PROCEDURES)
+        self.act(None)
+        self.click("btn_accept_disclaimer")
+        for _ in range(check_ins):
+            self.check_in(name, procedure)
+        return self.samples
+
+
+def simulate(user_id, check_ins):
+    """Worker entry point: one user from an empty progress file"""
+    if os.path.exists("recovery_progress.json"):
+        os.remove("recovery_progress.json")
+    return SimulatedUser(user_id, random.Random(user_id)).run(check_ins)
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def report(samples, wall):
+    by_page = defaultdict(list)
+    for page, seconds, runs, size in samples:
+        by_page[page].append((seconds, runs, size))
+    pages = [p for p in PAGE_ORDER if p in by_page] + sorted(set(by_page) - set(PAGE_ORDER))
+
+    print(f"{'page':<18} {'actions':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'runs':>5} {'KB':>7}")
+    for page in pages:
+        rows = by_page[page]
+        times = sorted(seconds for seconds, _, _ in rows)
+        runs = sum(r for _, r, _ in rows) / len(rows)
+        size = sum(s for _, _, s in rows) / len(rows) / 1024
+        print(f"{page:<18} {len(rows):>7} {percentile(times, 50) * 1e3:>8.1f} "
+              f"{percentile(times, 95) * 1e3:>8.1f} {percentile(times, 99) * 1e3:>8.1f} "
+              f"{runs:>5.2f} {size:>7.1f}")
+    total = sorted(seconds for _, seconds, _, _ in samples)
+    print(f"{'all':<18} {len(total):>7} {percentile(total, 50) * 1e3:>8.1f} "
+          f"{percentile(total, 95) * 1e3:>8.1f} {percentile(total, 99) * 1e3:>8.1f}")
+    print(f"{len(samples) / wall:.1f} actions/s over {wall:.1f}s wall time")
+
+
+def main():
+    args = [int(a) for a in sys.argv[1:4]]
+    users, workers, check_ins = args + [USERS, WORKERS, CHECK_INS][len(args):]
+    print(f"{users} users x {check_ins} check-ins on {workers} workers")
+
+    start = time.perf_counter()
+    samples = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for user_samples in pool.map(simulate, range(users), [check_ins] * users):
+            samples.extend(user_samples)
+    report(samples, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
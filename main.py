@@ -3,13 +3,29 @@
 Recovery Buddy - A supportive post-surgery recovery chatbot
 """
 
+import argparse
+import csv
 import json
 import os
-from datetime import datetime
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+from recovery_buddy.engine import (HEAVY_BLEEDING, HIGH_FEVER, MOOD_LOW, MOOD_OKAY, PAIN_HIGH, PAIN_HIGH_EARLY,
+                                   PAIN_LOW, PAIN_MANAGEABLE, CheckInEngine, assess_progress, build_symptoms)
+from recovery_buddy.trends import DailySeries
 
 # File to store progress data
 PROGRESS_FILE = "recovery_progress.json"
 
+# Batch mode: records per task handed to a worker process
+BATCH_CHUNK = 2000
+
+# Output columns for batch results written as CSV
+BATCH_COLUMNS = ['line', 'status', 'error', 'name', 'procedure', 'day', 'pain_level', 'date',
+                 'needs_attention', 'urgent', 'above_typical', 'below_typical', 'pain_change',
+                 'pain_average', 'trend', 'worsening', 'mood', 'tip', 'feedback']
+
 # Procedure-specific recovery information
 PROCEDURES = {
     "rhinoplasty": {
@@ -601,6 +617,24 @@ DEFAULT_TIPS = {
     14: "Two weeks in - you're a recovery warrior! Results are still evolving but you're on the right track.",
 }
 
+# Check-in logic shared with the web app and batch mode
+ENGINE = CheckInEngine(PROCEDURES, DEFAULT_TIPS)
+
+# How the chatbot words the engine's concerns
+CONCERN_MESSAGES = {
+    HEAVY_BLEEDING: "Heavy bleeding is concerning",
+    HIGH_FEVER: "Fever of {value}F needs medical attention",
+}
+
+PAIN_MESSAGES = {
+    PAIN_MANAGEABLE: "Your pain level sounds manageable for this stage - that's good!",
+    PAIN_HIGH_EARLY: "Your pain level is on the higher end but can be normal for the first few days. "
+                     "Make sure you're staying on top of your pain medication schedule.",
+    PAIN_HIGH: "Your pain seems higher than typical for this stage. If it's not improving "
+               "or is getting worse, please contact your surgeon's office.",
+    PAIN_LOW: "Low pain level - you're doing great!",
+}
+
 
 def load_progress():
     """Load previous progress data if it exists."""
@@ -686,53 +720,67 @@ def select_procedure():
 
 
 def check_symptoms(procedure_key, day):
-    """Ask about and evaluate symptoms."""
+    """Ask about symptoms."""
     print("\n" + "=" * 50)
     print("SYMPTOM CHECK")
     print("=" * 50)
 
-    symptoms = {}
-    concerns = []
-
     # Swelling
     print_slow("Let's check on your symptoms...")
     swelling = get_input("How would you rate your swelling? (none / mild / moderate / severe)")
-    symptoms['swelling'] = swelling.lower()
 
     # Bruising
     bruising = get_input("How about bruising? (none / mild / moderate / severe)")
-    symptoms['bruising'] = bruising.lower()
 
     # Bleeding
     bleeding = get_input("Any bleeding? (none / spotting / light / heavy)")
-    symptoms['bleeding'] = bleeding.lower()
-    if bleeding.lower() == 'heavy':
-        concerns.append("Heavy bleeding is concerning")
 
     # Fever
     has_fever = get_yes_no("Do you have a fever or feel feverish?")
-    symptoms['fever'] = has_fever
+    temp = None
     if has_fever:
         temp = get_input("What's your temperature if you've checked? (or type 'unsure')")
-        symptoms['temperature'] = temp
-        if temp != 'unsure':
-            try:
-                temp_val = float(temp.replace('F', '').replace('f', '').strip())
-                if temp_val >= 101:
-                    concerns.append(f"Fever of {temp_val}F needs medical attention")
-            except ValueError:
-                pass
 
     # Numbness
     numbness = get_yes_no("Are you experiencing numbness in the surgical area?")
-    symptoms['numbness'] = numbness
 
     # Additional concerns
     unusual = get_input("Anything else unusual or concerning you? (describe or type 'no')")
-    if unusual.lower() not in ['no', 'n', 'none', 'nope']:
-        symptoms['other'] = unusual
+    if unusual.lower() in ['no', 'n', 'none', 'nope']:
+        unusual = None
+
+    return build_symptoms(swelling, bruising, bleeding, has_fever, temp, numbness, unusual)
+
+
+def symptom_messages(assessment):
+    """The chatbot's feedback on a SymptomAssessment, after the typical symptoms"""
+    day = assessment.day
+    if assessment.expected_day is None:
+        return [
+            "Since I don't have specific info about your procedure, here's general guidance:",
+            f"- Day {day} typically involves some swelling and discomfort",
+            "- Your symptoms sound within the range of normal post-surgical recovery",
+            "- Always trust your instincts - if something feels wrong, call your surgeon!",
+        ]
+
+    # Compare what they reported with what's typical
+    messages = []
+    for symptom in assessment.comparison:
+        if symptom in assessment.above:
+            messages.append(f"Your {symptom} is higher than typical for day {day}. "
+                            "Keep an eye on it and let your surgeon know if it doesn't settle.")
+        elif symptom in assessment.below:
+            messages.append(f"Your {symptom} is lower than typical for day {day} - lovely progress!")
+
+    # Pain assessment
+    if assessment.pain in PAIN_MESSAGES:
+        messages.append(PAIN_MESSAGES[assessment.pain])
 
-    return symptoms, concerns
+    # Swelling assessment
+    if assessment.peak_swelling:
+        messages.append(f"Today is typically PEAK SWELLING day for {PROCEDURES[assessment.procedure]['name']}. "
+                        "What you're seeing is NOT your final result!")
+    return messages
 
 
 def give_symptom_feedback(procedure_key, day, symptoms, pain_level):
@@ -741,78 +789,43 @@ def give_symptom_feedback(procedure_key, day, symptoms, pain_level):
     print("HOW YOU'RE DOING")
     print("=" * 50)
 
-    if procedure_key == "other":
-        print_slow("Since I don't have specific info about your procedure, here's general guidance:")
-        print_slow(f"- Day {day} typically involves some swelling and discomfort")
-        print_slow("- Your symptoms sound within the range of normal post-surgical recovery")
-        print_slow("- Always trust your instincts - if something feels wrong, call your surgeon!")
-        return
+    assessment = ENGINE.assess_symptoms(procedure_key, day, symptoms, pain_level)
 
-    procedure = PROCEDURES[procedure_key]
+    if assessment.expected:
+        print_slow(f"For {PROCEDURES[procedure_key]['name']} on day {day}, here's what's typical:")
+        for symptom, expected_level in assessment.expected.items():
+            print(f"  - {symptom.title()}: {expected_level}")
 
-    # Find the closest day we have data for
-    available_days = sorted(procedure['normal_symptoms'].keys())
-    closest_day = min(available_days, key=lambda x: abs(x - day))
-    expected = procedure['normal_symptoms'][closest_day]
+    for message in symptom_messages(assessment):
+        print_slow(message)
 
-    print_slow(f"For {procedure['name']} on day {day}, here's what's typical:")
 
-    for symptom, expected_level in expected.items():
-        print(f"  - {symptom.title()}: {expected_level}")
+def urgent_warnings(warnings):
+    """Everything in a WarningCheck that should prompt a call to the surgeon"""
+    concerns = [CONCERN_MESSAGES[c.kind].format(value=c.value) for c in warnings.concerns]
+    return concerns + warnings.urgent
 
-    # Pain assessment
-    if day <= 3 and pain_level <= 6:
-        print_slow("Your pain level sounds manageable for this stage - that's good!")
-    elif day <= 3 and pain_level >= 7:
-        print_slow("Your pain level is on the higher end but can be normal for the first few days. "
-                   "Make sure you're staying on top of your pain medication schedule.")
-    elif day > 3 and pain_level >= 7:
-        print_slow("Your pain seems higher than typical for this stage. If it's not improving "
-                   "or is getting worse, please contact your surgeon's office.")
-    elif pain_level <= 3:
-        print_slow("Low pain level - you're doing great!")
 
-    # Swelling assessment
-    if procedure.get('peak_swelling_day') and day == procedure['peak_swelling_day']:
-        print_slow(f"Today is typically PEAK SWELLING day for {procedure['name']}. "
-                   "What you're seeing is NOT your final result!")
-
-
-def check_warning_signs(procedure_key, symptoms, concerns):
+def check_warning_signs(procedure_key, symptoms):
     """Check for warning signs that need medical attention."""
     print("\n" + "=" * 50)
     print("IMPORTANT HEALTH CHECK")
     print("=" * 50)
 
-    urgent_warnings = []
-
-    # Add any concerns already identified
-    urgent_warnings.extend(concerns)
-
-    # Check for universal warning signs
-    if symptoms.get('bleeding', '').lower() == 'heavy':
-        urgent_warnings.append("Heavy bleeding")
+    warnings = ENGINE.check_warnings(procedure_key, symptoms)
+    urgent = urgent_warnings(warnings)
 
-    if symptoms.get('fever') and symptoms.get('temperature', 'unsure') != 'unsure':
-        try:
-            temp = float(symptoms['temperature'].replace('F', '').replace('f', '').strip())
-            if temp >= 101:
-                urgent_warnings.append(f"Fever of {temp}F")
-        except ValueError:
-            pass
-
-    # Check procedure-specific warnings
-    if procedure_key != "other" and procedure_key in PROCEDURES:
-        procedure = PROCEDURES[procedure_key]
+    # Procedure-specific warnings
+    if warnings.watch_for:
         print_slow("Please watch out for these warning signs specific to your procedure:")
-        for sign in procedure.get('warning_signs', []):
+        for sign in warnings.watch_for:
             print(f"  - {sign}")
 
-    if urgent_warnings:
+    if urgent:
         print("\n" + "!" * 50)
         print("PLEASE CONTACT YOUR SURGEON'S OFFICE ABOUT:")
         print("!" * 50)
-        for warning in urgent_warnings:
+        for warning in urgent:
             print(f"  >>> {warning}")
         print("\nIt's always better to call and have it be nothing than to wait and have it be something!")
         print("Your surgeon's office expects these calls - that's what they're there for.")
@@ -832,11 +845,11 @@ def emotional_checkin(name, procedure_key, day):
     feeling = get_input("How are you feeling mentally/emotionally today? "
                         "(great / good / okay / down / struggling)")
 
-    feeling_lower = feeling.lower()
+    response = ENGINE.assess_mood(feeling, procedure_key, day)
 
     print_slow("Thank you for sharing that with me.")
 
-    if feeling_lower in ['down', 'struggling', 'sad', 'depressed', 'anxious', 'worried', 'bad', 'terrible']:
+    if response.category == MOOD_LOW:
         print_slow("I hear you, and I want you to know that what you're feeling is SO NORMAL.")
         print_slow("Post-surgical blues are incredibly common and there are real reasons for it:")
         print_slow("  - Anesthesia affects your brain chemistry for days")
@@ -845,19 +858,18 @@ def emotional_checkin(name, procedure_key, day):
         print_slow("  - Limited mobility and isolation are hard!")
         print_slow("  - Swelling can make you look/feel unlike yourself")
 
-        if procedure_key != "other" and procedure_key in PROCEDURES:
-            procedure = PROCEDURES[procedure_key]
-            print_slow(f"\nRemember: Final {procedure['name']} results take {procedure['final_results']}.")
+        if response.final_results:
+            print_slow(f"\nRemember: Final {PROCEDURES[procedure_key]['name']} results take {response.final_results}.")
             print_slow("What you see right now is NOT what you'll look like when you're healed!")
 
         print_slow("\nBe gentle with yourself. You just had SURGERY. It's okay to rest, cry, or feel frustrated.")
         print_slow("These feelings will pass as you heal.")
 
-    elif feeling_lower in ['okay', 'fine', 'alright', 'meh']:
+    elif response.category == MOOD_OKAY:
         print_slow("That's totally valid! Recovery is a marathon, not a sprint.")
         print_slow("'Okay' is perfectly acceptable when you're healing from surgery.")
 
-        if day <= 5:
+        if response.first_week:
             print_slow("The first week is the hardest emotionally for most people. You're almost through it!")
 
     else:  # good, great, etc.
@@ -871,7 +883,7 @@ def emotional_checkin(name, procedure_key, day):
     print_slow("  - It's okay to limit social media and 'transformation' photos right now")
     print_slow("  - Reach out to friends, family, or your surgeon if you're struggling")
 
-    return feeling_lower
+    return response.feeling
 
 
 def medication_reminder(name):
@@ -919,29 +931,7 @@ def give_daily_tip(procedure_key, day):
     print("YOUR TIP FOR TODAY")
     print("=" * 50)
 
-    tip = None
-
-    if procedure_key != "other" and procedure_key in PROCEDURES:
-        procedure = PROCEDURES[procedure_key]
-        tips = procedure.get('tips', {})
-
-        # Find exact day or closest day
-        if day in tips:
-            tip = tips[day]
-        else:
-            available_days = sorted(tips.keys())
-            closest = min(available_days, key=lambda x: abs(x - day))
-            if abs(closest - day) <= 2:  # Only use if within 2 days
-                tip = tips[closest]
-
-    if not tip:
-        # Use default tips
-        if day in DEFAULT_TIPS:
-            tip = DEFAULT_TIPS[day]
-        elif day < 7:
-            tip = DEFAULT_TIPS[min(DEFAULT_TIPS.keys(), key=lambda x: abs(x - day) if x < 7 else float('inf'))]
-        else:
-            tip = "Keep up with your recovery routine! Consistency is key at this stage."
+    tip = ENGINE.daily_tip(procedure_key, day).text
 
     print_slow(f"Day {day} Tip: {tip}")
 
@@ -953,23 +943,46 @@ def give_daily_tip(procedure_key, day):
     print_slow("  - Short, gentle walks help prevent blood clots")
 
 
+def progress_messages(progress, day, pain_level):
+    """The chatbot's comparison of a ProgressUpdate with earlier check-ins"""
+    messages = []
+
+    # Compare to yesterday
+    if progress.previous:
+        messages.append("\nComparing to your last check-in:")
+
+        # Pain comparison
+        prev_pain = pain_level - progress.pain_change
+        if progress.pain_change < 0:
+            messages.append(f"  Your pain went from {prev_pain} to {pain_level} - that's progress!")
+        elif progress.pain_change > 0:
+            messages.append(f"  Your pain increased from {prev_pain} to {pain_level}. "
+                            "Keep an eye on this and call your doctor if it continues to rise.")
+        else:
+            messages.append(f"  Your pain is stable at {pain_level}.")
+
+        # Celebrate progress
+        prev_day = progress.previous.get('day', 0)
+        if day > prev_day:
+            messages.append(f"\n  You've made it from day {prev_day} to day {day}! Every day is progress.")
+    else:
+        messages.append("\nThis is your first check-in! I'll track your progress from here.")
+
+    # Look at the whole history, not just the last check-in
+    if progress.pain_average is not None:
+        messages.append(f"  Your average pain over your last {min(progress.readings, 7)} check-ins is "
+                        f"{progress.pain_average:.1f}/10.")
+    if progress.trend:
+        messages.append(f"  {progress.trend}")
+    return messages
+
+
 def track_progress(name, procedure_key, day, pain_level, symptoms, emotional_state, progress_data):
     """Track and compare progress."""
     print("\n" + "=" * 50)
     print("PROGRESS TRACKING")
     print("=" * 50)
 
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    # Create today's entry
-    today_entry = {
-        'day': day,
-        'pain_level': pain_level,
-        'swelling': symptoms.get('swelling', 'unknown'),
-        'emotional_state': emotional_state,
-        'date': today
-    }
-
     # Initialize user data if needed
     if name not in progress_data:
         progress_data[name] = {
@@ -977,9 +990,8 @@ def track_progress(name, procedure_key, day, pain_level, symptoms, emotional_sta
             'entries': []
         }
 
-    # Check for previous entry
     entries = progress_data[name].get('entries', [])
-    previous_entry = entries[-1] if entries else None
+    progress = assess_progress(entries, day, pain_level, symptoms, emotional_state)
 
     print_slow(f"Today's Summary for {name}:")
     print(f"  - Post-op Day: {day}")
@@ -987,29 +999,11 @@ def track_progress(name, procedure_key, day, pain_level, symptoms, emotional_sta
     print(f"  - Swelling: {symptoms.get('swelling', 'not reported')}")
     print(f"  - Emotional State: {emotional_state}")
 
-    # Compare to yesterday
-    if previous_entry:
-        print_slow("\nComparing to your last check-in:")
-
-        # Pain comparison
-        prev_pain = previous_entry.get('pain_level', 0)
-        if pain_level < prev_pain:
-            print_slow(f"  Your pain went from {prev_pain} to {pain_level} - that's progress!")
-        elif pain_level > prev_pain:
-            print_slow(f"  Your pain increased from {prev_pain} to {pain_level}. "
-                       "Keep an eye on this and call your doctor if it continues to rise.")
-        else:
-            print_slow(f"  Your pain is stable at {pain_level}.")
-
-        # Celebrate progress
-        prev_day = previous_entry.get('day', 0)
-        if day > prev_day:
-            print_slow(f"\n  You've made it from day {prev_day} to day {day}! Every day is progress.")
-    else:
-        print_slow("\nThis is your first check-in! I'll track your progress from here.")
+    for message in progress_messages(progress, day, pain_level):
+        print_slow(message)
 
     # Add today's entry
-    entries.append(today_entry)
+    entries.append(progress.entry)
     progress_data[name]['entries'] = entries
 
     # Save progress
@@ -1079,6 +1073,148 @@ def answer_questions():
         print_slow("No problem! I'm here whenever you need support.")
 
 
+# --- Batch mode ---
+
+def assess_checkins(task):
+    """Worker entry point: assess one chunk of check-ins.
+
+    `task` is (today, groups) where each group is (name, earlier entries,
+    [(line, record), ...]) with the records in the order they were given.
+    Returns ([(line, result), ...], {name: (procedure_key, new entries)}).
+    """
+    today, groups = task
+    results, new_entries = [], {}
+    for person, history, records in groups:
+        entries = list(history)
+        # Kept up to date here rather than rebuilt from the entries for every record
+        series = DailySeries.from_history(entries, 'pain_level')
+        for line, raw in records:
+            try:
+                if isinstance(raw, ValueError):
+                    raise raw  # a line read_checkins couldn't parse
+                if not isinstance(raw, dict):
+                    raise ValueError("record is not a JSON object")
+                check_in = ENGINE.parse_checkin(raw, today)
+            except ValueError as e:
+                results.append((line, {'line': line, 'status': 'error', 'error': str(e), 'name': person}))
+                continue
+            series.add(date.fromisoformat(check_in.date).toordinal(), check_in.pain_level)
+            assessment = ENGINE.assess(check_in, entries, series)
+            progress = assessment.progress
+            entries.append(progress.entry)
+            new_entries.setdefault(check_in.name, (check_in.procedure, []))[1].append(progress.entry)
+            urgent = urgent_warnings(assessment.warnings)
+            results.append((line, {
+                'line': line, 'status': 'ok', 'name': check_in.name, 'procedure': check_in.procedure,
+                'day': check_in.day, 'pain_level': check_in.pain_level, 'date': check_in.date,
+                'needs_attention': bool(urgent), 'urgent': urgent,
+                'above_typical': assessment.symptoms.above, 'below_typical': assessment.symptoms.below,
+                'pain_change': progress.pain_change,
+                'pain_average': round(progress.pain_average, 2) if progress.pain_average is not None else None,
+                'trend': progress.trend, 'worsening': progress.worsening,
+                'mood': assessment.mood.category if check_in.emotional_state else None,
+                'tip': assessment.tip.text,
+                'feedback': symptom_messages(assessment.symptoms),
+            }))
+    return results, new_entries
+
+
+def _json_record(line):
+    """One JSON line as a record, or a ValueError standing in for a line that isn't valid JSON"""
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return ValueError(f"malformed JSON: {e}")
+
+
+def read_checkins(path):
+    """Check-in records from a .csv file (with a header row) or JSON lines.
+
+    A JSON line that can't be parsed is kept in its place as a ValueError, so
+    it gets an error row and the rest of the file is still assessed.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            return list(csv.DictReader(f))
+        return [_json_record(line) for line in f if line.strip()]
+
+
+def _chunk_tasks(records, progress_data, today):
+    """Group records by person (keeping their order) and pack the groups into chunks.
+
+    A person's check-ins always go to the same task, so each one is compared
+    with the check-ins before it.
+    """
+    by_name = {}
+    for line, raw in enumerate(records, 1):
+        name = str(raw.get('name') or '').strip() if isinstance(raw, dict) else ''
+        by_name.setdefault(name, []).append((line, raw))
+    tasks, groups, size = [], [], 0
+    for name, group in by_name.items():
+        # Only per-name sections hold entries; other top-level keys ('name', 'stats', ...) are no history
+        person = progress_data.get(name) if name else None
+        history = person['entries'] if isinstance(person, dict) and isinstance(person.get('entries'), list) else []
+        groups.append((name, history, group))
+        size += len(group)
+        if size >= BATCH_CHUNK:
+            tasks.append((today, groups))
+            groups, size = [], 0
+    if groups:
+        tasks.append((today, groups))
+    return tasks
+
+
+def write_results(path, results):
+    """Write results as CSV (for a .csv path) or JSON lines; '-' is stdout"""
+    f = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='')
+    try:
+        if path.lower().endswith('.csv'):
+            writer = csv.DictWriter(f, fieldnames=BATCH_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for result in results:
+                writer.writerow({k: '; '.join(v) if isinstance(v, list) else v for k, v in result.items()})
+        else:
+            for result in results:
+                f.write(json.dumps(result) + '\n')
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+def run_batch(input_path, output_path='-', workers=None, save=False):
+    """Assess every check-in in a file and write one result per record, in input order.
+
+    Chunks are spread over a process pool (skipped when there's only one
+    chunk or one worker). With save=True the new entries are added to the
+    progress file, as track_progress does for interactive check-ins.
+    Returns (records, errors).
+    """
+    records = read_checkins(input_path)
+    progress_data = load_progress()
+    today = datetime.now().strftime("%Y-%m-%d")
+    tasks = _chunk_tasks(records, progress_data, today)
+
+    if len(tasks) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(assess_checkins, tasks))
+    else:
+        outputs = [assess_checkins(task) for task in tasks]
+
+    results = [None] * len(records)
+    for chunk_results, new_entries in outputs:
+        for line, result in chunk_results:
+            results[line - 1] = result
+        if save:
+            for name, (procedure_key, entries) in new_entries.items():
+                person = progress_data.setdefault(name, {'procedure': procedure_key, 'entries': []})
+                person.setdefault('entries', []).extend(entries)
+
+    write_results(output_path, results)
+    if save:
+        save_progress(progress_data)
+    return len(results), sum(1 for r in results if r['status'] == 'error')
+
+
 def main():
     """Main chatbot flow."""
     # Load existing progress data
@@ -1128,13 +1264,13 @@ def main():
                                     "(1 = no pain, 10 = worst pain imaginable)", 1, 10)
 
     # Check symptoms
-    symptoms, concerns = check_symptoms(procedure_key, day)
+    symptoms = check_symptoms(procedure_key, day)
 
     # Give feedback
     give_symptom_feedback(procedure_key, day, symptoms, pain_level)
 
     # Check warning signs
-    check_warning_signs(procedure_key, symptoms, concerns)
+    check_warning_signs(procedure_key, symptoms)
 
     # Emotional check-in
     emotional_state = emotional_checkin(name, procedure_key, day)
@@ -1166,5 +1302,25 @@ def main():
     print("\n")
 
 
+def cli(argv=None):
+    """Interactive chat by default, or batch mode with --batch"""
+    parser = argparse.ArgumentParser(description="Recovery Buddy - a supportive post-surgery recovery chatbot")
+    parser.add_argument('--batch', metavar='CHECKINS',
+                        help="assess check-ins from a .jsonl or .csv file instead of chatting")
+    parser.add_argument('--output', '-o', default='-',
+                        help="where to write batch results (.jsonl or .csv; default: stdout)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes for batch mode (default: one per CPU)")
+    parser.add_argument('--save-progress', action='store_true',
+                        help=f"add batch check-ins to {PROGRESS_FILE}")
+    args = parser.parse_args(argv)
+
+    if not args.batch:
+        main()
+        return
+    count, errors = run_batch(args.batch, args.output, args.workers, args.save_progress)
+    print(f"Assessed {count} check-ins ({errors} rejected)", file=sys.stderr)
+
+
 if __name__ == "__main__":
-    main()
+    cli()
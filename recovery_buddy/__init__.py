@@ -0,0 +1,3 @@
+"""
+Recovery Buddy - shared engines used by the Streamlit app and the CLI
+"""
@@ -0,0 +1,442 @@
+"""
+Asynchronous JSON API for check-ins.
+
+Lets clinic dashboards and mobile wrappers submit check-ins and read
+assessments, history and exports without rendering the Streamlit app. One
+asyncio event loop (asyncio.start_server) speaks the small subset of
+HTTP/1.1 the clients need, with keep-alive. Storage work runs on a thread
+pool the size of the CheckInStore's connection pool, so the loop never
+blocks on SQLite. Check-ins are assessed by the same CheckInEngine as the
+app, built from the same content files, and every request is timed into a
+Profiler whose histograms are served on /metrics. Medication, check-in and
+milestone reminders are stored with the check-ins and delivered by a
+ReminderScheduler running alongside the loop.
+
+Routes:
+    POST /checkins                    submit a check-in; returns its assessment
+    GET  /checkins/<id>               one check-in and its assessment
+    GET  /patients/<name>/checkins    history, newest first (?limit=&before=<id>)
+    GET  /patients/<name>/export      download (?format=json|jsonl|csv|pdf)
+    GET  /clinic/patients             patient summaries, most severe first
+                                      (?date=&min_severity=&procedure=&limit=&offset=)
+    POST /reminders                   schedule reminders for someone (email or web push)
+    GET  /patients/<name>/reminders   someone's reminders, soonest first
+    DELETE /reminders/<id>            cancel a reminder
+    GET  /metrics                     request latency, Prometheus text format
+    GET  /health
+
+Every route but /health needs an "Authorization: Bearer <token>" header
+carrying the token from RECOVERY_BUDDY_API_TOKEN; the server won't start
+without one.
+"""
+
+import argparse
+import asyncio
+import hmac
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from recovery_buddy.checkin_store import CLINIC_PAGE_SIZE, POOL_SIZE, CheckInStore
+from recovery_buddy.content_store import ContentStore
+from recovery_buddy.copy_text import DEFAULT_TIPS, PROCEDURE_MILESTONES, RECOVERY_MILESTONES
+from recovery_buddy.engine import SEVERITY_OK, SEVERITY_URGENT, CheckInEngine, assessment_record, jsonable
+from recovery_buddy.export import EXPORT_FORMATS, create_export
+from recovery_buddy.milestones import MilestoneIndex
+from recovery_buddy.profiler import PROMETHEUS_CONTENT_TYPE, Profiler
+from recovery_buddy.reminders import (DAY, MILESTONE, REMINDER_KINDS, EmailChannel, ReminderScheduler,
+                                      WebPushChannel, milestone_times, next_at, parse_time_of_day)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTENT_DIR = os.path.join(ROOT, "content")
+DATABASE = "recovery_checkins.db"
+
+# Bearer token every client must send (all routes but /health)
+TOKEN_ENV = "RECOVERY_BUDDY_API_TOKEN"
+OPEN_PATHS = ("/health",)
+
+MAX_BODY = 64 * 1024
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+JSON_TYPE = "application/json"
+REMINDER_DAYS = 14
+MAX_REMINDER_DAYS = 365
+MAX_REMINDER_TIMES = 24
+
+logger = logging.getLogger("recovery_buddy")
+
+
+class ApiError(Exception):
+    """A request that can't be served, with the HTTP status to answer with"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _int_param(query, name, default, low, high):
+    try:
+        value = int(query.get(name, [default])[0])
+    except (TypeError, ValueError):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be a whole number") from None
+    return max(low, min(value, high))
+
+
+def _json_object(body):
+    try:
+        raw = json.loads(body or b"null")
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "body must be JSON") from None
+    if not isinstance(raw, dict):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "body must be a JSON object")
+    return raw
+
+
+class ApiServer:
+    """Routes, request handling and the storage thread pool"""
+
+    def __init__(self, store, content_store, token, profiler=None, scheduler=None):
+        if not token:
+            raise ValueError("the API needs a bearer token")
+        self.store = store
+        self.content_store = content_store
+        self._authorization = f"Bearer {token}".encode("utf-8")
+        self.profiler = profiler or Profiler(enabled=True)
+        self.scheduler = scheduler or ReminderScheduler({"email": EmailChannel(), "web_push": WebPushChannel()})
+        self.milestones = MilestoneIndex(PROCEDURE_MILESTONES, RECOVERY_MILESTONES)
+        self._executor = ThreadPoolExecutor(max_workers=store.pool.size, thread_name_prefix="recovery-buddy-api")
+        self._engine = (None, None)
+        self._engine_lock = threading.Lock()
+        self.routes = [
+            ("POST", re.compile(r"/checkins"), "POST /checkins", self.submit_checkin),
+            ("GET", re.compile(r"/checkins/(\d+)"), "GET /checkins/{id}", self.get_checkin),
+            ("GET", re.compile(r"/patients/([^/]+)/checkins"), "GET /patients/{name}/checkins", self.list_history),
+            ("GET", re.compile(r"/patients/([^/]+)/export"), "GET /patients/{name}/export", self.export),
+            ("POST", re.compile(r"/reminders"), "POST /reminders", self.add_reminders),
+            ("DELETE", re.compile(r"/reminders/(\d+)"), "DELETE /reminders/{id}", self.cancel_reminder),
+            ("GET", re.compile(r"/patients/([^/]+)/reminders"), "GET /patients/{name}/reminders", self.list_reminders),
+            ("GET", re.compile(r"/clinic/patients"), "GET /clinic/patients", self.clinic_patients),
+            ("GET", re.compile(r"/metrics"), "GET /metrics", self.metrics),
+            ("GET", re.compile(r"/health"), "GET /health", self.health),
+        ]
+
+    def engine(self):
+        """Engine for the newest content snapshot, rebuilt only when the content changes"""
+        snapshot = self.content_store.latest()
+        with self._engine_lock:
+            generation, engine = self._engine
+            if generation != snapshot.generation:
+                engine = CheckInEngine(snapshot.procedures, DEFAULT_TIPS)
+                self._engine = (snapshot.generation, engine)
+            return engine
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    # --- handlers: each returns (status, content type, body bytes, extra headers) ---
+
+    @staticmethod
+    def _json(status, payload):
+        return status, JSON_TYPE, json.dumps(payload).encode("utf-8"), {}
+
+    def _submit(self, raw):
+        engine = self.engine()
+        try:
+            check_in = engine.parse_checkin(raw, datetime.now().strftime("%Y-%m-%d"))
+        except ValueError as e:
+            raise ApiError(HTTPStatus.BAD_REQUEST, str(e)) from None
+
+        checkin_id, assessment = self.store.submit(check_in,
+                                                   lambda entries: assessment_record(engine.assess(check_in, entries)))
+        return {"id": checkin_id, "check_in": jsonable(check_in._asdict()), "assessment": assessment}
+
+    async def submit_checkin(self, body, query):
+        return self._json(HTTPStatus.CREATED, await self._run(self._submit, _json_object(body)))
+
+    async def get_checkin(self, body, query, checkin_id):
+        record = await self._run(self.store.get, int(checkin_id))
+        if record is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"no check-in {checkin_id}")
+        return self._json(HTTPStatus.OK, record)
+
+    async def list_history(self, body, query, name):
+        limit = _int_param(query, "limit", PAGE_SIZE, 1, MAX_PAGE_SIZE)
+        before = _int_param(query, "before", 0, 0, 2 ** 62) or None
+        records = await self._run(self.store.history, unquote(name), limit, before)
+        next_before = records[-1]["id"] if len(records) == limit else None
+        return self._json(HTTPStatus.OK, {"checkins": records, "next_before": next_before})
+
+    def _export(self, name, fmt):
+        records = self.store.all_history(name)
+        if not records:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"no check-ins for {name}")
+        latest = records[-1]
+        header = {
+            "exported_at": datetime.now().isoformat(),
+            "user_info": {"name": name, "procedure": latest["procedure"], "recovery_day": latest["day"]},
+            "stats": {"total_checkins": len(records)},
+        }
+        sections = {
+            "pain_history": [{"date": r["date"], "day": r["day"], "level": r["pain_level"],
+                              "notes": r["symptoms"].get("other")} for r in records],
+            "check_in_history": records,
+        }
+        path = create_export(fmt, header, sections)
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            os.remove(path)
+
+    async def export(self, body, query, name):
+        fmt = query.get("format", ["json"])[0]
+        if fmt not in EXPORT_FORMATS:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"format must be one of {', '.join(EXPORT_FORMATS)}")
+        name = unquote(name)
+        data = await self._run(self._export, name, fmt)
+        _, ext, mime = EXPORT_FORMATS[fmt]
+        filename = f"recovery_buddy_export_{datetime.now().strftime('%Y%m%d')}{ext}"
+        return HTTPStatus.OK, mime, data, {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+    async def clinic_patients(self, body, query):
+        checked_in = query.get("date", [None])[0]
+        if checked_in:
+            try:
+                datetime.strptime(checked_in, "%Y-%m-%d")
+            except ValueError:
+                raise ApiError(HTTPStatus.BAD_REQUEST, "date must be YYYY-MM-DD") from None
+        min_severity = _int_param(query, "min_severity", SEVERITY_OK, SEVERITY_OK, SEVERITY_URGENT)
+        procedure = query.get("procedure", [None])[0]
+        if procedure:
+            procedure = self.engine().stored_procedure(procedure)
+        limit = _int_param(query, "limit", CLINIC_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+        offset = _int_param(query, "offset", 0, 0, 2 ** 62)
+        patients, total = await self._run(self.store.patients, checked_in, min_severity, procedure, None,
+                                          limit, offset)
+        return self._json(HTTPStatus.OK, {"patients": patients, "total": total})
+
+    def _reminder_times(self, raw, kind, now):
+        """(due, message, every, until) for each reminder a POST /reminders asks for"""
+        if kind == MILESTONE:
+            try:
+                procedure = self.engine().procedure_key(raw.get("procedure"))
+                schedule = self.milestones.schedule(procedure, str(raw.get("surgery_date") or "") or None)
+            except ValueError as e:
+                raise ApiError(HTTPStatus.BAD_REQUEST, str(e)) from None
+            if schedule.surgery_date is None:
+                raise ApiError(HTTPStatus.BAD_REQUEST, "milestone reminders need a surgery_date")
+            return [(due, message, None, None)
+                    for due, message in milestone_times(schedule, schedule.day_on(date.fromtimestamp(now)))]
+
+        times = raw.get("times")
+        if not isinstance(times, list) or not 1 <= len(times) <= MAX_REMINDER_TIMES:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"times must list 1-{MAX_REMINDER_TIMES} times of day")
+        try:
+            clock = [parse_time_of_day(t) for t in times]
+        except ValueError as e:
+            raise ApiError(HTTPStatus.BAD_REQUEST, str(e)) from None
+        try:
+            days = max(1, min(int(raw.get("days", REMINDER_DAYS)), MAX_REMINDER_DAYS))
+        except (TypeError, ValueError):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "days must be a whole number") from None
+        medication = str(raw.get("medication") or "").strip()
+        message = str(raw.get("message") or "").strip() or (
+            f"Time to take {medication}" if medication else "Time for your check-in")
+        return [(next_at(hour, minute, now), message, DAY, now + days * DAY) for hour, minute in clock]
+
+    def _add_reminders(self, raw):
+        name = str(raw.get("name") or "").strip()
+        kind, channel, address = raw.get("kind"), raw.get("channel"), str(raw.get("address") or "").strip()
+        if not name or not address:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "name and address are required")
+        if kind not in REMINDER_KINDS:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"kind must be one of {', '.join(REMINDER_KINDS)}")
+        if channel not in self.scheduler.channels:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"channel must be one of {', '.join(self.scheduler.channels)}")
+        now = time.time()
+        reminders = [{"name": name, "kind": kind, "message": message, "channel": channel, "address": address,
+                      "due": due, "every": every, "until": until}
+                     for due, message, every, until in self._reminder_times(raw, kind, now)]
+        ids = self.store.add_reminders(reminders)
+        for reminder_id, reminder in zip(ids, reminders):
+            self.scheduler.add(reminder_id=reminder_id, **reminder)
+        return [self.scheduler.get(reminder_id) for reminder_id in ids]
+
+    async def add_reminders(self, body, query):
+        reminders = await self._run(self._add_reminders, _json_object(body))
+        return self._json(HTTPStatus.CREATED, {"reminders": jsonable([r for r in reminders if r is not None])})
+
+    async def list_reminders(self, body, query, name):
+        return self._json(HTTPStatus.OK, {"reminders": jsonable(self.scheduler.reminders(unquote(name)))})
+
+    async def cancel_reminder(self, body, query, reminder_id):
+        if not await self._run(self.store.delete_reminder, int(reminder_id), time.time()):
+            raise ApiError(HTTPStatus.NOT_FOUND, f"no reminder {reminder_id}")
+        self.scheduler.cancel(int(reminder_id))
+        return self._json(HTTPStatus.OK, {"cancelled": int(reminder_id)})
+
+    def load_reminders(self):
+        """Re-arm the scheduler with the stored reminders that can still fire; returns how many"""
+        reminders = self.store.live_reminders(time.time())
+        for reminder in reminders:
+            self.scheduler.add(reminder_id=reminder.pop("id"), **reminder)
+        return len(reminders)
+
+    async def metrics(self, body, query):
+        return HTTPStatus.OK, PROMETHEUS_CONTENT_TYPE, self.profiler.prometheus_text().encode("utf-8"), {}
+
+    async def health(self, body, query):
+        return self._json(HTTPStatus.OK, {"status": "ok"})
+
+    # --- HTTP ---
+
+    def authorized(self, authorization):
+        """Whether an Authorization header carries the server's bearer token"""
+        scheme, _, credentials = authorization.partition(" ")
+        # Headers are read as latin-1, so encoding back gives the bytes the client sent
+        candidate = f"{scheme.capitalize()} {credentials.strip()}".encode("latin-1", "replace")
+        return hmac.compare_digest(candidate, self._authorization)
+
+    async def dispatch(self, method, target, body, authorization=""):
+        """Route a request; returns (route label, response tuple)"""
+        url = urlsplit(target)
+        if url.path not in OPEN_PATHS and not self.authorized(authorization):
+            status, content_type, data, headers = self._json(HTTPStatus.UNAUTHORIZED,
+                                                             {"error": "missing or wrong bearer token"})
+            return "unauthorized", (status, content_type, data,
+                                    dict(headers, **{"WWW-Authenticate": 'Bearer realm="recovery-buddy"'}))
+        query = parse_qs(url.query)
+        allowed = []
+        for route_method, pattern, label, handler in self.routes:
+            match = pattern.fullmatch(url.path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed.append(route_method)
+                continue
+            try:
+                return label, await handler(body, query, *match.groups())
+            except ApiError as e:
+                return label, self._json(e.status, {"error": str(e)})
+            except Exception:
+                logger.exception("Recovery Buddy API error on %s %s", method, url.path)
+                return label, self._json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"})
+        if allowed:
+            status, content_type, data, headers = self._json(HTTPStatus.METHOD_NOT_ALLOWED,
+                                                             {"error": f"{method} not allowed"})
+            return "unmatched", (status, content_type, data, dict(headers, Allow=", ".join(allowed)))
+        return "unmatched", self._json(HTTPStatus.NOT_FOUND, {"error": f"no route for {url.path}"})
+
+    async def _read_request(self, reader):
+        """(method, target, body, authorization, keep_alive), or None when the client has gone"""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise ApiError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large") from None
+        request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+        try:
+            method, target, version = request_line.split(" ")
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+        headers = {}
+        for line in header_lines:
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "bad Content-Length") from None
+        if length < 0:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "bad Content-Length")
+        if length > MAX_BODY:
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"body over {MAX_BODY} bytes")
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method, target, body, headers.get("authorization", ""), keep_alive
+
+    @staticmethod
+    def _write_response(writer, response, keep_alive):
+        status, content_type, data, headers = response
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}", f"Content-Type: {content_type}",
+                 f"Content-Length: {len(data)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines.extend(f"{key}: {value}" for key, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + data)
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until the client closes it"""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ApiError as e:
+                    self._write_response(writer, self._json(e.status, {"error": str(e)}), False)
+                    break
+                if request is None:
+                    break
+                method, target, body, authorization, keep_alive = request
+                start = time.perf_counter()
+                label, response = await self.dispatch(method, target, body, authorization)
+                self._write_response(writer, response, keep_alive)
+                await writer.drain()
+                self.profiler.observe("api", label, time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8080, ready=None):
+        """Serve until cancelled; `ready`, if given, is called with the bound (host, port)"""
+        logger.info("Loaded %d reminders", await self._run(self.load_reminders))
+        self.scheduler.start()
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_BODY)
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[:2])
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.scheduler.stop()
+        self._executor.shutdown(wait=True)
+        self.store.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recovery Buddy JSON API for check-ins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--db", default=DATABASE, help=f"SQLite database (default: {DATABASE})")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE, help="database connections and worker threads")
+    parser.add_argument("--content-dir", default=CONTENT_DIR)
+    parser.add_argument("--import-progress", metavar="PROGRESS_FILE",
+                        help="first import per-name entries from the app's progress file")
+    args = parser.parse_args(argv)
+    token = os.environ.get(TOKEN_ENV)
+    if not token:
+        parser.error(f"set {TOKEN_ENV} to the bearer token clients must send")
+    logging.basicConfig(level=logging.INFO)
+
+    store = CheckInStore(args.db, args.pool_size)
+    server = ApiServer(store, ContentStore(args.content_dir), token)
+    if args.import_progress:
+        with open(args.import_progress, "r", encoding="utf-8") as f:
+            imported = store.import_progress(json.load(f), server.engine().stored_procedure)
+        logger.info("Imported %d check-ins from %s", imported, args.import_progress)
+    try:
+        asyncio.run(server.serve(args.host, args.port,
+                                 ready=lambda address: logger.info("Recovery Buddy API on http://%s:%s", *address)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
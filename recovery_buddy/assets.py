@@ -0,0 +1,30 @@
+"""
+Stylesheets and embedded HTML snippets.
+
+The app's CSS and its analytics/PWA snippets live as plain files under
+assets/ instead of as string literals in app.py. Each file is read the first
+time it is used and kept for the life of the process, so a rerun only hands
+Streamlit a string it already has.
+"""
+
+import os
+from functools import lru_cache
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+
+@lru_cache(maxsize=None)
+def read_asset(filename, directory=ASSETS_DIR):
+    with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def style_block(name, directory=ASSETS_DIR):
+    """<style> markup for assets/<name>.css, ready for st.markdown"""
+    return f"<style>\n{read_asset(name + '.css', directory)}</style>"
+
+
+def html_snippet(name, directory=ASSETS_DIR):
+    """Contents of assets/<name>.html, for components.html"""
+    return read_asset(name + ".html", directory)
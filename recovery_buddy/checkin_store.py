@@ -0,0 +1,354 @@
+"""
+SQLite check-in store for API clients.
+
+The Streamlit app keeps progress in a JSON file that is rewritten on every
+save, which suits one session at a time but not many concurrent writers.
+The API server keeps check-ins here instead: one row per check-in with the
+engine's assessment, in a WAL-mode SQLite database reached through a small
+pool of long-lived connections, so reads run alongside a write and no
+request pays to open a connection. A submit reads the person's history,
+assesses and inserts inside one write transaction, so two check-ins for the
+same person can't be assessed against the same stale history.
+
+Per-name entries from the app's progress file can be imported so existing
+history carries over.
+
+A `patients` table keeps one summary row per person, updated in the same
+transaction as each check-in: procedure, recovery day, the date of the
+latest check-in and the worst pain and severity logged that day. It is
+indexed by (procedure, day), by latest check-in date and by severity, so
+the clinic view can ask "who logged high pain or an urgent symptom today"
+across every patient with an index lookup instead of a scan of every
+check-in.
+
+Reminders registered through the API are kept in a `reminders` table so the
+server can re-arm its scheduler after a restart.
+"""
+
+import json
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+from recovery_buddy.engine import SEVERITY_OK, pain_severity
+
+POOL_SIZE = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkins (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    procedure TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    pain_level INTEGER,
+    emotional_state TEXT,
+    symptoms TEXT NOT NULL,
+    assessment TEXT,
+    created TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+);
+CREATE INDEX IF NOT EXISTS checkins_by_name ON checkins (name, id);
+CREATE TABLE IF NOT EXISTS patients (
+    name TEXT PRIMARY KEY,
+    procedure TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    last_check_in TEXT NOT NULL,
+    last_checkin_id INTEGER NOT NULL,
+    pain_level INTEGER,
+    max_pain INTEGER,
+    severity INTEGER NOT NULL,
+    checkins INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS patients_by_procedure_day ON patients (procedure, day);
+CREATE INDEX IF NOT EXISTS patients_by_last_check_in ON patients (last_check_in, severity DESC, name);
+CREATE INDEX IF NOT EXISTS patients_by_severity ON patients (severity DESC, last_check_in DESC, name);
+CREATE TABLE IF NOT EXISTS reminders (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    message TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    address TEXT NOT NULL,
+    due REAL NOT NULL,
+    every INTEGER,
+    until REAL
+);
+"""
+
+COLUMNS = "id, name, procedure, day, date, pain_level, emotional_state, symptoms, assessment, created"
+# Reminders that can't fire again: a one-off whose time has passed, or one past its end
+SPENT_REMINDER = "((every IS NULL AND due < :now) OR (until IS NOT NULL AND until < :now))"
+REMINDER_COLUMNS = "id, name, kind, message, channel, address, due, every, until"
+PATIENT_COLUMNS = "name, procedure, day, last_check_in, last_checkin_id, pain_level, max_pain, severity, checkins"
+CLINIC_PAGE_SIZE = 25
+
+
+class ConnectionPool:
+    """A fixed set of SQLite connections handed out one at a time"""
+
+    def __init__(self, path, size=POOL_SIZE):
+        if path == ":memory:":
+            raise ValueError("each pooled connection would get its own in-memory database; use a file")
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(self._connect())
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection (waiting for one if all are in use)"""
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    @contextmanager
+    def transaction(self, immediate=False):
+        """Borrow a connection inside BEGIN ... COMMIT (rolled back on error)"""
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+def _row(row):
+    record = dict(row)
+    record["symptoms"] = json.loads(record["symptoms"])
+    record["assessment"] = json.loads(record["assessment"]) if record["assessment"] else None
+    return record
+
+
+def _entry(row):
+    """A row in the per-name entries layout the CLI and CheckInEngine use"""
+    return {"day": row["day"], "pain_level": row["pain_level"],
+            "swelling": json.loads(row["symptoms"]).get("swelling") or "unknown",
+            "emotional_state": row["emotional_state"], "date": row["date"]}
+
+
+def _worst(a, b):
+    return b if a is None else a if b is None else max(a, b)
+
+
+def _summarize(summary, name, checkin_id, procedure, day, checked, pain_level, severity):
+    """A patients row updated with one more check-in (`summary` is None for someone new).
+
+    The row describes the latest check-in date, with the worst pain and
+    severity across that day's check-ins. A back-dated check-in only counts.
+    """
+    count = summary["checkins"] + 1 if summary else 1
+    if summary and checked < summary["last_check_in"]:
+        return dict(summary, checkins=count)
+    if summary and checked == summary["last_check_in"]:
+        max_pain, severity = _worst(summary["max_pain"], pain_level), max(summary["severity"], severity)
+    else:
+        max_pain = pain_level
+    return {"name": name, "procedure": procedure, "day": day, "last_check_in": checked,
+            "last_checkin_id": checkin_id, "pain_level": pain_level, "max_pain": max_pain,
+            "severity": severity, "checkins": count}
+
+
+def _stored_severity(row):
+    """Severity of a stored check-in: the engine's, or from pain alone for imported entries"""
+    if row["assessment"]:
+        severity = json.loads(row["assessment"]).get("severity")
+        if severity is not None:
+            return severity
+    return pain_severity(row["pain_level"])
+
+
+class CheckInStore:
+    """Check-ins and their assessments, per person, in SQLite"""
+
+    def __init__(self, path, pool_size=POOL_SIZE):
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+            stale = (conn.execute("SELECT 1 FROM checkins LIMIT 1").fetchone()
+                     and not conn.execute("SELECT 1 FROM patients LIMIT 1").fetchone())
+        if stale:
+            self.rebuild_patients()  # a database from before the patients table
+
+    def close(self):
+        self.pool.close()
+
+    @staticmethod
+    def _entries(conn, name):
+        rows = conn.execute("SELECT day, pain_level, symptoms, emotional_state, date FROM checkins "
+                            "WHERE name = ? ORDER BY id", (name,))
+        return [_entry(row) for row in rows]
+
+    @staticmethod
+    def _patient(conn, name):
+        row = conn.execute(f"SELECT {PATIENT_COLUMNS} FROM patients WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def _put_patients(conn, summaries):
+        conn.executemany(f"INSERT OR REPLACE INTO patients ({PATIENT_COLUMNS}) VALUES "
+                         "(:name, :procedure, :day, :last_check_in, :last_checkin_id, :pain_level, :max_pain, "
+                         ":severity, :checkins)", summaries)
+
+    def entries(self, name):
+        """Someone's check-ins as progress entries, oldest first"""
+        with self.pool.connection() as conn:
+            return self._entries(conn, name)
+
+    def submit(self, check_in, assess):
+        """Assess a CheckIn against the person's history and store it.
+
+        `assess(entries)` gets the earlier entries and returns the assessment
+        as a JSON-ready dict, with the check-in's SEVERITY_* under "severity".
+        Returns (id, assessment).
+        """
+        with self.pool.transaction(immediate=True) as conn:
+            assessment = assess(self._entries(conn, check_in.name))
+            cursor = conn.execute(
+                "INSERT INTO checkins (name, procedure, day, date, pain_level, emotional_state, symptoms, assessment) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (check_in.name, check_in.procedure, check_in.day, check_in.date, check_in.pain_level,
+                 check_in.emotional_state, json.dumps(check_in.symptoms), json.dumps(assessment)))
+            severity = assessment.get("severity", pain_severity(check_in.pain_level))
+            self._put_patients(conn, [_summarize(self._patient(conn, check_in.name), check_in.name, cursor.lastrowid,
+                                                 check_in.procedure, check_in.day, check_in.date,
+                                                 check_in.pain_level, severity)])
+            return cursor.lastrowid, assessment
+
+    def get(self, checkin_id):
+        """One check-in with its assessment, or None"""
+        with self.pool.connection() as conn:
+            row = conn.execute(f"SELECT {COLUMNS} FROM checkins WHERE id = ?", (checkin_id,)).fetchone()
+        return _row(row) if row else None
+
+    def history(self, name, limit=50, before=None):
+        """A page of someone's check-ins, newest first, starting below id `before`"""
+        with self.pool.connection() as conn:
+            if before is None:
+                rows = conn.execute(f"SELECT {COLUMNS} FROM checkins WHERE name = ? ORDER BY id DESC LIMIT ?",
+                                    (name, limit))
+            else:
+                rows = conn.execute(f"SELECT {COLUMNS} FROM checkins WHERE name = ? AND id < ? "
+                                    "ORDER BY id DESC LIMIT ?", (name, before, limit))
+            return [_row(row) for row in rows]
+
+    def all_history(self, name):
+        """Every check-in for a person, oldest first"""
+        with self.pool.connection() as conn:
+            rows = conn.execute(f"SELECT {COLUMNS} FROM checkins WHERE name = ? ORDER BY id", (name,))
+            return [_row(row) for row in rows]
+
+    def import_progress(self, progress_data, procedure_key=None):
+        """Add the per-name entries from the app's progress data for people not already stored.
+
+        `procedure_key` maps each person's saved procedure to the key stored
+        (the CLI saves "tummy tuck" where the app saves "tummy_tuck"), so
+        the clinic's procedure filter sees one key per procedure. Returns the
+        number of check-ins imported.
+        """
+        imported = 0
+        with self.pool.transaction(immediate=True) as conn:
+            for name, person in progress_data.items():
+                if not isinstance(person, dict) or not isinstance(person.get("entries"), list):
+                    continue  # the app's shared sections (pain_history, stats, ...)
+                if conn.execute("SELECT 1 FROM checkins WHERE name = ? LIMIT 1", (name,)).fetchone():
+                    continue
+                procedure = person.get("procedure") or "other"
+                if procedure_key is not None:
+                    procedure = procedure_key(procedure)
+                summary = None
+                for entry in person["entries"]:
+                    if not entry.get("date"):
+                        continue
+                    day, checked, pain_level = entry.get("day", 1), entry["date"], entry.get("pain_level")
+                    cursor = conn.execute(
+                        "INSERT INTO checkins (name, procedure, day, date, pain_level, emotional_state, symptoms) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (name, procedure, day, checked, pain_level, entry.get("emotional_state"),
+                         json.dumps({"swelling": entry.get("swelling")})))
+                    summary = _summarize(summary, name, cursor.lastrowid, procedure, day, checked, pain_level,
+                                         pain_severity(pain_level))
+                    imported += 1
+                if summary:
+                    self._put_patients(conn, [summary])
+        return imported
+
+    def rebuild_patients(self):
+        """Recompute every patients row from the stored check-ins"""
+        summaries = {}
+        with self.pool.transaction(immediate=True) as conn:
+            rows = conn.execute("SELECT id, name, procedure, day, date, pain_level, assessment FROM checkins "
+                                "ORDER BY id")
+            for row in rows:
+                summaries[row["name"]] = _summarize(summaries.get(row["name"]), row["name"], row["id"],
+                                                    row["procedure"], row["day"], row["date"],
+                                                    row["pain_level"], _stored_severity(row))
+            conn.execute("DELETE FROM patients")
+            self._put_patients(conn, summaries.values())
+
+    def patients(self, checked_in=None, min_severity=SEVERITY_OK, procedure=None, days=None,
+                 limit=CLINIC_PAGE_SIZE, offset=0):
+        """A page of patient summaries, most severe first, and how many match in all.
+
+        `checked_in` keeps people whose latest check-in was on that date;
+        `days` is an inclusive (first, last) range of recovery days.
+        """
+        where, params = [], []
+        if checked_in:
+            where.append("last_check_in = ?")
+            params.append(checked_in)
+        if min_severity > SEVERITY_OK:
+            where.append("severity >= ?")
+            params.append(min_severity)
+        if procedure:
+            where.append("procedure = ?")
+            params.append(procedure)
+        if days:
+            where.append("day BETWEEN ? AND ?")
+            params.extend(days)
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        with self.pool.connection() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM patients{clause}", params).fetchone()[0]
+            rows = conn.execute(f"SELECT {PATIENT_COLUMNS} FROM patients{clause} "
+                                "ORDER BY severity DESC, last_check_in DESC, name LIMIT ? OFFSET ?",
+                                params + [limit, offset])
+            return [dict(row) for row in rows], total
+
+    def add_reminders(self, reminders):
+        """Store reminders, given as dicts of the reminders columns except id; returns their ids"""
+        with self.pool.transaction(immediate=True) as conn:
+            return [conn.execute("INSERT INTO reminders (name, kind, message, channel, address, due, every, until) "
+                                 "VALUES (:name, :kind, :message, :channel, :address, :due, :every, :until)",
+                                 reminder).lastrowid for reminder in reminders]
+
+    def delete_reminder(self, reminder_id, now):
+        """Remove a reminder; returns False when there was none that could still fire after `now`"""
+        with self.pool.transaction() as conn:
+            deleted = conn.execute(f"DELETE FROM reminders WHERE id = :id AND NOT {SPENT_REMINDER}",
+                                   {"id": reminder_id, "now": now}).rowcount > 0
+            if not deleted:
+                conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))  # already delivered or over
+            return deleted
+
+    def live_reminders(self, now):
+        """Every reminder that can still fire after `now` (epoch seconds), dropping the rest"""
+        with self.pool.transaction(immediate=True) as conn:
+            conn.execute(f"DELETE FROM reminders WHERE {SPENT_REMINDER}", {"now": now})
+            return [dict(row) for row in conn.execute(f"SELECT {REMINDER_COLUMNS} FROM reminders ORDER BY id")]
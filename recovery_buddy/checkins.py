@@ -0,0 +1,118 @@
+"""
+Check-in event pipeline.
+
+Each page of the check-in flow (physical -> symptom_results -> daily_tip ->
+complete) adds what it learned to a CheckInDraft held in session memory.
+Nothing is written while the user moves through the flow; at the complete
+step the draft becomes one record that is committed to pain_history,
+check_in_history, the per-name entries list the CLI also reads, and the
+running stats, followed by a single save.
+"""
+
+from datetime import datetime
+
+# Reported severities that count as nothing to mention
+_UNREMARKABLE = (None, "", "none", "unknown")
+
+
+def notable_symptoms(symptoms):
+    """Short descriptions of the symptoms worth listing in the history"""
+    notable = []
+    for field in ("swelling", "bruising", "bleeding"):
+        value = symptoms.get(field)
+        if value not in _UNREMARKABLE:
+            notable.append(f"{value} {field}")
+    if symptoms.get("fever"):
+        temperature = symptoms.get("temperature")
+        notable.append(f"fever ({temperature})" if temperature else "fever")
+    if symptoms.get("numbness"):
+        notable.append("numbness")
+    return notable
+
+
+class CheckInDraft:
+    """One check-in being filled in across the flow's pages"""
+
+    __slots__ = ("started", "steps", "fields", "committed")
+
+    def __init__(self, now=None):
+        self.started = now or datetime.now()
+        self.steps = []
+        self.fields = {}
+        self.committed = False
+
+    def update(self, step, **fields):
+        """Buffer what a step captured; later values for the same field win"""
+        if step not in self.steps:
+            self.steps.append(step)
+        self.fields.update(fields)
+
+    def record(self, user_data):
+        """The finished check-in as one history record"""
+        symptoms = self.fields.get("symptoms", user_data.get("symptoms", {}))
+        mood = self.fields.get("emotional_state", user_data.get("emotional_state"))
+        return {
+            "date": self.started.strftime("%Y-%m-%d"),
+            "time": self.started.strftime("%H:%M"),
+            "day": user_data.get("day", 1),
+            "procedure": user_data.get("procedure"),
+            "pain_level": symptoms.get("pain_level"),
+            "swelling": symptoms.get("swelling"),
+            "bruising": symptoms.get("bruising"),
+            "bleeding": symptoms.get("bleeding"),
+            "fever": bool(symptoms.get("fever")),
+            "temperature": symptoms.get("temperature"),
+            "numbness": bool(symptoms.get("numbness")),
+            "notes": symptoms.get("other"),
+            "symptoms": notable_symptoms(symptoms),
+            "comparison": self.fields.get("comparison", {}),
+            "mood": mood,
+            "tip": self.fields.get("tip"),
+        }
+
+
+def _replace_or_append(history, entry):
+    """Keep one record per date; returns True if an earlier one was replaced"""
+    for i in range(len(history) - 1, -1, -1):
+        if history[i].get("date") == entry["date"]:
+            history[i] = entry
+            return True
+    history.append(entry)
+    return False
+
+
+def commit(draft, user_data, progress_data, stats):
+    """Write a finished draft into progress_data in one batch.
+
+    Returns True when the caller needs to save, False if this draft was
+    already committed (e.g. the complete page rerunning). When the day
+    already had a check-in it is replaced, and the saved stats are dropped
+    so they're rebuilt from history.
+    """
+    if draft.committed:
+        return False
+    draft.update("complete")
+    record = draft.record(user_data)
+    name = user_data.get("name", "there")
+
+    pain_entry = {"date": record["date"], "day": record["day"], "level": record["pain_level"],
+                  "notes": record["notes"]}
+    # The per-name entries keep the CLI's layout
+    cli_entry = {"day": record["day"], "pain_level": record["pain_level"], "swelling": record["swelling"] or "unknown",
+                 "emotional_state": record["mood"], "date": record["date"]}
+
+    person = progress_data.get(name)
+    if not isinstance(person, dict):
+        person = progress_data[name] = {"procedure": record["procedure"], "entries": []}
+    replaced = _replace_or_append(progress_data.setdefault("check_in_history", []), record)
+    if record["pain_level"] is not None:
+        replaced |= _replace_or_append(progress_data.setdefault("pain_history", []), pain_entry)
+    replaced |= _replace_or_append(person.setdefault("entries", []), cli_entry)
+
+    if replaced:
+        progress_data.pop("stats", None)
+    else:
+        stats.record_check_in(record["date"], pain=record["pain_level"], mood=record["mood"])
+        progress_data["stats"] = stats.to_dict()
+    draft.committed = True
+    return True
@@ -0,0 +1,70 @@
+"""
+Citation rendering for medical sources.
+
+Anchor tags for every source are built once when the index is created, and
+the HTML for each combination of source keys is cached after its first render.
+"""
+
+# Link styling used by inline "Sources:" citations
+INLINE_LINK_STYLE = "color: #5A7A5A; text-decoration: none;"
+
+
+def _key_tuple(source_keys):
+    """Normalize a source key or list of keys to a hashable tuple"""
+    if isinstance(source_keys, str):
+        return (source_keys,)
+    return tuple(source_keys)
+
+
+def _join_names(names):
+    """Join names as 'A', 'A and B' or 'A, B, and C'"""
+    if len(names) <= 1:
+        return "".join(names)
+    if len(names) == 2:
+        return f"{names[0]} and {names[1]}"
+    return f"{', '.join(names[:-1])}, and {names[-1]}"
+
+
+class CitationIndex:
+    """Precomputed citation HTML for a table of medical sources"""
+
+    def __init__(self, sources):
+        self.sources = sources
+        self._inline_anchors = {}
+        self._box_anchors = {}
+        for key, src in sources.items():
+            self._inline_anchors[key] = f'<a href="{src["url"]}" target="_blank" style="{INLINE_LINK_STYLE}">{src["abbrev"]}</a>'
+            self._box_anchors[key] = f'<a href="{src["url"]}" target="_blank">{src["abbrev"]}</a>'
+        self._inline_cache = {}
+        self._box_cache = {}
+
+    def anchors(self, source_keys):
+        """List of inline anchor tags for the given source keys"""
+        return [self._inline_anchors[key] for key in _key_tuple(source_keys) if key in self._inline_anchors]
+
+    def inline(self, source_keys):
+        """Inline 'Sources: ...' span for the given source keys"""
+        keys = _key_tuple(source_keys)
+        html = self._inline_cache.get(keys)
+        if html is None:
+            html = f'<span class="citation-inline">Sources: {", ".join(self.anchors(keys))}</span>'
+            self._inline_cache[keys] = html
+        return html
+
+    def box(self, label, source_keys):
+        """Citation box such as '📚 Symptom data from ASPS and WebMD'"""
+        cache_key = (label, _key_tuple(source_keys))
+        html = self._box_cache.get(cache_key)
+        if html is None:
+            links = [self._box_anchors[key] for key in cache_key[1] if key in self._box_anchors]
+            html = f'<div class="citation-box">📚 {label} {_join_names(links)}</div>'
+            self._box_cache[cache_key] = html
+        return html
+
+    def boxes(self, specs):
+        """Render all citation boxes for a page in one pass.
+
+        specs is a list of (label, source_keys) pairs; the rendered boxes
+        are returned in the same order.
+        """
+        return [self.box(label, source_keys) for label, source_keys in specs]
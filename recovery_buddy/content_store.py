@@ -0,0 +1,107 @@
+"""
+Hot-reloadable medical content.
+
+Procedures, FAQs and the medical review date live in versioned JSON files
+under content/. The store checks the files' modification stamps at most once
+per check interval, re-parses only the files that changed, and swaps in a new
+immutable snapshot with a single reference assignment. Recent snapshots are
+kept so sessions can stay pinned to the one they started a page with.
+
+Publish new content by writing the file next to the old one and renaming it
+into place, so a reload never sees a half-written file.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# Snapshot field -> file under the content directory
+CONTENT_FILES = {
+    "medical_review": "medical_review.json",
+    "procedures": "procedures.json",
+    "faq": "faq.json",
+}
+
+ContentSnapshot = namedtuple("ContentSnapshot", ["generation", "versions", "medical_review", "procedures", "faq"])
+
+
+def _restore_procedures(procedures):
+    """JSON turns day numbers into string keys; convert them back to ints"""
+    for procedure in procedures.values():
+        for field in ("normal_symptoms", "tips"):
+            if field in procedure:
+                procedure[field] = {int(day): value for day, value in procedure[field].items()}
+    return procedures
+
+
+# Post-processing for files whose JSON form differs from what the app uses
+PARSERS = {"procedures": _restore_procedures}
+
+
+class ContentStore:
+    """Versioned content snapshots with cheap change detection"""
+
+    def __init__(self, directory, check_interval=2.0, keep_snapshots=8):
+        self.directory = directory
+        self.check_interval = check_interval
+        self.keep_snapshots = keep_snapshots
+        self._lock = threading.Lock()
+        self._stamps = {}
+        self._data = {}
+        self._versions = {}
+        self._snapshots = OrderedDict()
+        self._generation = 0
+        self._last_check = 0.0
+        self._current = None
+        self.reload()
+
+    def _load(self, field):
+        """Parse one content file"""
+        path = os.path.join(self.directory, CONTENT_FILES[field])
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        data = payload["data"]
+        if field in PARSERS:
+            data = PARSERS[field](data)
+        return payload.get("version"), data
+
+    def reload(self):
+        """Re-read changed files and swap in a new snapshot if anything changed"""
+        with self._lock:
+            self._last_check = time.monotonic()
+            changed = {}
+            for field, filename in CONTENT_FILES.items():
+                stat = os.stat(os.path.join(self.directory, filename))
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                if self._stamps.get(field) != stamp:
+                    changed[field] = (stamp, self._load(field))
+
+            if changed:
+                for field, (stamp, (version, data)) in changed.items():
+                    self._stamps[field] = stamp
+                    self._versions[field] = version
+                    self._data[field] = data
+                self._generation += 1
+                snapshot = ContentSnapshot(self._generation, dict(self._versions), **self._data)
+                self._snapshots[snapshot.generation] = snapshot
+                while len(self._snapshots) > self.keep_snapshots:
+                    self._snapshots.popitem(last=False)
+                self._current = snapshot
+            return self._current
+
+    def latest(self):
+        """Newest snapshot, checking for changed files if the interval has passed"""
+        if time.monotonic() - self._last_check >= self.check_interval:
+            try:
+                self.reload()
+            except (OSError, ValueError, KeyError) as e:
+                # Keep serving the current snapshot; the next check retries
+                logging.error(f"Recovery Buddy content reload failed: {e}")
+        return self._current
+
+    def get(self, generation):
+        """Snapshot a session is pinned to, or the latest if it has been retired"""
+        return self._snapshots.get(generation) or self.latest()
@@ -0,0 +1,430 @@
+"""
+Static copy for the app's pages.
+
+Affirmations, tips, checklists, milestones, resource links and the other
+fixed tables the pages show. They live in their own module so they are built
+once when it is first imported, instead of on every Streamlit rerun of
+app.py, and the import is served from cached bytecode.
+"""
+
+COMFORT_REMINDERS = [
+    "Have you had water today? 💧",
+    "Remember to take a deep breath 🌬️",
+    "It's okay to rest 🛋️",
+    "You deserve kindness today 💚",
+    "Take a moment to stretch gently",
+    "How about some calming music? 🎵",
+    "Remember: healing takes time"
+]
+
+HEALING_QUOTES = [
+    "\"Healing is not linear\" 🌱",
+    "\"Be gentle with yourself\"",
+    "\"Small progress is still progress\"",
+    "\"Your only job right now is to heal\"",
+    "\"Rest is not laziness, it's recovery\"",
+    "\"Every day you're getting stronger\"",
+    "\"Patience is part of healing\""
+]
+
+DAILY_TIPS = [
+    {"tip": "Stay hydrated! Aim for 8 glasses of water today 💧", "icon": "💧"},
+    {"tip": "Sleep elevated to reduce swelling 🛏️", "icon": "🛏️"},
+    {"tip": "Avoid salty foods - they increase swelling 🧂", "icon": "🧂"},
+    {"tip": "Take short walks if approved by your surgeon 🚶", "icon": "🚶"},
+    {"tip": "Ice the area as directed (20 min on, 20 min off) 🧊", "icon": "🧊"},
+    {"tip": "Wear your compression garments as instructed 👕", "icon": "👕"},
+    {"tip": "Avoid looking down at your phone too much 📱", "icon": "📱"},
+    {"tip": "Keep your follow-up appointments! 📅", "icon": "📅"},
+    {"tip": "Don't skip meals - your body needs fuel to heal 🍎", "icon": "🍎"},
+    {"tip": "Avoid alcohol - it can increase swelling and bruising 🍷", "icon": "🍷"},
+    {"tip": "No smoking! It significantly delays healing 🚭", "icon": "🚭"},
+    {"tip": "Take your medications on schedule ⏰", "icon": "⏰"},
+    {"tip": "Get plenty of protein for tissue repair 🥚", "icon": "🥚"},
+    {"tip": "Avoid strenuous activities until cleared 🏃", "icon": "🏃"},
+    {"tip": "Be patient with bruising - it can take weeks to fade 💜", "icon": "💜"}
+]
+
+# Recovery milestones by day
+RECOVERY_MILESTONES = {
+    1: {"title": "Day 1 - Rest Day", "message": "Focus on rest. Swelling is normal.", "icon": "🛏️"},
+    3: {"title": "Day 3 - Peak Swelling", "message": "Swelling peaks around day 2-3. This is normal!", "icon": "📈"},
+    7: {"title": "Week 1 Complete!", "message": "Major milestone! Stitches may be removed soon.", "icon": "🎉"},
+    14: {"title": "Two Weeks!", "message": "Swelling starts decreasing. Bruising fading.", "icon": "🌟"},
+    21: {"title": "Three Weeks!", "message": "Most bruising should be gone. Feeling more normal!", "icon": "✨"},
+    30: {"title": "One Month!", "message": "Major healing accomplished. Results emerging!", "icon": "🏆"},
+    60: {"title": "Two Months!", "message": "Swelling continues to improve. Almost there!", "icon": "🌸"},
+    90: {"title": "Three Months!", "message": "Final results starting to show!", "icon": "💫"}
+}
+
+# Self-care checklist items
+SELF_CARE_CHECKLIST = [
+    {"id": "meds", "label": "Took medications", "icon": "💊"},
+    {"id": "water", "label": "Drank 8 glasses of water", "icon": "💧"},
+    {"id": "food", "label": "Ate nutritious food", "icon": "🥗"},
+    {"id": "rest", "label": "Rested enough", "icon": "😴"},
+    {"id": "movement", "label": "Did gentle movement (if approved)", "icon": "🚶"},
+    {"id": "breathing", "label": "Practiced deep breathing", "icon": "🌬️"},
+    {"id": "support", "label": "Reached out to someone supportive", "icon": "💚"}
+]
+
+# Mood options with emojis
+MOOD_OPTIONS = [
+    {"emoji": "😢", "label": "Struggling", "color": "#FFB4B4", "response": "I'm sorry you're having a hard time. Remember, it's okay to not be okay. Healing is tough. 💚"},
+    {"emoji": "😐", "label": "Okay", "color": "#FFE4B4", "response": "Okay days are perfectly normal during recovery. You're doing great just by getting through it!"},
+    {"emoji": "🙂", "label": "Good", "color": "#C4E8C4", "response": "That's wonderful to hear! Keep up the positive energy! 🌸"},
+    {"emoji": "😊", "label": "Great", "color": "#A8D8A8", "response": "So happy for you! What a great recovery day! 🎉"}
+]
+
+# Medical Sources for Citations
+MEDICAL_SOURCES = {
+    "asps": {
+        "name": "American Society of Plastic Surgeons",
+        "url": "https://www.plasticsurgery.org",
+        "abbrev": "ASPS"
+    },
+    "mayo": {
+        "name": "Mayo Clinic",
+        "url": "https://www.mayoclinic.org",
+        "abbrev": "Mayo Clinic"
+    },
+    "cleveland": {
+        "name": "Cleveland Clinic",
+        "url": "https://my.clevelandclinic.org",
+        "abbrev": "Cleveland Clinic"
+    },
+    "webmd": {
+        "name": "WebMD",
+        "url": "https://www.webmd.com",
+        "abbrev": "WebMD"
+    },
+    "realself": {
+        "name": "RealSelf",
+        "url": "https://www.realself.com",
+        "abbrev": "RealSelf"
+    }
+}
+
+# Surgery Resources by procedure
+SURGERY_RESOURCES = {
+    "rhinoplasty": {
+        "name": "Rhinoplasty (Nose Surgery)",
+        "links": [
+            {"source": "Mayo Clinic", "url": "https://www.mayoclinic.org/tests-procedures/rhinoplasty/about/pac-20384532"},
+            {"source": "ASPS", "url": "https://www.plasticsurgery.org/cosmetic-procedures/rhinoplasty"},
+            {"source": "Cleveland Clinic", "url": "https://my.clevelandclinic.org/health/treatments/11023-rhinoplasty-nose-surgery"}
+        ],
+        "recovery_time": "1-2 weeks for initial recovery, 6-12 months for final results",
+        "common_symptoms": "Swelling, bruising around eyes, nasal congestion, mild discomfort"
+    },
+    "facelift": {
+        "name": "Facelift",
+        "links": [
+            {"source": "Mayo Clinic", "url": "https://www.mayoclinic.org/tests-procedures/face-lift/about/pac-20394059"},
+            {"source": "ASPS", "url": "https://www.plasticsurgery.org/cosmetic-procedures/facelift"}
+        ],
+        "recovery_time": "2-4 weeks, with final results at 2-3 months",
+        "common_symptoms": "Swelling, bruising, tightness, numbness"
+    },
+    "breast_augmentation": {
+        "name": "Breast Augmentation",
+        "links": [
+            {"source": "Mayo Clinic", "url": "https://www.mayoclinic.org/tests-procedures/breast-augmentation/about/pac-20393178"},
+            {"source": "ASPS", "url": "https://www.plasticsurgery.org/cosmetic-procedures/breast-augmentation"}
+        ],
+        "recovery_time": "1-2 weeks, avoid strenuous activity for 4-6 weeks",
+        "common_symptoms": "Swelling, soreness, tightness, sensitivity changes"
+    },
+    "buttock_enhancement": {
+        "name": "Buttock Enhancement (Gluteal Augmentation/BBL)",
+        "links": [
+            {"source": "ASPS", "url": "https://www.plasticsurgery.org/cosmetic-procedures/buttock-enhancement"}
+        ],
+        "recovery_time": "2-3 weeks, avoid sitting directly for 2-6 weeks",
+        "common_symptoms": "Swelling, bruising, discomfort when sitting"
+    },
+    "tummy_tuck": {
+        "name": "Tummy Tuck (Abdominoplasty)",
+        "links": [
+            {"source": "Mayo Clinic", "url": "https://www.mayoclinic.org/tests-procedures/tummy-tuck/about/pac-20384892"},
+            {"source": "ASPS", "url": "https://www.plasticsurgery.org/cosmetic-procedures/tummy-tuck"}
+        ],
+        "recovery_time": "2-4 weeks, full recovery 3-6 months",
+        "common_symptoms": "Swelling, bruising, tightness, drain tubes initially"
+    },
+    "liposuction": {
+        "name": "Liposuction",
+        "links": [
+            {"source": "Mayo Clinic", "url": "https://www.mayoclinic.org/tests-procedures/liposuction/about/pac-20384586"},
+            {"source": "ASPS", "url": "https://www.plasticsurgery.org/cosmetic-procedures/liposuction"}
+        ],
+        "recovery_time": "1-2 weeks, compression garments for several weeks",
+        "common_symptoms": "Swelling, bruising, fluid drainage, numbness"
+    }
+}
+
+# Procedure categories for organized display
+PROCEDURE_CATEGORIES = {
+    "breast": {
+        "name": "Breast Procedures",
+        "procedures": ["breast_augmentation", "breast_implant_removal", "breast_implant_revision", "breast_lift", "breast_reduction", "fat_transfer_breast"]
+    },
+    "fat_reduction": {
+        "name": "Fat Reduction",
+        "procedures": ["liposuction", "laser_lipo", "nonsurgical_fat_reduction"]
+    },
+    "body_lifts": {
+        "name": "Body Lifts",
+        "procedures": ["arm_lift", "body_contouring", "body_lift", "buttock_enhancement", "mommy_makeover", "thigh_lift", "tummy_tuck"]
+    },
+    "face_neck": {
+        "name": "Face & Neck",
+        "procedures": ["brow_lift", "buccal_fat_removal", "cheek_augmentation", "chin_surgery", "ear_surgery", "eyelid_surgery", "facelift", "facial_implants", "neck_lift", "rhinoplasty", "thread_lift"]
+    },
+    "minimally_invasive": {
+        "name": "Minimally Invasive",
+        "procedures": ["botox", "chemical_peel", "dermabrasion", "dermal_fillers", "laser_hair_removal", "laser_resurfacing", "microdermabrasion", "skin_rejuvenation", "spider_vein_treatment", "tattoo_removal"]
+    },
+    "male_specific": {
+        "name": "Male-Specific",
+        "procedures": ["gynecomastia", "hair_transplant"]
+    },
+    "aesthetic_genital": {
+        "name": "Aesthetic Genital",
+        "procedures": ["aesthetic_genital_surgery", "nonsurgical_genital"]
+    }
+}
+
+# Default tips
+DEFAULT_TIPS = {
+    1: "Day 1 is all about rest. Your only job is to heal. Stay hydrated and take your meds on schedule.",
+    2: "Day 2 can feel worse than Day 1 as anesthesia wears off. This is normal - you're not going backward!",
+    3: "Day 3 is often emotionally and physically challenging. Be extra gentle with yourself today.",
+    4: "You're almost through the hardest part! Small improvements start to show around now.",
+    5: "Day 5 - you might feel good enough to overdo it. Resist the urge! Rest is still crucial.",
+    7: "One week down! You've made it through the toughest part of recovery.",
+    14: "Two weeks in - you're a recovery champion! Results are still evolving but you're on the right track.",
+}
+
+# Affirmations
+AFFIRMATIONS = [
+    "Healing is not linear, and that's perfectly okay.",
+    "Your body is doing incredible work right now.",
+    "Rest is not lazy - it's essential for recovery.",
+    "Be patient with yourself. You're doing better than you think.",
+    "Every day brings you closer to your final results.",
+    "It's okay to have hard days. They don't last forever.",
+    "You are brave for taking this step for yourself.",
+    "Trust the process. Trust your body. Trust yourself.",
+]
+
+# Community recovery quotes
+COMMUNITY_QUOTES = [
+    {"quote": "Day 7 was my turning point - suddenly I felt human again!", "day": 7, "procedure": "rhinoplasty"},
+    {"quote": "The swelling at week 2 had me worried, but by week 4 I was so happy with my results.", "day": 14, "procedure": "facelift"},
+    {"quote": "I cried on day 3 thinking I made a mistake. Now at 6 months, it's the best decision I ever made.", "day": 3, "procedure": "any"},
+    {"quote": "Ice packs became my best friend. Stock up!", "day": 1, "procedure": "any"},
+    {"quote": "The 'ugly duckling' phase is REAL but it ends! Trust the process.", "day": 5, "procedure": "rhinoplasty"},
+    {"quote": "Walking helped so much more than I expected. Even just around the house.", "day": 2, "procedure": "tummy_tuck"},
+    {"quote": "Week 3 I finally felt like myself. Hang in there!", "day": 21, "procedure": "blepharoplasty"},
+    {"quote": "Pineapple juice before surgery - I had almost no bruising!", "day": 1, "procedure": "any"},
+    {"quote": "The compression garment is annoying but SO worth it for the results.", "day": 7, "procedure": "liposuction"},
+    {"quote": "Don't compare your day 5 to someone's day 30. Everyone heals differently.", "day": 5, "procedure": "any"},
+    {"quote": "I'm 3 months post-op and keep forgetting I ever had surgery - that's when you know it's healed!", "day": 90, "procedure": "breast_augmentation"},
+    {"quote": "Sleep elevated! I ignored this advice and regretted it. Listen to your surgeon.", "day": 1, "procedure": "any"},
+]
+
+# Countdown milestones per procedure (days until milestone)
+PROCEDURE_MILESTONES = {
+    "rhinoplasty": [
+        {"milestone": "Cast removal", "days": 7, "icon": "🎉"},
+        {"milestone": "Return to work (desk job)", "days": 10, "icon": "💼"},
+        {"milestone": "Light exercise", "days": 21, "icon": "🚶"},
+        {"milestone": "Full exercise", "days": 42, "icon": "🏃"},
+        {"milestone": "Final results", "days": 365, "icon": "✨"},
+    ],
+    "facelift": [
+        {"milestone": "Suture removal", "days": 7, "icon": "🎉"},
+        {"milestone": "Return to work", "days": 14, "icon": "💼"},
+        {"milestone": "Social activities", "days": 21, "icon": "🎭"},
+        {"milestone": "Full exercise", "days": 42, "icon": "🏃"},
+        {"milestone": "Final results", "days": 180, "icon": "✨"},
+    ],
+    "breast_augmentation": [
+        {"milestone": "Shower normally", "days": 3, "icon": "🚿"},
+        {"milestone": "Return to work (desk)", "days": 7, "icon": "💼"},
+        {"milestone": "Light exercise", "days": 21, "icon": "🚶"},
+        {"milestone": "Full exercise", "days": 42, "icon": "🏃"},
+        {"milestone": "Final results", "days": 90, "icon": "✨"},
+    ],
+    "tummy_tuck": [
+        {"milestone": "Drains removed", "days": 7, "icon": "🎉"},
+        {"milestone": "Stand straight", "days": 14, "icon": "🧍"},
+        {"milestone": "Return to work", "days": 21, "icon": "💼"},
+        {"milestone": "Light exercise", "days": 42, "icon": "🚶"},
+        {"milestone": "Full exercise", "days": 84, "icon": "🏃"},
+    ],
+    "liposuction": [
+        {"milestone": "Return to work", "days": 5, "icon": "💼"},
+        {"milestone": "Light exercise", "days": 14, "icon": "🚶"},
+        {"milestone": "Full exercise", "days": 28, "icon": "🏃"},
+        {"milestone": "Final results", "days": 90, "icon": "✨"},
+    ],
+    "eyelid_surgery": [
+        {"milestone": "Sutures removed", "days": 5, "icon": "🎉"},
+        {"milestone": "Return to work", "days": 10, "icon": "💼"},
+        {"milestone": "Wear contacts", "days": 14, "icon": "👁️"},
+        {"milestone": "Full exercise", "days": 21, "icon": "🏃"},
+        {"milestone": "Final results", "days": 90, "icon": "✨"},
+    ],
+    "default": [
+        {"milestone": "Initial healing", "days": 7, "icon": "🎉"},
+        {"milestone": "Return to light activities", "days": 14, "icon": "🚶"},
+        {"milestone": "Return to work", "days": 21, "icon": "💼"},
+        {"milestone": "Full activities", "days": 42, "icon": "🏃"},
+        {"milestone": "Final results", "days": 180, "icon": "✨"},
+    ],
+}
+
+# Surgeon message templates
+SURGEON_TEMPLATES = {
+    "general_update": {
+        "title": "General Post-Op Update",
+        "template": """Hi [Surgeon's Office],
+
+This is [NAME] checking in on Day [DAY] after my [PROCEDURE].
+
+Current status:
+- Pain level: [PAIN]/10
+- Swelling: [SWELLING]
+- Bruising: [BRUISING]
+
+Overall I'm feeling [good/okay/concerned]. Just wanted to provide an update.
+
+Thank you,
+[NAME]"""
+    },
+    "concerning_symptoms": {
+        "title": "Concerning Symptoms",
+        "template": """Hi [Surgeon's Office],
+
+This is [NAME], Day [DAY] post-op from my [PROCEDURE]. I'm experiencing some symptoms I wanted to report:
+
+- [Describe symptom 1]
+- [Describe symptom 2]
+
+Should I come in for a check, or is this normal at this stage?
+
+Please advise when you can.
+
+Thank you,
+[NAME]"""
+    },
+    "medication_question": {
+        "title": "Medication Question",
+        "template": """Hi [Surgeon's Office],
+
+This is [NAME], Day [DAY] after my [PROCEDURE]. I have a question about my medications:
+
+[Your question here]
+
+Current medications I'm taking:
+- [Medication 1]
+- [Medication 2]
+
+Please let me know what you recommend.
+
+Thank you,
+[NAME]"""
+    },
+    "schedule_followup": {
+        "title": "Schedule Follow-up",
+        "template": """Hi [Surgeon's Office],
+
+This is [NAME]. I had my [PROCEDURE] and am currently on Day [DAY]. I would like to schedule my follow-up appointment.
+
+My availability:
+- [Days/times that work for you]
+
+Please let me know what works.
+
+Thank you,
+[NAME]"""
+    },
+}
+
+# Journaling prompts - 25+ rotating prompts
+JOURNALING_PROMPTS = [
+    {"prompt": "What are you grateful for today?", "category": "gratitude"},
+    {"prompt": "How has your energy level been?", "category": "wellness"},
+    {"prompt": "What's one thing that made you smile today?", "category": "positivity"},
+    {"prompt": "Describe how your body feels right now.", "category": "awareness"},
+    {"prompt": "What are you looking forward to?", "category": "hope"},
+    {"prompt": "How did you sleep last night?", "category": "wellness"},
+    {"prompt": "What self-care did you do today?", "category": "self-care"},
+    {"prompt": "Write about your healing progress.", "category": "reflection"},
+    {"prompt": "What emotions came up today?", "category": "emotional"},
+    {"prompt": "What would you tell someone else going through this?", "category": "wisdom"},
+    {"prompt": "Why did you decide to have this procedure? What made now the right time?", "category": "reflection"},
+    {"prompt": "Write a letter to your future healed self. What do you hope to feel?", "category": "hope"},
+    {"prompt": "What are you most looking forward to when you're fully healed?", "category": "goals"},
+    {"prompt": "How has your support system shown up for you during recovery?", "category": "gratitude"},
+    {"prompt": "What's one kind thing you can do for yourself today?", "category": "self-care"},
+    {"prompt": "Describe a moment today when you felt strong or brave.", "category": "strength"},
+    {"prompt": "List three things your body has done for you today.", "category": "gratitude"},
+    {"prompt": "What fear about recovery has turned out to be unfounded?", "category": "reflection"},
+    {"prompt": "How do you want to feel in one month? In three months?", "category": "goals"},
+    {"prompt": "What small victory can you celebrate today?", "category": "positivity"},
+    {"prompt": "How are you being patient with yourself during recovery?", "category": "self-care"},
+    {"prompt": "What has surprised you most about your recovery?", "category": "reflection"},
+    {"prompt": "Describe your perfect day once you're fully healed.", "category": "hope"},
+    {"prompt": "What have you learned about yourself through this experience?", "category": "wisdom"},
+    {"prompt": "How has your perspective on your body changed?", "category": "awareness"},
+    {"prompt": "What comfort items have helped you most during recovery?", "category": "self-care"},
+    {"prompt": "Write about a kind gesture someone did for you recently.", "category": "gratitude"},
+    {"prompt": "What does healing mean to you beyond the physical?", "category": "emotional"},
+    {"prompt": "How are you staying positive during challenging moments?", "category": "strength"},
+    {"prompt": "What advice would you give yourself from day one of recovery?", "category": "wisdom"},
+]
+
+# Daily recovery checklist
+DAILY_CHECKLIST = [
+    {"task": "Take morning medications", "icon": "💊", "time": "morning"},
+    {"task": "Drink 8oz water", "icon": "💧", "time": "morning"},
+    {"task": "Gentle walk (5-10 mins)", "icon": "🚶", "time": "morning"},
+    {"task": "Take midday medications", "icon": "💊", "time": "afternoon"},
+    {"task": "Eat protein-rich meal", "icon": "🥩", "time": "afternoon"},
+    {"task": "Drink 8oz water", "icon": "💧", "time": "afternoon"},
+    {"task": "Gentle walk (5-10 mins)", "icon": "🚶", "time": "afternoon"},
+    {"task": "Take evening medications", "icon": "💊", "time": "evening"},
+    {"task": "Drink 8oz water", "icon": "💧", "time": "evening"},
+    {"task": "Apply ice/compression as directed", "icon": "🧊", "time": "evening"},
+    {"task": "Sleep elevated", "icon": "😴", "time": "evening"},
+]
+
+# Emergency info
+EMERGENCY_INFO = {
+    "call_911": [
+        "Difficulty breathing or shortness of breath",
+        "Chest pain",
+        "Severe bleeding that won't stop",
+        "Signs of stroke (face drooping, arm weakness, speech difficulty)",
+        "Loss of consciousness",
+        "Allergic reaction (severe swelling, hives, difficulty breathing)",
+    ],
+    "call_surgeon_urgent": [
+        "Fever over 101°F (38.3°C)",
+        "Sudden increase in pain not relieved by medication",
+        "Wound opening or separation",
+        "Signs of infection (increasing redness, warmth, pus)",
+        "Unusual swelling that's getting worse",
+        "Numbness or tingling that's spreading",
+    ],
+    "call_surgeon_soon": [
+        "Mild fever (99-101°F)",
+        "Nausea from medications",
+        "Constipation lasting more than 3 days",
+        "Questions about activity restrictions",
+        "Running low on prescription medications",
+    ],
+}
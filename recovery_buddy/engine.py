@@ -0,0 +1,303 @@
+"""
+Check-in engine.
+
+The recovery logic behind a check-in, separated from how it is asked and
+shown: how the reported symptoms compare with what's typical for the
+procedure and day, which concerns need a call to the surgeon, how a mood
+answer should be met, which tip fits the day and how pain is trending.
+Every method takes plain inputs and returns a result namedtuple; nothing
+here prints, prompts or touches session state, so the CLI, the Streamlit
+pages and batch mode share one implementation and each renders the results
+in its own words.
+"""
+
+from collections import namedtuple
+from datetime import date, datetime
+
+from recovery_buddy.symptom_rules import ABOVE, BELOW, SymptomComparator
+from recovery_buddy.trends import DailySeries, describe_trend, rolling_mean
+from recovery_buddy.triage import HEAVY_BLEEDING as TRIAGE_HEAVY_BLEEDING, HIGH_FEVER as TRIAGE_HIGH_FEVER
+from recovery_buddy.triage import SYMPTOM_CHECKER, SymptomTriage, parse_temperature
+
+# Pain relative to the stage of recovery
+PAIN_MANAGEABLE = "manageable"    # first three days, 6 or below
+PAIN_HIGH_EARLY = "high_early"    # first three days, 7 or above
+PAIN_HIGH = "high"                # after day 3, 7 or above
+PAIN_LOW = "low"                  # 3 or below
+PAIN_MODERATE = "moderate"        # after day 3, 4-6
+
+# Concerns that need attention whatever the procedure
+HEAVY_BLEEDING = "heavy_bleeding"
+HIGH_FEVER = "high_fever"
+FEVER_THRESHOLD = 101
+
+# Urgent checker symptom that says the same as each concern, left out when the concern is raised
+CONCERN_SYMPTOMS = {HEAVY_BLEEDING: TRIAGE_HEAVY_BLEEDING, HIGH_FEVER: TRIAGE_HIGH_FEVER}
+
+# How a mood answer is met
+MOOD_LOW = "low"
+MOOD_OKAY = "okay"
+MOOD_POSITIVE = "positive"
+LOW_MOODS = ('down', 'struggling', 'sad', 'depressed', 'anxious', 'worried', 'bad', 'terrible')
+OKAY_MOODS = ('okay', 'fine', 'alright', 'meh')
+
+# How much a check-in needs a clinician's attention, highest first in the clinic view
+SEVERITY_OK = 0
+SEVERITY_WATCH = 1        # a symptom above what's typical for the day, or pain getting worse
+SEVERITY_HIGH_PAIN = 2    # pain of 7 or above
+SEVERITY_URGENT = 3       # heavy bleeding, high fever or an urgent checker symptom
+HIGH_PAIN = 7
+
+# Where a daily tip came from
+TIP_PROCEDURE = "procedure"
+TIP_DEFAULT = "default"
+TIP_GENERAL = "general"
+GENERAL_TIP = "Keep up with your recovery routine! Consistency is key at this stage."
+
+# A procedure tip is used for days up to this far from the day it was written for
+TIP_REACH = 2
+
+CheckIn = namedtuple("CheckIn", ["name", "procedure", "day", "pain_level", "symptoms", "emotional_state", "date"])
+Concern = namedtuple("Concern", ["kind", "value"])
+SymptomAssessment = namedtuple("SymptomAssessment", [
+    "procedure", "day", "expected_day", "expected", "comparison", "above", "below", "pain", "peak_swelling"])
+WarningCheck = namedtuple("WarningCheck", ["concerns", "urgent", "watch_for"])
+MoodResponse = namedtuple("MoodResponse", ["feeling", "category", "first_week", "final_results"])
+DailyTip = namedtuple("DailyTip", ["day", "text", "source"])
+ProgressUpdate = namedtuple("ProgressUpdate", [
+    "entry", "previous", "pain_change", "pain_average", "readings", "trend", "worsening"])
+Assessment = namedtuple("Assessment", ["check_in", "symptoms", "warnings", "mood", "tip", "progress"])
+
+
+def _flag(value):
+    """Yes/no from a bool or a text answer such as a CSV cell"""
+    if isinstance(value, str):
+        return value.strip().lower() in ('y', 'yes', 'true', '1')
+    return bool(value)
+
+
+def _level(value):
+    return str(value or '').strip().lower()
+
+
+def build_symptoms(swelling=None, bruising=None, bleeding=None, fever=False, temperature=None,
+                   numbness=False, other=None):
+    """A symptoms dict in the shape the check-in forms and the CLI record"""
+    symptoms = {
+        'swelling': _level(swelling),
+        'bruising': _level(bruising),
+        'bleeding': _level(bleeding) or 'none',
+        'fever': _flag(fever),
+        'numbness': _flag(numbness),
+    }
+    if symptoms['fever'] and temperature:
+        symptoms['temperature'] = str(temperature).strip()
+    if other:
+        symptoms['other'] = str(other)
+    return symptoms
+
+
+def symptom_concerns(symptoms):
+    """Concerns in reported symptoms that need attention whatever the procedure"""
+    concerns = []
+    if _level(symptoms.get('bleeding')) == 'heavy':
+        concerns.append(Concern(HEAVY_BLEEDING, None))
+    if symptoms.get('fever'):
+        temperature = parse_temperature(symptoms.get('temperature'))
+        if temperature is not None and temperature >= FEVER_THRESHOLD:
+            concerns.append(Concern(HIGH_FEVER, temperature))
+    return concerns
+
+
+def pain_category(day, pain_level):
+    """PAIN_* for a pain level at a stage of recovery"""
+    if day <= 3:
+        return PAIN_MANAGEABLE if pain_level <= 6 else PAIN_HIGH_EARLY
+    if pain_level >= 7:
+        return PAIN_HIGH
+    return PAIN_LOW if pain_level <= 3 else PAIN_MODERATE
+
+
+def pain_severity(pain_level):
+    """SEVERITY_HIGH_PAIN for pain of HIGH_PAIN or above, else SEVERITY_OK"""
+    return SEVERITY_HIGH_PAIN if pain_level is not None and pain_level >= HIGH_PAIN else SEVERITY_OK
+
+
+def assessment_severity(assessment):
+    """SEVERITY_* for an Assessment: the most pressing thing it found"""
+    if assessment.warnings.concerns or assessment.warnings.urgent:
+        return SEVERITY_URGENT
+    severity = pain_severity(assessment.check_in.pain_level)
+    if severity:
+        return severity
+    if assessment.symptoms.above or assessment.progress.worsening:
+        return SEVERITY_WATCH
+    return SEVERITY_OK
+
+
+def jsonable(value):
+    """Engine results (namedtuples, nested in lists and dicts) as plain JSON values"""
+    if hasattr(value, "_asdict"):
+        return {k: jsonable(v) for k, v in value._asdict().items()}
+    if isinstance(value, dict):
+        return {str(k): jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonable(v) for v in value]
+    return value
+
+
+def assessment_record(assessment):
+    """An Assessment as the JSON-ready dict stored with its check-in, including its severity"""
+    record = jsonable(assessment._asdict())
+    del record["check_in"]
+    record["severity"] = assessment_severity(assessment)
+    return record
+
+
+def mood_category(feeling):
+    """MOOD_* for a free-text or button mood answer"""
+    feeling = _level(feeling)
+    if feeling in LOW_MOODS:
+        return MOOD_LOW
+    if feeling in OKAY_MOODS:
+        return MOOD_OKAY
+    return MOOD_POSITIVE
+
+
+def assess_progress(entries, day, pain_level, symptoms, emotional_state, today=None, series=None):
+    """Today's progress entry and how it compares with the earlier entries.
+
+    `series` is a DailySeries of pain that already includes today, for
+    callers that keep one up to date; otherwise it's built from the entries.
+    """
+    entry = {
+        'day': day,
+        'pain_level': pain_level,
+        'swelling': symptoms.get('swelling', 'unknown'),
+        'emotional_state': emotional_state,
+        'date': today or datetime.now().strftime("%Y-%m-%d"),
+    }
+    previous = entries[-1] if entries else None
+    pain_change = pain_level - previous.get('pain_level', 0) if previous else None
+    if series is None:
+        series = DailySeries.from_history(entries + [entry], 'pain_level')
+
+    pain_average = rolling_mean(series.values[-7:], 7)[-1] if len(series.values) >= 3 else None
+    trend = describe_trend(series.days, series.values, "Your pain")
+    return ProgressUpdate(entry, previous, pain_change, pain_average, len(series.values),
+                          trend[0] if trend else None, trend[1] if trend else False)
+
+
+class CheckInEngine:
+    """Check-in assessment for one set of procedures and default tips"""
+
+    def __init__(self, procedures, default_tips, triage=None):
+        self.procedures = procedures
+        self.default_tips = default_tips
+        self.comparator = SymptomComparator(procedures)
+        self.triage = triage or SymptomTriage(SYMPTOM_CHECKER)
+        self._names = {info['name'].lower(): key for key, info in procedures.items()}
+        self._tip_days = {key: sorted(info.get('tips', {})) for key, info in procedures.items()}
+        self._early_default_days = sorted(d for d in default_tips if d < 7)
+
+    def procedure_key(self, text):
+        """Procedure key for a key (with spaces or underscores) or a display name"""
+        key = _level(text) or 'other'
+        for candidate in (key, key.replace('_', ' '), key.replace(' ', '_'), self._names.get(key)):
+            if candidate in self.procedures:
+                return candidate
+        if key != 'other':
+            raise ValueError(f"unknown procedure {text!r}")
+        return key
+
+    def stored_procedure(self, text):
+        """procedure_key(), or an unknown procedure in the same snake_case form, for storing"""
+        try:
+            return self.procedure_key(text)
+        except ValueError:
+            return _level(text).replace(' ', '_')
+
+    def parse_checkin(self, raw, today):
+        """CheckIn from one record of a batch file.
+
+        Raises ValueError when a required field is missing or out of range.
+        """
+        name = str(raw.get('name') or '').strip()
+        if not name:
+            raise ValueError("missing name")
+        procedure_key = self.procedure_key(raw.get('procedure'))
+        try:
+            day = int(raw.get('day'))
+            pain_level = int(raw.get('pain_level'))
+        except (TypeError, ValueError):
+            raise ValueError("day and pain_level must be whole numbers") from None
+        if not 1 <= day <= 365:
+            raise ValueError(f"day {day} is outside 1-365")
+        if not 1 <= pain_level <= 10:
+            raise ValueError(f"pain_level {pain_level} is outside 1-10")
+        checked = str(raw.get('date') or '').strip()[:10] or today
+        date.fromisoformat(checked)  # ValueError on a malformed date
+        symptoms = build_symptoms(raw.get('swelling'), raw.get('bruising'), raw.get('bleeding'),
+                                  raw.get('fever'), raw.get('temperature'), raw.get('numbness'),
+                                  raw.get('other'))
+        return CheckIn(name, procedure_key, day, pain_level, symptoms, _level(raw.get('emotional_state')), checked)
+
+    def assess_symptoms(self, procedure_key, day, symptoms, pain_level):
+        """How the reported symptoms and pain compare with what's typical for the day"""
+        procedure = self.procedures.get(procedure_key)
+        expected_day = self.comparator.closest_day(procedure_key, day) if procedure else None
+        if expected_day is None:
+            return SymptomAssessment(procedure_key, day, None, {}, {}, [], [], pain_category(day, pain_level), False)
+
+        comparison = self.comparator.compare(procedure_key, day, dict(symptoms, pain_level=pain_level))
+        return SymptomAssessment(
+            procedure_key, day, expected_day, procedure['normal_symptoms'][expected_day], comparison,
+            [symptom for symptom, result in comparison.items() if result == ABOVE],
+            [symptom for symptom, result in comparison.items() if result == BELOW],
+            pain_category(day, pain_level),
+            bool(procedure.get('peak_swelling_day')) and day == procedure['peak_swelling_day'])
+
+    def check_warnings(self, procedure_key, symptoms):
+        """Concerns, urgent checker symptoms no concern already covers, and warning signs to watch for"""
+        concerns = symptom_concerns(symptoms)
+        covered = {CONCERN_SYMPTOMS.get(concern.kind) for concern in concerns}
+        urgent = [name for name in self.triage.symptoms_in(self.triage.encode_checkin(symptoms), "urgent")
+                  if name not in covered]
+        watch_for = self.procedures.get(procedure_key, {}).get('warning_signs', [])
+        return WarningCheck(concerns, urgent, watch_for)
+
+    def assess_mood(self, feeling, procedure_key, day):
+        """How to meet a mood answer"""
+        category = mood_category(feeling)
+        procedure = self.procedures.get(procedure_key)
+        final_results = procedure['final_results'] if category == MOOD_LOW and procedure else None
+        return MoodResponse(_level(feeling), category, category == MOOD_OKAY and day <= 5, final_results)
+
+    def daily_tip(self, procedure_key, day):
+        """The procedure's tip for the day (or one within TIP_REACH days), else a default"""
+        tips = self.procedures.get(procedure_key, {}).get('tips', {})
+        if day in tips:
+            return DailyTip(day, tips[day], TIP_PROCEDURE)
+        days = self._tip_days.get(procedure_key)
+        if days:
+            closest = min(days, key=lambda x: abs(x - day))
+            if abs(closest - day) <= TIP_REACH:
+                return DailyTip(closest, tips[closest], TIP_PROCEDURE)
+
+        if day in self.default_tips:
+            return DailyTip(day, self.default_tips[day], TIP_DEFAULT)
+        if day < 7 and self._early_default_days:
+            closest = min(self._early_default_days, key=lambda x: abs(x - day))
+            return DailyTip(closest, self.default_tips[closest], TIP_DEFAULT)
+        return DailyTip(day, GENERAL_TIP, TIP_GENERAL)
+
+    def assess(self, check_in, entries, series=None):
+        """Everything about one check-in; `entries` are the person's earlier progress entries"""
+        return Assessment(
+            check_in,
+            self.assess_symptoms(check_in.procedure, check_in.day, check_in.symptoms, check_in.pain_level),
+            self.check_warnings(check_in.procedure, check_in.symptoms),
+            self.assess_mood(check_in.emotional_state, check_in.procedure, check_in.day),
+            self.daily_tip(check_in.procedure, check_in.day),
+            assess_progress(entries, check_in.day, check_in.pain_level, check_in.symptoms,
+                           check_in.emotional_state, check_in.date, series))
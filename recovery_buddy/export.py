@@ -0,0 +1,260 @@
+"""
+Streaming data export.
+
+Exports are written record by record to a temp file rather than built as one
+big string, so a long recovery history never exists twice in memory and the
+page only has to hand the finished file to the download button. Formats:
+
+- json:  the recovery_buddy_export_*.json layout the dashboard has always used
+- jsonl: one record per line, each tagged with its section in "type"
+- csv:   a zip with one CSV per history section
+- pdf:   a printable summary to bring to a surgeon follow-up
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import textwrap
+import time
+import zipfile
+
+# format -> (label, file extension, MIME type)
+EXPORT_FORMATS = {
+    "json": ("JSON", ".json", "application/json"),
+    "jsonl": ("JSON Lines", ".jsonl", "application/x-ndjson"),
+    "csv": ("CSV (zip)", ".zip", "application/zip"),
+    "pdf": ("PDF summary", ".pdf", "application/pdf"),
+}
+
+# Sections holding {key: text} rather than a list of records
+KEYED_SECTIONS = ("journal_entries",)
+
+# Temp file names, and how long a prepared export may wait to be downloaded
+EXPORT_PREFIX = "recovery_buddy_export_"
+EXPORT_MAX_AGE = 60 * 60
+
+
+def _records(name, items):
+    """Section items as flat dicts, whether the section is a list or keyed text"""
+    if name in KEYED_SECTIONS:
+        for key, text in items.items():
+            yield {"key": key, "text": text}
+    else:
+        for item in items:
+            yield item if isinstance(item, dict) else {"value": item}
+
+
+def write_json(f, header, sections):
+    """The dashboard's JSON export, written one record per line"""
+    f.write("{")
+    first = True
+    for key, value in header.items():
+        f.write(("" if first else ",") + f"\n  {json.dumps(key)}: {json.dumps(value)}")
+        first = False
+    for name, items in sections.items():
+        f.write(("" if first else ",") + f"\n  {json.dumps(name)}: ")
+        first = False
+        keyed = name in KEYED_SECTIONS
+        f.write("{" if keyed else "[")
+        pairs = items.items() if keyed else enumerate(items)
+        count = 0
+        for key, value in pairs:
+            prefix = f"{json.dumps(key)}: " if keyed else ""
+            f.write(("," if count else "") + f"\n    {prefix}{json.dumps(value)}")
+            count += 1
+        if count:
+            f.write("\n  ")
+        f.write("}" if keyed else "]")
+    f.write("\n}\n")
+
+
+def write_jsonl(f, header, sections):
+    """Header line followed by one line per record"""
+    f.write(json.dumps({"type": "export", **header}) + "\n")
+    for name, items in sections.items():
+        for record in _records(name, items):
+            f.write(json.dumps({"type": name, **record}) + "\n")
+
+
+def _csv_cell(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def write_csv_zip(f, header, sections):
+    """Zip with a summary CSV plus one CSV per section"""
+    with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as archive:
+        with archive.open("summary.csv", "w") as raw:
+            out = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            writer = csv.writer(out)
+            writer.writerow(["field", "value"])
+            for key, value in header.items():
+                if isinstance(value, dict):
+                    for sub_key, sub_value in value.items():
+                        writer.writerow([f"{key}.{sub_key}", _csv_cell(sub_value)])
+                else:
+                    writer.writerow([key, _csv_cell(value)])
+            out.flush()
+            out.detach()
+
+        for name, items in sections.items():
+            # Columns are the union of keys, in first-seen order
+            columns = {}
+            for record in _records(name, items):
+                columns.update(dict.fromkeys(record))
+            with archive.open(f"{name}.csv", "w") as raw:
+                out = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+                writer = csv.writer(out)
+                writer.writerow(list(columns))
+                for record in _records(name, items):
+                    writer.writerow([_csv_cell(record.get(column, "")) for column in columns])
+                out.flush()
+                out.detach()
+
+
+class PdfWriter:
+    """Minimal text-only PDF writer that flushes each page as it fills"""
+
+    PAGE_WIDTH = 612  # US Letter, in points
+    PAGE_HEIGHT = 792
+    MARGIN = 54
+    STYLES = {"title": ("F2", 18, 26), "heading": ("F2", 12, 20), "body": ("F1", 10, 14)}
+
+    # Object ids reserved up front; pages and their content streams follow
+    CATALOG, PAGES, FONT, FONT_BOLD = 1, 2, 3, 4
+
+    def __init__(self, f):
+        self.f = f
+        self.offsets = {}
+        self.page_ids = []
+        self.next_id = 5
+        self.commands = []
+        self.y = self.PAGE_HEIGHT - self.MARGIN
+        self.f.write(b"%PDF-1.4\n")
+
+    def _object(self, obj_id, body):
+        self.offsets[obj_id] = self.f.tell()
+        self.f.write(b"%d 0 obj\n" % obj_id + body + b"\nendobj\n")
+
+    @staticmethod
+    def _escape(text):
+        data = text.encode("cp1252", "ignore")
+        return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+    def line(self, text="", style="body"):
+        """Add one line of text, starting a new page when this one is full"""
+        font, size, leading = self.STYLES[style]
+        if self.y - leading < self.MARGIN:
+            self._flush_page()
+        self.y -= leading
+        self.commands.append(b"BT /%s %d Tf %d %d Td (%s) Tj ET" % (
+            font.encode(), size, self.MARGIN, self.y, self._escape(text)))
+
+    def paragraph(self, text, width=95):
+        for wrapped in textwrap.wrap(text, width) or [""]:
+            self.line(wrapped)
+
+    def _flush_page(self):
+        stream = b"\n".join(self.commands)
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self._object(content_id, b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        self._object(page_id, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] "
+                              b"/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> /Contents %d 0 R >>" % (
+                                  self.PAGES, self.PAGE_WIDTH, self.PAGE_HEIGHT,
+                                  self.FONT, self.FONT_BOLD, content_id))
+        self.page_ids.append(page_id)
+        self.commands = []
+        self.y = self.PAGE_HEIGHT - self.MARGIN
+
+    def close(self):
+        """Write the last page, shared objects, cross-reference table and trailer"""
+        if self.commands or not self.page_ids:
+            self._flush_page()
+        encoding = b" /Encoding /WinAnsiEncoding"
+        self._object(self.FONT, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica%s >>" % encoding)
+        self._object(self.FONT_BOLD, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold%s >>" % encoding)
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self.page_ids)
+        self._object(self.PAGES, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.page_ids)))
+        self._object(self.CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % self.PAGES)
+
+        xref_offset = self.f.tell()
+        size = self.next_id
+        self.f.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for obj_id in range(1, size):
+            self.f.write(b"%010d 00000 n \n" % self.offsets[obj_id])
+        self.f.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            size, self.CATALOG, xref_offset))
+
+
+def write_pdf(f, header, sections):
+    """Printable summary: patient details, stats, then each history section"""
+    pdf = PdfWriter(f)
+    pdf.line("Recovery Buddy - Recovery Summary", "title")
+    pdf.line(f"Exported {header.get('exported_at', '')[:16].replace('T', ' ')}")
+    for title, key in (("Patient", "user_info"), ("Progress", "stats")):
+        pdf.line(title, "heading")
+        for field, value in header.get(key, {}).items():
+            pdf.line(f"{field.replace('_', ' ').capitalize()}: {value}")
+
+    pdf.line("Pain history", "heading")
+    for entry in sections.get("pain_history", []):
+        notes = f" - {entry['notes']}" if entry.get("notes") else ""
+        pdf.paragraph(f"{entry.get('date', '')}  Day {entry.get('day', '?')}  Pain {entry.get('level', '?')}/10{notes}")
+
+    pdf.line("Check-ins", "heading")
+    for entry in sections.get("check_in_history", []):
+        details = ", ".join(f"{k}: {_csv_cell(v)}" for k, v in entry.items() if k not in ("date", "day"))
+        pdf.paragraph(f"{entry.get('date', '')}  Day {entry.get('day', '?')}  {details}")
+
+    pdf.line("Medications", "heading")
+    for medication in sections.get("medications", []):
+        if isinstance(medication, dict):
+            medication = ", ".join(str(v) for v in medication.values() if v)
+        pdf.paragraph(str(medication))
+
+    pdf.line("Journal", "heading")
+    for key, text in sections.get("journal_entries", {}).items():
+        if text and text.strip():
+            pdf.paragraph(f"Day {key.split('_')[-1]}: {text.strip()}")
+    pdf.close()
+
+
+WRITERS = {"json": write_json, "jsonl": write_jsonl, "csv": write_csv_zip, "pdf": write_pdf}
+BINARY_FORMATS = ("csv", "pdf")
+
+
+def create_export(fmt, header, sections, directory=None):
+    """Stream an export to a new temp file and return its path"""
+    _, ext, _ = EXPORT_FORMATS[fmt]
+    fd, path = tempfile.mkstemp(prefix=EXPORT_PREFIX, suffix=ext, dir=directory)
+    try:
+        if fmt in BINARY_FORMATS:
+            with os.fdopen(fd, "wb") as f:
+                WRITERS[fmt](f, header, sections)
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                WRITERS[fmt](f, header, sections)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def prune_exports(directory=None, max_age=EXPORT_MAX_AGE, now=None):
+    """Delete export temp files older than max_age seconds, e.g. from sessions that ended; returns how many"""
+    directory = directory or tempfile.gettempdir()
+    cutoff = (now or time.time()) - max_age
+    removed = 0
+    for entry in os.scandir(directory):
+        if entry.name.startswith(EXPORT_PREFIX) and entry.is_file():
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                pass  # removed by its own session meanwhile
+    return removed
@@ -0,0 +1,20 @@
+"""
+Small file helpers shared by the stores.
+"""
+
+import os
+import tempfile
+
+
+def atomic_write(path, data):
+    """Write bytes to path via a temp file so readers never see partial files"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,216 @@
+"""
+Recovery journal store.
+
+Each entry is saved to its own file, so writing one entry never rewrites the
+others. An append-only index log records every change with the entry's
+recovery day, date, preview and search tokens; on start-up it is replayed
+into a per-person list ordered by recovery day plus an inverted full-text
+index. Listing a page of history slices that list and reads only that
+page's entry files, so it costs O(page size) however long the journal is.
+The log is compacted once it holds more stale lines than live entries.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime
+
+from recovery_buddy.fileio import atomic_write
+
+PREVIEW_CHARS = 120
+_TOKENS = re.compile(r"[a-z0-9']+")
+
+
+def journal_key(name, day):
+    """Key used for an entry since journals lived in session state"""
+    return f"journal_{name}_{day}"
+
+
+def parse_journal_key(key):
+    """(name, day) from a journal_{name}_{day} key, or None if it isn't one"""
+    if not isinstance(key, str) or not key.startswith("journal_"):
+        return None
+    name, _, day = key[len("journal_"):].rpartition("_")
+    try:
+        return name, int(day)
+    except ValueError:
+        return None
+
+
+def tokenize(text):
+    """Lower-cased search tokens"""
+    return set(_TOKENS.findall(text.lower()))
+
+
+def preview(text, limit=PREVIEW_CHARS):
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit].rstrip() + "..."
+
+
+class JournalStore:
+    """Per-entry files with a day-ordered index and a full-text index"""
+
+    def __init__(self, root):
+        self.root = root
+        self.log_path = os.path.join(root, "index.log")
+        self._lock = threading.Lock()
+        self._order = {}     # name -> sorted [(day, key)]
+        self._meta = {}      # key -> {"name", "day", "date", "preview"}
+        self._postings = {}  # token -> {key}
+        self._tokens = {}    # key -> tokens, for unindexing
+        self._log_lines = 0
+        os.makedirs(os.path.join(root, "entries"), exist_ok=True)
+        self._replay()
+
+    def _entry_path(self, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, "entries", digest + ".json")
+
+    # --- index maintenance ---
+
+    def _index(self, key, meta, tokens):
+        self._unindex(key)
+        self._meta[key] = meta
+        insort(self._order.setdefault(meta["name"], []), (meta["day"], key))
+        self._tokens[key] = tokens
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(key)
+
+    def _unindex(self, key):
+        meta = self._meta.pop(key, None)
+        if meta is None:
+            return
+        order = self._order[meta["name"]]
+        del order[bisect_left(order, (meta["day"], key))]
+        for token in self._tokens.pop(key, ()):
+            keys = self._postings[token]
+            keys.discard(key)
+            if not keys:
+                del self._postings[token]
+
+    def _replay(self):
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    op = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a torn final line from a crash mid-append
+                self._log_lines += 1
+                if op["op"] == "put":
+                    meta = {field: op[field] for field in ("name", "day", "date", "preview")}
+                    self._index(op["key"], meta, set(op["tokens"]))
+                else:
+                    self._unindex(op["key"])
+
+    def _append_log(self, op):
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(op) + "\n")
+        self._log_lines += 1
+        if self._log_lines > 2 * len(self._meta) + 64:
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the log with one line per live entry"""
+        lines = [json.dumps({"op": "put", "key": key, **meta, "tokens": sorted(self._tokens[key])})
+                 for key, meta in self._meta.items()]
+        atomic_write(self.log_path, ("\n".join(lines) + "\n" if lines else "").encode("utf-8"))
+        self._log_lines = len(lines)
+
+    # --- writes ---
+
+    def save(self, name, day, text, now=None):
+        """Save (or, for blank text, delete) one day's entry"""
+        key = journal_key(name, day)
+        with self._lock:
+            if not text.strip():
+                if key in self._meta:
+                    os.remove(self._entry_path(key))
+                    self._unindex(key)
+                    self._append_log({"op": "delete", "key": key})
+                return
+            date = (now or datetime.now()).strftime('%Y-%m-%d')
+            atomic_write(self._entry_path(key), json.dumps(
+                {"key": key, "name": name, "day": day, "date": date, "text": text}).encode("utf-8"))
+            meta = {"name": name, "day": day, "date": date, "preview": preview(text)}
+            tokens = tokenize(text)
+            self._index(key, meta, tokens)
+            self._append_log({"op": "put", "key": key, **meta, "tokens": sorted(tokens)})
+
+    def import_entries(self, entries):
+        """Add {journal_{name}_{day}: text} entries that aren't stored yet; returns how many"""
+        added = 0
+        for key, text in entries.items():
+            parsed = parse_journal_key(key)
+            if parsed and isinstance(text, str) and text.strip() and key not in self._meta:
+                self.save(parsed[0], parsed[1], text)
+                added += 1
+        return added
+
+    def clear(self, name):
+        """Delete every entry of one person's journal; returns how many there were"""
+        with self._lock:
+            keys = [key for _, key in self._order.get(name, ())]
+            for key in keys:
+                os.remove(self._entry_path(key))
+                self._unindex(key)
+                self._append_log({"op": "delete", "key": key})
+            self._order.pop(name, None)
+            return len(keys)
+
+    # --- reads ---
+
+    def __contains__(self, key):
+        return key in self._meta
+
+    def count(self, name):
+        return len(self._order.get(name, ()))
+
+    def get(self, name, day):
+        """Text of one day's entry, or '' if there isn't one"""
+        key = journal_key(name, day)
+        if key not in self._meta:
+            return ""
+        with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+            return json.load(f)["text"]
+
+    def _entries(self, keys, with_text):
+        entries = []
+        for key in keys:
+            entry = dict(self._meta[key], key=key)
+            if with_text:
+                with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                    entry["text"] = json.load(f)["text"]
+            entries.append(entry)
+        return entries
+
+    def page(self, name, page=0, page_size=5, with_text=True):
+        """One page of entries, newest recovery day first"""
+        order = self._order.get(name, [])
+        end = len(order) - page * page_size
+        start = max(end - page_size, 0)
+        keys = [key for _, key in reversed(order[start:max(end, 0)])]
+        return self._entries(keys, with_text)
+
+    def search(self, name, query, page=0, page_size=5, with_text=True):
+        """(one page of entries containing every query word, total matches), newest first"""
+        tokens = tokenize(query)
+        if not tokens:
+            return self.page(name, page, page_size, with_text), self.count(name)
+        postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+        matches = set.intersection(*postings) if postings[0] else set()
+        matches = sorted((self._meta[key]["day"], key) for key in matches if self._meta[key]["name"] == name)
+        end = len(matches) - page * page_size
+        start = max(end - page_size, 0)
+        keys = [key for _, key in reversed(matches[start:max(end, 0)])]
+        return self._entries(keys, with_text), len(matches)
+
+    def texts(self, name):
+        """{journal key: text} for every entry, in day order (used by exports)"""
+        return {entry["key"]: entry["text"] for entry in self._entries([k for _, k in self._order.get(name, [])], True)}
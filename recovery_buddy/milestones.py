@@ -0,0 +1,85 @@
+"""
+Milestone countdown engine.
+
+Turns a procedure and surgery date into a sorted schedule once, then answers
+"what's next" and "how many days left" with bisect lookups. Schedules are
+cached so the dashboard, welcome page and reminders all share the same one.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+
+def parse_surgery_date(surgery_date):
+    """Parse a 'YYYY-MM-DD' surgery date, returning None when not set"""
+    if not surgery_date:
+        return None
+    if isinstance(surgery_date, str):
+        return datetime.strptime(surgery_date, '%Y-%m-%d').date()
+    return surgery_date
+
+
+class MilestoneSchedule:
+    """Milestones for one procedure, sorted by recovery day"""
+
+    def __init__(self, milestones, surgery_date=None):
+        self.milestones = tuple(sorted(milestones, key=lambda m: m["days"]))
+        self.days = [m["days"] for m in self.milestones]
+        self.surgery_date = surgery_date
+
+    def completed(self, day):
+        """Milestones reached on or before the given recovery day"""
+        return self.milestones[:bisect_right(self.days, day)]
+
+    def upcoming(self, day):
+        """Milestones still ahead of the given recovery day"""
+        return self.milestones[bisect_right(self.days, day):]
+
+    def next_milestone(self, day):
+        """The next milestone after the given day, or None when all are done"""
+        index = bisect_right(self.days, day)
+        if index < len(self.milestones):
+            return self.milestones[index]
+        return None
+
+    def days_remaining(self, day):
+        """Days until the next milestone, or None when all are done"""
+        index = bisect_right(self.days, day)
+        if index < len(self.days):
+            return self.days[index] - day
+        return None
+
+    def day_on(self, date):
+        """Recovery day for a calendar date (surgery day is day 1)"""
+        if self.surgery_date is None:
+            return 0
+        return (date - self.surgery_date).days + 1
+
+    def due_date(self, milestone):
+        """Calendar date a milestone falls on, if the surgery date is known"""
+        if self.surgery_date is None:
+            return None
+        return self.surgery_date + timedelta(days=milestone["days"] - 1)
+
+
+class MilestoneIndex:
+    """Cached milestone schedules keyed by (procedure, surgery date)"""
+
+    def __init__(self, procedure_milestones, recovery_milestones=None, cache_size=1024):
+        self.procedure_milestones = procedure_milestones
+        self.recovery_milestones = recovery_milestones or {}
+        self._recovery_days = sorted(self.recovery_milestones)
+        self.schedule = lru_cache(maxsize=cache_size)(self._build_schedule)
+
+    def _build_schedule(self, procedure, surgery_date=None):
+        """Build the schedule for a procedure; falls back to the default milestones"""
+        milestones = self.procedure_milestones.get(procedure, self.procedure_milestones["default"])
+        return MilestoneSchedule(milestones, parse_surgery_date(surgery_date))
+
+    def recovery_milestone(self, day):
+        """Most recent general recovery milestone reached by the given day"""
+        index = bisect_right(self._recovery_days, day)
+        if index == 0:
+            return None
+        return self.recovery_milestones[self._recovery_days[index - 1]]
@@ -0,0 +1,88 @@
+"""
+Photo comparison renderer.
+
+Every stored photo has a precomputed frame cropped to the same size, so a
+side-by-side view or a timelapse across all recorded days is just a paste of
+ready frames. Rendered comparisons are written once under the photo store,
+named by a hash of the photos (and labels) they show, so flipping back and
+forth through a long photo history serves files that already exist.
+Each render is linked to the photos it shows, so deleting any of them
+deletes the render too.
+"""
+
+import hashlib
+import io
+import os
+
+from PIL import Image, ImageDraw, features
+
+from recovery_buddy.fileio import atomic_write
+from recovery_buddy.photos import FRAME_SIZE, VARIANT_EXT, VARIANT_FORMAT, VARIANT_QUALITY
+
+# Animated WebP is much smaller than GIF when Pillow supports it
+ANIMATION_FORMAT = "WEBP" if features.check("webp_anim") else "GIF"
+ANIMATION_EXT = ".webp" if ANIMATION_FORMAT == "WEBP" else ".gif"
+
+LABEL_HEIGHT = 36
+LABEL_BACKGROUND = (245, 240, 232)
+LABEL_COLOR = (45, 58, 45)
+GAP = 8
+
+
+def comparison_key(kind, digests, labels):
+    """Cache key for a rendered comparison of the given photos"""
+    parts = [kind] + [f"{digest}:{label}" for digest, label in zip(digests, labels)]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class PhotoComparer:
+    """Side-by-side and timelapse renders built from precomputed frames"""
+
+    def __init__(self, store):
+        self.store = store
+        self.root = os.path.join(store.root, "comparisons")
+
+    def _cache_path(self, kind, digests, labels, ext):
+        return os.path.join(self.root, comparison_key(kind, digests, labels) + ext)
+
+    def _write(self, path, data, digests):
+        atomic_write(path, data)
+        for digest in set(digests):
+            self.store.link(digest, path)
+
+    def _labelled_frame(self, digest, label):
+        """A stored frame with its caption band underneath"""
+        width, height = FRAME_SIZE
+        canvas = Image.new("RGB", (width, height + LABEL_HEIGHT), LABEL_BACKGROUND)
+        with Image.open(self.store.variant(digest, "frame")) as frame:
+            canvas.paste(frame.convert("RGB"), (0, 0))
+        ImageDraw.Draw(canvas).text((12, height + 10), label, fill=LABEL_COLOR)
+        return canvas
+
+    def side_by_side(self, digests, labels):
+        """Path to the photos laid out left to right, each captioned"""
+        path = self._cache_path("side", digests, labels, VARIANT_EXT)
+        if not os.path.exists(path):
+            frames = [self._labelled_frame(d, label) for d, label in zip(digests, labels)]
+            width = sum(f.width for f in frames) + GAP * (len(frames) - 1)
+            sheet = Image.new("RGB", (width, frames[0].height), LABEL_BACKGROUND)
+            x = 0
+            for frame in frames:
+                sheet.paste(frame, (x, 0))
+                x += frame.width + GAP
+            out = io.BytesIO()
+            sheet.save(out, VARIANT_FORMAT, quality=VARIANT_QUALITY)
+            self._write(path, out.getvalue(), digests)
+        return path
+
+    def timelapse(self, digests, labels, frame_ms=700):
+        """Path to an animation stepping through the photos in order"""
+        path = self._cache_path(f"timelapse:{frame_ms}", digests, labels, ANIMATION_EXT)
+        if not os.path.exists(path):
+            frames = [self._labelled_frame(d, label) for d, label in zip(digests, labels)]
+            out = io.BytesIO()
+            options = {"quality": VARIANT_QUALITY} if ANIMATION_FORMAT == "WEBP" else {}
+            frames[0].save(out, ANIMATION_FORMAT, save_all=True, append_images=frames[1:],
+                           duration=frame_ms, loop=0, **options)
+            self._write(path, out.getvalue(), digests)
+        return path
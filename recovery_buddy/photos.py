@@ -0,0 +1,258 @@
+"""
+Photo progress store.
+
+Uploaded photos are written once to content-addressed files (named by the
+SHA-256 of the uploaded bytes), so identical uploads share one file and
+nothing is kept in session memory but the hash. Downscaled WebP variants are
+generated the first time a photo is stored, and the app shows those instead
+of the full-resolution original.
+
+Uploads are streamed to disk in chunks and rejected on size or dimensions
+before any pixels are decoded. Decoding, orientation fixes, EXIF stripping
+and variant generation then run in a small worker pool, so the page that
+accepted the upload doesn't wait on a 12 MP photo.
+
+Files derived from a photo elsewhere (comparison renders) are recorded
+against its hash with link(), so delete() removes the original, every
+variant and everything built from it.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from recovery_buddy.fileio import atomic_write
+
+# Ingest limits, checked before the image is decoded
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+MAX_EDGE = 10000
+MAX_PIXELS = 50_000_000
+CHUNK_SIZE = 1024 * 1024
+
+# Photo processing status
+READY = "ready"
+PROCESSING = "processing"
+FAILED = "failed"
+
+# Downscaled variants: name -> longest edge in pixels
+VARIANTS = {
+    "thumb": 480,
+    "display": 1280,
+}
+
+# Aligned comparison frames: every photo cropped to the same width x height
+FRAME_SIZE = (480, 640)
+
+# WebP when Pillow was built with it, JPEG otherwise
+VARIANT_FORMAT = "WEBP" if features.check("webp") else "JPEG"
+VARIANT_EXT = ".webp" if VARIANT_FORMAT == "WEBP" else ".jpg"
+VARIANT_QUALITY = 80
+
+
+def photo_hash(data):
+    """Content address for a photo's bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def render_frame(image):
+    """Encode a centred crop of an image at the shared comparison frame size"""
+    frame = ImageOps.fit(image.convert("RGB"), FRAME_SIZE)
+    out = io.BytesIO()
+    frame.save(out, VARIANT_FORMAT, quality=VARIANT_QUALITY)
+    return out.getvalue()
+
+
+class PhotoRejected(ValueError):
+    """Upload refused before decoding; the message is safe to show the user"""
+
+
+def render_variant(image, max_edge):
+    """Encode a downscaled copy of an image in the variant format"""
+    variant = image.copy()
+    variant.thumbnail((max_edge, max_edge))
+    if variant.mode not in ("RGB", "RGBA") or VARIANT_FORMAT == "JPEG":
+        variant = variant.convert("RGB")
+    out = io.BytesIO()
+    variant.save(out, VARIANT_FORMAT, quality=VARIANT_QUALITY)
+    return out.getvalue()
+
+
+def encode_original(image, source_format):
+    """Re-encode an oriented image without its EXIF block (GPS, device, time)"""
+    out = io.BytesIO()
+    icc_profile = image.info.get("icc_profile")
+    if source_format == "PNG":
+        image.save(out, "PNG", icc_profile=icc_profile)
+    else:
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(out, "JPEG", quality=95, icc_profile=icc_profile)
+    return out.getvalue()
+
+
+class PhotoStore:
+    """Content-addressed originals plus precomputed downscaled variants"""
+
+    def __init__(self, root, workers=2):
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="photo-ingest")
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def original_path(self, digest):
+        return os.path.join(self.root, "originals", digest[:2], digest)
+
+    def variant_path(self, digest, variant="thumb"):
+        return os.path.join(self.root, variant, digest[:2], digest + VARIANT_EXT)
+
+    def links_path(self, digest):
+        return os.path.join(self.root, "links", digest[:2], digest)
+
+    def exists(self, digest):
+        return os.path.exists(self.original_path(digest))
+
+    def put(self, data):
+        """Store a photo's bytes and its variants, returning the photo hash"""
+        digest = self.ingest(io.BytesIO(data))
+        self.wait(digest)
+        return digest
+
+    def _spool(self, fileobj):
+        """Copy an upload to a temp file in chunks, hashing as it goes"""
+        incoming = os.path.join(self.root, "incoming")
+        os.makedirs(incoming, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=incoming, suffix=".upload")
+        sha = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                while True:
+                    chunk = fileobj.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > MAX_UPLOAD_BYTES:
+                        raise PhotoRejected(f"Photos must be under {MAX_UPLOAD_BYTES // (1024 * 1024)} MB.")
+                    sha.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return sha.hexdigest(), tmp_path
+
+    def _check_header(self, tmp_path):
+        """Validate format and dimensions from the header only, without decoding pixels"""
+        try:
+            with Image.open(tmp_path) as image:
+                width, height = image.size
+                source_format = image.format
+        except Image.DecompressionBombError:
+            # Pillow refuses headers far beyond MAX_PIXELS before we get to compare them
+            raise PhotoRejected(f"Photos can be at most {MAX_EDGE} pixels on a side.")
+        except (UnidentifiedImageError, OSError):
+            raise PhotoRejected("That file doesn't look like a photo we can read.")
+        if max(width, height) > MAX_EDGE or width * height > MAX_PIXELS:
+            raise PhotoRejected(f"Photos can be at most {MAX_EDGE} pixels on a side.")
+        return source_format
+
+    def ingest(self, fileobj):
+        """Stream an upload to disk and queue it for processing, returning its hash.
+
+        Raises PhotoRejected when the upload is too large or unreadable. The
+        photo is usable once status() reports READY.
+        """
+        digest, tmp_path = self._spool(fileobj)
+        try:
+            source_format = self._check_header(tmp_path)
+        except PhotoRejected:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            if self.exists(digest) or digest in self._pending:
+                os.unlink(tmp_path)
+                return digest
+            self._pending[digest] = self._executor.submit(self._process, digest, tmp_path, source_format)
+        return digest
+
+    def _process(self, digest, tmp_path, source_format):
+        """Worker: decode, fix orientation, drop EXIF and write variants then the original"""
+        try:
+            with Image.open(tmp_path) as image:
+                image = ImageOps.exif_transpose(image)
+                self.put_image(digest, image)
+                atomic_write(self.original_path(digest), encode_original(image, source_format))
+        finally:
+            os.unlink(tmp_path)
+
+    def status(self, digest):
+        """READY, PROCESSING or FAILED for an ingested photo"""
+        with self._lock:
+            future = self._pending.get(digest)
+            if future is not None:
+                if not future.done():
+                    return PROCESSING
+                del self._pending[digest]
+                if future.exception() is not None:
+                    return FAILED
+        return READY if self.exists(digest) else FAILED
+
+    def wait(self, digest, timeout=None):
+        """Block until a queued photo is processed, re-raising any worker error"""
+        with self._lock:
+            future = self._pending.get(digest)
+        if future is not None:
+            future.result(timeout)
+
+    def put_image(self, digest, image):
+        """Write every downscaled variant and the comparison frame of a decoded image"""
+        for variant, max_edge in VARIANTS.items():
+            path = self.variant_path(digest, variant)
+            if not os.path.exists(path):
+                atomic_write(path, render_variant(image, max_edge))
+        path = self.variant_path(digest, "frame")
+        if not os.path.exists(path):
+            atomic_write(path, render_frame(image))
+
+    def variant(self, digest, variant="thumb"):
+        """Path to a variant ("thumb", "display" or "frame"), regenerating it if missing"""
+        path = self.variant_path(digest, variant)
+        if not os.path.exists(path):
+            with Image.open(self.original_path(digest)) as image:
+                data = render_frame(image) if variant == "frame" else render_variant(image, VARIANTS[variant])
+            atomic_write(path, data)
+        return path
+
+    def link(self, digest, path):
+        """Record a file built from a photo so delete() removes it too"""
+        links = self.links_path(digest)
+        os.makedirs(os.path.dirname(links), exist_ok=True)
+        with self._lock, open(links, 'a', encoding='utf-8') as f:
+            f.write(path + "\n")
+
+    def delete(self, digests):
+        """Remove photos: their originals, variants, frames and every linked file"""
+        for digest in digests:
+            try:
+                self.wait(digest)
+            except Exception:
+                pass  # a failed upload may still have left variants behind
+            paths = [self.original_path(digest), self.variant_path(digest, "frame")]
+            paths += [self.variant_path(digest, variant) for variant in VARIANTS]
+            with self._lock:
+                links = self.links_path(digest)
+                try:
+                    with open(links, encoding='utf-8') as f:
+                        paths += f.read().splitlines()
+                except FileNotFoundError:
+                    pass
+                paths.append(links)
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
@@ -0,0 +1,161 @@
+"""
+Opt-in render profiler.
+
+Times named sections of a rerun (each page, progress saves and loads, CSS
+injection and embedded HTML components) into fixed-bucket histograms shared
+by every session of the server. When profiling is off, Profiler.time()
+returns a shared no-op context manager, so the instrumented code pays one
+attribute check per section.
+
+Histograms can be read as rows for the app's performance page or rendered
+in the Prometheus text exposition format, either directly or from a small
+background HTTP server on /metrics.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+
+# Upper bounds (seconds) of the histogram buckets; the last bucket is +Inf
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC = "recovery_buddy_section_seconds"
+METRIC_HELP = "Time spent in a page, progress save/load, CSS injection or HTML component"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_OFF = nullcontext()
+
+
+class Histogram:
+    """Counts of observations per bucket, plus their sum"""
+
+    __slots__ = ("counts", "total", "count", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """Estimate of the q-quantile, interpolated within its bucket"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                # The slowest observation caps the bucket's upper bound
+                upper = min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+                lower = min(BUCKETS[i - 1] if i else 0.0, upper)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Profiler:
+    """Section timings aggregated into histograms keyed by (kind, name)"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.started = time.time()
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, kind, name, seconds):
+        with self._lock:
+            histogram = self._histograms.get((kind, name))
+            if histogram is None:
+                histogram = self._histograms[(kind, name)] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def _timer(self, kind, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # st.rerun() and st.stop() unwind through here too; that time still counts
+            self.observe(kind, name, time.perf_counter() - start)
+
+    def time(self, kind, name):
+        """Context manager timing one section (a no-op while profiling is off)"""
+        if not self.enabled:
+            return _OFF
+        return self._timer(kind, name)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.started = time.time()
+
+    @staticmethod
+    def _row(kind, name, h):
+        return {"kind": kind, "name": name, "count": h.count, "mean_ms": h.total / h.count * 1e3,
+                "p50_ms": h.quantile(0.5) * 1e3, "p95_ms": h.quantile(0.95) * 1e3,
+                "p99_ms": h.quantile(0.99) * 1e3, "max_ms": h.max * 1e3}
+
+    def rows(self):
+        """One summary dict per section, slowest p95 first"""
+        with self._lock:
+            rows = [self._row(kind, name, h) for (kind, name), h in self._histograms.items()]
+        return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+    def row(self, kind, name):
+        """Summary dict for one section, or None if it hasn't been timed"""
+        with self._lock:
+            histogram = self._histograms.get((kind, name))
+            return self._row(kind, name, histogram) if histogram else None
+
+    def prometheus_text(self):
+        """All histograms in the Prometheus text exposition format"""
+        lines = [f"# HELP {METRIC} {METRIC_HELP}", f"# TYPE {METRIC} histogram"]
+        with self._lock:
+            items = sorted((key, list(h.counts), h.total, h.count) for key, h in self._histograms.items())
+        for (kind, name), counts, total, count in items:
+            labels = f'kind="{_label(kind)}",name="{_label(name)}"'
+            cumulative = 0
+            for bound, n in zip(BUCKETS + ("+Inf",), counts):
+                cumulative += n
+                lines.append(f'{METRIC}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{METRIC}_sum{{{labels}}} {total:.6f}")
+            lines.append(f"{METRIC}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(profiler, port, host="127.0.0.1"):
+    """Serve profiler.prometheus_text() on http://host:port/metrics from a daemon thread"""
+    # Imported here: http.server is slow to import and most runs never serve metrics
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = profiler.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # scrapes every few seconds would flood the server log
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="recovery-buddy-metrics", daemon=True).start()
+    return server
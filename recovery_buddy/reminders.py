@@ -0,0 +1,308 @@
+"""
+Reminder scheduler.
+
+Medication and check-in reminders used to be passive: the app showed them
+only while someone had the page open. ReminderScheduler holds every
+person's reminders in one process and delivers each one when it's due from
+a background thread.
+
+Timers live in a binary heap of (due, sequence, id). Adding one is a single
+push (O(log n)). Cancelling only drops the reminder from a dict; its heap
+entry is skipped when it reaches the top (lazy cancellation), and the heap
+is rebuilt once stale entries outnumber live ones, so memory stays
+proportional to the live timers even with heavy churn. A repeating reminder
+is pushed again for its next time after each delivery.
+
+Delivery goes through channels by name. EmailChannel and WebPushChannel are
+stubs: they build the email or notification payload and keep it in an
+outbox instead of contacting a mail server or push service.
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import deque, namedtuple
+from datetime import datetime, time as clock_time, timedelta
+from email.message import EmailMessage
+
+logger = logging.getLogger("recovery_buddy")
+
+DAY = 24 * 60 * 60
+
+# What a reminder is for
+MEDICATION = "medication"
+CHECK_IN = "check_in"
+MILESTONE = "milestone"
+REMINDER_KINDS = (MEDICATION, CHECK_IN, MILESTONE)
+
+TITLES = {
+    MEDICATION: "💊 Time for your medication",
+    CHECK_IN: "🌸 Time for your daily check-in",
+    MILESTONE: "🎉 A recovery milestone is coming up",
+}
+
+OUTBOX_SIZE = 1000
+
+# Heap entries that may be stale before the heap is rebuilt
+COMPACT_SLACK = 64
+
+Reminder = namedtuple("Reminder", ["id", "name", "kind", "message", "channel", "address", "due", "every", "until"])
+
+
+def parse_time_of_day(text):
+    """(hour, minute) for '8:00 AM', '2:30 PM' or '14:30'; ValueError otherwise"""
+    clock = str(text).strip().upper()
+    suffix = clock[-2:] if clock.endswith(("AM", "PM")) else None
+    hour, _, minute = (clock[:-2] if suffix else clock).strip().partition(":")
+    try:
+        hour, minute = int(hour), int(minute or 0)
+    except ValueError:
+        raise ValueError(f"not a time of day: {text!r}") from None
+    if suffix:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"not a time of day: {text!r}")
+        hour = hour % 12 + (12 if suffix == "PM" else 0)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"not a time of day: {text!r}")
+    return hour, minute
+
+
+def next_at(hour, minute, now):
+    """Epoch seconds of the first hour:minute (local time) after `now`"""
+    moment = datetime.fromtimestamp(now).replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if moment.timestamp() <= now:
+        moment += timedelta(days=1)
+    return moment.timestamp()
+
+
+def next_occurrence(due, every, now):
+    """The first of due, due + every, due + 2 * every, ... at or after `now`"""
+    if every and due < now:
+        due += -(-(now - due) // every) * every
+    return due
+
+
+def milestone_times(schedule, day, hour=9):
+    """(due, message) at `hour` on the date of each milestone still ahead of `day`.
+
+    `schedule` is a MilestoneSchedule with a surgery date; without one there
+    are no dates to remind on.
+    """
+    if schedule.surgery_date is None:
+        return []
+    return [(datetime.combine(schedule.due_date(m), clock_time(hour)).timestamp(),
+             f"{m['icon']} Day {m['days']}: {m['milestone']}") for m in schedule.upcoming(day)]
+
+
+class TimerHeap:
+    """Timer ids by due time: O(log n) push and pop, O(1) lazy cancel"""
+
+    def __init__(self):
+        self._heap = []
+        self._live = {}  # id -> sequence number of its current heap entry
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._live)
+
+    def __contains__(self, timer_id):
+        return timer_id in self._live
+
+    def push(self, timer_id, due):
+        """Add a timer, or move it if it's already set"""
+        sequence = next(self._sequence)
+        self._live[timer_id] = sequence
+        heapq.heappush(self._heap, (due, sequence, timer_id))
+        self._compact()
+
+    def cancel(self, timer_id):
+        """Forget a timer; returns False when it wasn't set"""
+        if self._live.pop(timer_id, None) is None:
+            return False
+        self._compact()
+        return True
+
+    def _is_live(self, entry):
+        return self._live.get(entry[2]) == entry[1]
+
+    def _compact(self):
+        if len(self._heap) > 2 * len(self._live) + COMPACT_SLACK:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def peek(self):
+        """(due, id) of the earliest timer, or None"""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][::2] if self._heap else None
+
+    def pop_due(self, now):
+        """Ids of every timer due at or before `now`, earliest first, removed from the heap"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                del self._live[entry[2]]
+                due.append(entry[2])
+        return due
+
+
+class EmailChannel:
+    """Email stub: each reminder becomes an EmailMessage kept in the outbox"""
+
+    def __init__(self, sender="reminders@recoverybuddy.app", outbox_size=OUTBOX_SIZE):
+        self.sender = sender
+        self.outbox = deque(maxlen=outbox_size)
+
+    def send(self, reminder):
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = reminder.address
+        message["Subject"] = TITLES.get(reminder.kind, "Recovery Buddy reminder")
+        message.set_content(f"Hi {reminder.name},\n\n{reminder.message}\n\n💚 Recovery Buddy")
+        self.outbox.append(message)
+        logger.info("Email reminder %s (%s) queued", reminder.id, reminder.kind)
+
+
+class WebPushChannel:
+    """Web push stub: each reminder becomes the JSON payload a service worker would show"""
+
+    def __init__(self, outbox_size=OUTBOX_SIZE):
+        self.outbox = deque(maxlen=outbox_size)
+
+    def send(self, reminder):
+        payload = json.dumps({"title": TITLES.get(reminder.kind, "Recovery Buddy reminder"), "body": reminder.message,
+                              "tag": f"{reminder.kind}-{reminder.id}"})
+        self.outbox.append((reminder.address, payload))
+        logger.info("Web push reminder %s (%s) queued", reminder.id, reminder.kind)
+
+
+class ReminderScheduler:
+    """Every person's reminders, delivered from a background thread when due"""
+
+    def __init__(self, channels, clock=time.time):
+        self.channels = channels
+        self.clock = clock
+        self.delivered = 0
+        self.failed = 0
+        self._timers = TimerHeap()
+        self._reminders = {}
+        self._by_name = {}
+        self._ids = itertools.count(1)
+        self._wake = threading.Condition()
+        self._thread = None
+        self._stopping = False
+
+    def __len__(self):
+        return len(self._reminders)
+
+    def add(self, name, kind, message, channel, address, due, every=None, until=None, reminder_id=None):
+        """Schedule a reminder at `due` (epoch seconds), repeating every `every` seconds until `until`.
+
+        A repeating reminder whose first time has passed starts at its next
+        occurrence. Returns the reminder's id (the one given, or a new one),
+        or None when it would never fire again.
+        """
+        if channel not in self.channels:
+            raise ValueError(f"unknown channel {channel!r}")
+        due = next_occurrence(due, every, self.clock())
+        if until is not None and due > until:
+            return None
+        with self._wake:
+            if reminder_id is None:
+                reminder_id = next(self._ids)
+            self._forget(reminder_id)
+            self._reminders[reminder_id] = Reminder(reminder_id, name, kind, message, channel, address, due, every,
+                                                    until)
+            self._by_name.setdefault(name, set()).add(reminder_id)
+            self._timers.push(reminder_id, due)
+            self._wake.notify()
+        return reminder_id
+
+    def _forget(self, reminder_id):
+        reminder = self._reminders.pop(reminder_id, None)
+        if reminder is None:
+            return False
+        ids = self._by_name[reminder.name]
+        ids.discard(reminder_id)
+        if not ids:
+            del self._by_name[reminder.name]
+        self._timers.cancel(reminder_id)
+        return True
+
+    def cancel(self, reminder_id):
+        """Drop a reminder; returns False when there was none"""
+        with self._wake:
+            return self._forget(reminder_id)
+
+    def cancel_name(self, name):
+        """Drop every reminder for a person; returns how many there were"""
+        with self._wake:
+            ids = list(self._by_name.get(name, ()))
+            for reminder_id in ids:
+                self._forget(reminder_id)
+            return len(ids)
+
+    def get(self, reminder_id):
+        return self._reminders.get(reminder_id)
+
+    def reminders(self, name):
+        """A person's reminders, soonest first"""
+        with self._wake:
+            return sorted((self._reminders[i] for i in self._by_name.get(name, ())), key=lambda r: r.due)
+
+    def run_due(self, now=None):
+        """Deliver every reminder due by `now` and re-arm the repeating ones; returns how many were due"""
+        now = self.clock() if now is None else now
+        with self._wake:
+            due = []
+            for reminder_id in self._timers.pop_due(now):
+                reminder = self._reminders[reminder_id]
+                due.append(reminder)
+                following = None
+                if reminder.every:
+                    following = next_occurrence(reminder.due + reminder.every, reminder.every, now)
+                if following is not None and (reminder.until is None or following <= reminder.until):
+                    self._reminders[reminder_id] = reminder._replace(due=following)
+                    self._timers.push(reminder_id, following)
+                else:
+                    self._forget(reminder_id)
+        for reminder in due:
+            try:
+                self.channels[reminder.channel].send(reminder)
+                self.delivered += 1
+            except Exception:
+                self.failed += 1
+                logger.exception("Reminder %s could not be delivered over %s", reminder.id, reminder.channel)
+        return len(due)
+
+    def _run(self):
+        while True:
+            with self._wake:
+                while not self._stopping:
+                    earliest = self._timers.peek()
+                    wait = None if earliest is None else earliest[0] - self.clock()
+                    if wait is not None and wait <= 0:
+                        break
+                    self._wake.wait(wait)
+                if self._stopping:
+                    return
+            self.run_due()
+
+    def start(self):
+        """Deliver reminders from a daemon thread until stop()"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="recovery-buddy-reminders", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        with self._wake:
+            self._stopping = True
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,317 @@
+"""
+Import / restore of saved recovery data.
+
+Accepts the dashboard's recovery_buddy_export_*.json (and .jsonl) files, the
+app's own progress file, and the CLI's progress file with its per-name
+"entries" lists. The file is read once as a stream: records are validated
+and de-duplicated as they are parsed, so a multi-year export is never held as
+both raw text and parsed data. Nothing is changed until the whole file has
+validated; the merge then updates the progress data in memory and the caller
+saves it with a single write. Journal entries go straight into the journal
+store when one is given, de-duplicated against the entries it already holds.
+"""
+
+import json
+from datetime import datetime
+
+from recovery_buddy.journal import parse_journal_key
+
+CHUNK_SIZE = 64 * 1024
+
+# Largest single record we'll buffer while looking for its end
+MAX_RECORD_CHARS = 1024 * 1024
+
+# History lists that can be restored, and the field(s) that identify a record.
+# Records are merged by date: dates already recorded locally are kept as-is.
+LIST_SECTIONS = {
+    "pain_history": ("date",),
+    "check_in_history": ("date",),
+    "mood_history": ("date", "time"),
+    "medications": None,  # plain strings, matched by value
+}
+
+# Sections stored as {key: text}
+KEYED_SECTIONS = ("journal_entries",)
+
+# Export header fields; everything else at the top level is a section or a
+# CLI per-name record
+HEADER_FIELDS = ("exported_at", "app_version", "user_info", "stats")
+
+
+class RestoreError(ValueError):
+    """The file can't be restored; the message is safe to show the user"""
+
+
+class _JsonStream:
+    """Pull parser for one JSON document, read from a text file in chunks"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or '' at end of file"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise RestoreError(f"This file isn't a Recovery Buddy export (expected '{char}').")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if len(self.buf) - self.pos > MAX_RECORD_CHARS or not self._fill():
+                    raise RestoreError("This file is damaged or incomplete and can't be imported.")
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _items(self, open_char, close_char):
+        self.expect(open_char)
+        if self.peek() == close_char:
+            self.pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            self.pos += 1
+            if char == close_char:
+                return
+            if char != ",":
+                raise RestoreError("This file is damaged or incomplete and can't be imported.")
+
+    def members(self):
+        """Yield each key of an object; the caller consumes the value in between"""
+        for _ in self._items("{", "}"):
+            key = self.value()
+            if not isinstance(key, str):
+                raise RestoreError("This file is damaged or incomplete and can't be imported.")
+            self.expect(":")
+            yield key
+
+    def elements(self):
+        """Yield once per array element; the caller consumes each element"""
+        yield from self._items("[", "]")
+
+
+def _valid_date(value):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def validate_record(section, record):
+    """Reason a history record is invalid, or None if it's fine"""
+    if section == "medications":
+        return None if isinstance(record, str) and record.strip() else "medications must be text"
+    if not isinstance(record, dict):
+        return "records must be objects"
+    if not _valid_date(record.get("date")):
+        return f"invalid date {record.get('date')!r}"
+    if "day" in record and not isinstance(record["day"], int):
+        return f"invalid recovery day {record['day']!r}"
+    for field in ("level", "pain_level"):
+        level = record.get(field)
+        if level is not None and not (isinstance(level, int) and 0 <= level <= 10):
+            return f"invalid pain level {level!r}"
+    return None
+
+
+def _merge_key(section, record):
+    fields = LIST_SECTIONS[section]
+    if fields is None:
+        return record.strip()
+    return tuple(record.get(field) for field in fields)
+
+
+class Restore:
+    """Records from one import file that aren't already in the progress data"""
+
+    def __init__(self, progress_data, journal_store=None):
+        self.progress_data = progress_data
+        self.journal_store = journal_store
+        self.header = {}
+        self.sections = {name: {} for name in LIST_SECTIONS}
+        self.journal = {}
+        self.people = {}  # CLI name -> {"procedure": key, "entries": {date: entry}}
+        self.skipped = 0
+        self._known_entries = {}
+        self._known = {name: {_merge_key(name, r) for r in progress_data.get(name, []) if validate_record(name, r) is None}
+                       for name in LIST_SECTIONS}
+
+    def add(self, section, record):
+        """Validate one record and keep it unless its date is already recorded"""
+        problem = validate_record(section, record)
+        if problem:
+            raise RestoreError(f"Couldn't import {section.replace('_', ' ')}: {problem}.")
+        key = _merge_key(section, record)
+        if key in self._known[section] or key in self.sections[section]:
+            self.skipped += 1
+        else:
+            self.sections[section][key] = record
+
+    def add_journal(self, key, text):
+        parsed = parse_journal_key(key)
+        if parsed is None or not parsed[0]:
+            raise RestoreError(f"Couldn't import journal entries: invalid entry key {key!r}.")
+        if not isinstance(text, str):
+            raise RestoreError("Couldn't import journal entries: entries must be text.")
+        known = self.progress_data.get("journal_entries", {}) if self.journal_store is None else self.journal_store
+        if key in known or key in self.journal or not text.strip():
+            self.skipped += 1
+        else:
+            self.journal[key] = text
+
+    def add_entry(self, name, procedure, entry):
+        """One entry from a CLI/app per-name "entries" list"""
+        problem = validate_record("entries", entry)
+        if problem:
+            raise RestoreError(f"Couldn't import check-ins for {name}: {problem}.")
+        person = self.people.setdefault(name, {"procedure": procedure, "entries": {}})
+        known = self._known_entries.get(name)
+        if known is None:
+            existing = self.progress_data.get(name)
+            entries = existing.get("entries", []) if isinstance(existing, dict) else []
+            known = self._known_entries[name] = {e.get("date") for e in entries if isinstance(e, dict)}
+        if entry["date"] in known or entry["date"] in person["entries"]:
+            self.skipped += 1
+        else:
+            person["entries"][entry["date"]] = entry
+
+    def read_json(self, f):
+        """Stream an export, app progress file or CLI progress file"""
+        stream = _JsonStream(f)
+        for key in stream.members():
+            if key in LIST_SECTIONS:
+                for _ in stream.elements():
+                    self.add(key, stream.value())
+            elif key in KEYED_SECTIONS:
+                for entry_key in stream.members():
+                    self.add_journal(entry_key, stream.value())
+            elif key not in HEADER_FIELDS and stream.peek() == "{":
+                self._read_person(stream, key)
+            else:
+                self.header[key] = stream.value()
+        if stream.peek():
+            raise RestoreError("This file is damaged or incomplete and can't be imported.")
+        return self
+
+    def _read_person(self, stream, name):
+        """A per-name {"procedure": ..., "entries": [...]} record"""
+        procedure = None
+        for field in stream.members():
+            if field == "entries":
+                for _ in stream.elements():
+                    self.add_entry(name, procedure, stream.value())
+            else:
+                value = stream.value()
+                if field == "procedure":
+                    procedure = value
+                    if name in self.people:
+                        self.people[name]["procedure"] = value
+
+    def read_jsonl(self, f):
+        """Stream a JSON Lines export, one record per line"""
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                raise RestoreError(f"Line {line_number} of this file is damaged and can't be imported.")
+            section = record.pop("type", None) if isinstance(record, dict) else None
+            if section == "export":
+                self.header.update(record)
+            elif section in LIST_SECTIONS:
+                self.add(section, record.get("value", record) if section == "medications" else record)
+            elif section in KEYED_SECTIONS:
+                self.add_journal(record.get("key"), record.get("text"))
+            else:
+                raise RestoreError(f"Line {line_number} isn't a Recovery Buddy export record.")
+        return self
+
+    def counts(self):
+        """New records per section"""
+        counts = {name: len(records) for name, records in self.sections.items() if records}
+        if self.journal:
+            counts["journal_entries"] = len(self.journal)
+        entries = sum(len(person["entries"]) for person in self.people.values())
+        if entries:
+            counts["entries"] = entries
+        return counts
+
+    def apply(self):
+        """Merge the new records into the progress data, each list kept in date order.
+
+        Returns new-record counts per section; the journal count is the
+        number of entries the journal store actually added.
+        """
+        data = self.progress_data
+        counts = self.counts()
+        for name, records in self.sections.items():
+            if records:
+                merged = data.get(name, []) + list(records.values())
+                if LIST_SECTIONS[name] is not None:
+                    merged.sort(key=lambda r: tuple(str(r.get(f, "")) for f in LIST_SECTIONS[name]))
+                data[name] = merged
+        if self.journal and self.journal_store is None:
+            data["journal_entries"] = {**data.get("journal_entries", {}), **self.journal}
+        elif self.journal:
+            counts["journal_entries"] = self.journal_store.import_entries(self.journal)
+            if not counts["journal_entries"]:
+                del counts["journal_entries"]
+        for name, person in self.people.items():
+            existing = data.get(name)
+            if not isinstance(existing, dict):
+                existing = data[name] = {"procedure": person["procedure"], "entries": []}
+            existing["entries"] = sorted(existing.get("entries", []) + list(person["entries"].values()),
+                                         key=lambda e: e.get("date", ""))
+
+        if set(counts) - {"journal_entries"}:
+            # Running stats are rebuilt from the merged history
+            data.pop("stats", None)
+
+        user_info = self.header.get("user_info") or {}
+        if not data.get("name") and user_info.get("name") not in (None, "", "Not set"):
+            data["name"] = user_info["name"]
+        if not data.get("surgery_date") and _valid_date(user_info.get("surgery_date")):
+            data["surgery_date"] = user_info["surgery_date"]
+        return counts
+
+
+def restore(f, progress_data, jsonl=False, journal_store=None):
+    """Validate an import file and merge it into progress_data (and journal_store, if given).
+
+    Returns new-record counts per section. Raises RestoreError, leaving
+    progress_data untouched, if any part of the file is invalid.
+    """
+    plan = Restore(progress_data, journal_store)
+    if jsonl:
+        plan.read_jsonl(f)
+    else:
+        plan.read_json(f)
+    return plan.apply()
@@ -0,0 +1,163 @@
+"""
+Typed per-session state.
+
+The app used to run a long chain of "if 'x' not in st.session_state" checks
+on every rerun. RecoveryState is created once per session instead, so a rerun
+only has to look up one key. Sections that are rarely needed (mood history,
+medications, emergency contacts, today's self-care, photos) are read from the
+saved progress data the first time they are used.
+"""
+
+import random
+from datetime import datetime
+
+from recovery_buddy.stats import RecoveryStats
+
+DEFAULT_CELEBRATION = "🎈 Balloons"
+
+# Placeholder for lazily loaded sections that haven't been read yet
+_UNLOADED = object()
+
+
+class RecoveryState:
+    """Everything the app keeps for one browser session"""
+
+    __slots__ = (
+        "step", "user_data", "progress_data", "dark_mode", "checklist",
+        "celebration_shown", "celebration_style",
+        "disclaimer_accepted", "pain_history", "check_in_history",
+        "is_returning_user", "daily_tip_index",
+        "affirmation_index", "show_export", "show_clear_confirm",
+        "content_generation", "content_step", "photo_upload", "export_file", "check_in",
+        "staff_signed_in",
+        "_mood_history", "_self_care_today", "_medications", "_emergency_contacts",
+        "_photos", "_stats",
+    )
+
+    def __init__(self, progress_data, tip_count, affirmation_count, now=None):
+        now = now or datetime.now()
+        self.step = 'welcome'
+        self.user_data = {}
+        self.progress_data = progress_data
+        self.dark_mode = progress_data.get('dark_mode', False)
+        self.checklist = {}
+        self.celebration_shown = False
+        self.celebration_style = DEFAULT_CELEBRATION
+        self.disclaimer_accepted = False
+        self.pain_history = progress_data.get('pain_history', [])  # List of {date, level, notes}
+        self.check_in_history = progress_data.get('check_in_history', [])  # List of check-ins
+        self.is_returning_user = bool(progress_data.get('name') or progress_data.get('procedure'))
+        # Use day of year for consistent daily tips
+        self.daily_tip_index = now.timetuple().tm_yday % tip_count
+        self.affirmation_index = random.randint(0, affirmation_count - 1)
+        self.show_export = False
+        self.check_in = None  # CheckInDraft for the check-in in progress
+        self.export_file = None  # (format, temp file path) of the last prepared export
+        self.show_clear_confirm = False
+        self.content_generation = None
+        self.content_step = None
+        self.photo_upload = None  # (upload id, photo hash or None, rejection message)
+        self.staff_signed_in = False  # entered the staff console's access code
+        self._mood_history = _UNLOADED
+        self._self_care_today = _UNLOADED
+        self._medications = _UNLOADED
+        self._emergency_contacts = _UNLOADED
+        self._photos = _UNLOADED
+        self._stats = _UNLOADED
+
+    @property
+    def mood_history(self):
+        if self._mood_history is _UNLOADED:
+            self._mood_history = self.progress_data.get('mood_history', [])
+        return self._mood_history
+
+    @mood_history.setter
+    def mood_history(self, value):
+        self._mood_history = value
+
+    @property
+    def self_care_today(self):
+        if self._self_care_today is _UNLOADED:
+            # Reset daily if it's a new day
+            today = datetime.now().strftime('%Y-%m-%d')
+            if self.progress_data.get('self_care_date', '') != today:
+                self._self_care_today = {}
+            else:
+                self._self_care_today = self.progress_data.get('self_care_today', {})
+        return self._self_care_today
+
+    @self_care_today.setter
+    def self_care_today(self, value):
+        self._self_care_today = value
+
+    @property
+    def medications(self):
+        if self._medications is _UNLOADED:
+            self._medications = self.progress_data.get('medications', [])
+        return self._medications
+
+    @medications.setter
+    def medications(self, value):
+        self._medications = value
+
+    @property
+    def emergency_contacts(self):
+        if self._emergency_contacts is _UNLOADED:
+            self._emergency_contacts = self.progress_data.get('emergency_contacts', {})
+        return self._emergency_contacts
+
+    @emergency_contacts.setter
+    def emergency_contacts(self, value):
+        self._emergency_contacts = value
+
+    @property
+    def photos(self):
+        """Photo hashes in the photo store, keyed by photo_{name}_{day}"""
+        if self._photos is _UNLOADED:
+            self._photos = self.progress_data.get('photos', {})
+        return self._photos
+
+    @photos.setter
+    def photos(self, value):
+        self._photos = value
+
+    @property
+    def stats(self):
+        """Running statistics, rebuilt from history the first time for older saves"""
+        if self._stats is _UNLOADED:
+            saved = self.progress_data.get('stats')
+            if saved:
+                self._stats = RecoveryStats.from_dict(saved)
+            else:
+                self._stats = RecoveryStats.from_history(self.progress_data)
+        return self._stats
+
+    def store_stats(self):
+        """Copy the running statistics into progress_data ahead of a save"""
+        self.progress_data['stats'] = self.stats.to_dict()
+
+    def reload(self):
+        """Re-read saved sections after progress_data was merged into (an import or a check-in)"""
+        data = self.progress_data
+        self.pain_history = data.get('pain_history', [])
+        self.check_in_history = data.get('check_in_history', [])
+        self.is_returning_user = bool(data.get('name') or data.get('procedure'))
+        self._mood_history = _UNLOADED
+        self._medications = _UNLOADED
+        self._photos = _UNLOADED
+        self._stats = _UNLOADED
+
+    def clear_data(self):
+        """Forget all recovery data (used by the 'Clear All Data' buttons)"""
+        self.progress_data = {}
+        self.user_data = {}
+        self.checklist = {}
+        self.pain_history = []
+        self.check_in_history = []
+        self.is_returning_user = False
+        self._mood_history = _UNLOADED
+        self._self_care_today = _UNLOADED
+        self._medications = _UNLOADED
+        self._emergency_contacts = _UNLOADED
+        self._photos = _UNLOADED
+        self._stats = _UNLOADED
@@ -0,0 +1,224 @@
+"""
+Incremental recovery statistics.
+
+Streak, totals, rolling 7/30-day pain and mood averages and check-in
+completion rates are updated as each event is recorded instead of being
+recounted from the full history on every render. Per-day sums for the last
+30 days are kept in buckets with running window totals, so recording an
+event and reading a window are both O(1) (amortized over the days that age
+out). The whole thing round-trips through to_dict() and is saved with the
+rest of the progress data.
+"""
+
+from datetime import date, datetime
+
+# Mood labels used by the mood tracker and check-ins, scored 1 (low) to 5
+MOOD_SCORES = {"struggling": 1, "down": 2, "okay": 3, "good": 4, "great": 5}
+
+WINDOWS = (7, 30)
+
+# Bucket layout: [pain_sum, pain_count, mood_sum, mood_count, checked_in]
+_PAIN_SUM, _PAIN_COUNT, _MOOD_SUM, _MOOD_COUNT, _CHECKED_IN = range(5)
+
+
+def day_ordinal(day):
+    """Day ordinal for a date, datetime or 'YYYY-MM-DD' string"""
+    if isinstance(day, str):
+        day = datetime.strptime(day[:10], '%Y-%m-%d').date()
+    elif isinstance(day, datetime):
+        day = day.date()
+    return day.toordinal()
+
+
+def mood_score(label):
+    """Numeric score for a mood label, or None if it isn't one we know"""
+    if label is None:
+        return None
+    return MOOD_SCORES.get(str(label).split()[-1].strip().lower())
+
+
+class RecoveryStats:
+    """Running statistics for one person's recovery"""
+
+    def __init__(self):
+        self.streak = 0
+        self.best_streak = 0
+        self.last_check_in = None  # ordinal of the latest check-in day
+        self.total_checkins = 0
+        self.total_pain_entries = 0
+        self.total_mood_entries = 0
+        self.first_day = None
+        self._buckets = {}  # ordinal -> bucket, last 30 days only
+        self._newest = None
+        self._windows = {w: [0, 0, 0, 0, 0] for w in WINDOWS}
+
+    # --- window bookkeeping ---
+
+    def _advance(self, ordinal):
+        """Slide the windows forward to end on the given day"""
+        if self._newest is not None and ordinal <= self._newest:
+            return
+        if self._newest is not None:
+            longest = max(WINDOWS)
+            # Each day leaves each window exactly once, so this is amortized O(1)
+            for window in WINDOWS:
+                for old in range(self._newest - window + 1, min(ordinal - window, self._newest) + 1):
+                    bucket = self._buckets.get(old)
+                    if bucket:
+                        totals = self._windows[window]
+                        for i in range(5):
+                            totals[i] -= bucket[i]
+            for old in [d for d in self._buckets if d <= ordinal - longest]:
+                del self._buckets[old]
+        self._newest = ordinal
+
+    def _add(self, ordinal, field, value):
+        """Add to one field of a day's bucket and every window that contains it"""
+        self._advance(ordinal)
+        if ordinal <= self._newest - max(WINDOWS):
+            return
+        bucket = self._buckets.setdefault(ordinal, [0, 0, 0, 0, 0])
+        bucket[field] += value
+        for window, totals in self._windows.items():
+            if ordinal > self._newest - window:
+                totals[field] += value
+
+    # --- events ---
+
+    def record_check_in(self, day, pain=None, mood=None):
+        """A completed daily check-in"""
+        ordinal = day_ordinal(day)
+        self.total_checkins += 1
+        if self.first_day is None or ordinal < self.first_day:
+            self.first_day = ordinal
+        if self.last_check_in is None or ordinal > self.last_check_in:
+            if self.last_check_in is not None and ordinal == self.last_check_in + 1:
+                self.streak += 1
+            else:
+                self.streak = 1
+            self.best_streak = max(self.best_streak, self.streak)
+            self.last_check_in = ordinal
+        self._advance(ordinal)
+        bucket = self._buckets.get(ordinal)
+        if not bucket or not bucket[_CHECKED_IN]:
+            self._add(ordinal, _CHECKED_IN, 1)
+        if pain is not None:
+            self.record_pain(day, pain)
+        if mood is not None:
+            self.record_mood(day, mood)
+
+    def record_pain(self, day, level):
+        self.total_pain_entries += 1
+        ordinal = day_ordinal(day)
+        self._add(ordinal, _PAIN_SUM, level)
+        self._add(ordinal, _PAIN_COUNT, 1)
+
+    def record_mood(self, day, label):
+        score = mood_score(label)
+        if score is None:
+            return
+        self.total_mood_entries += 1
+        ordinal = day_ordinal(day)
+        self._add(ordinal, _MOOD_SUM, score)
+        self._add(ordinal, _MOOD_COUNT, 1)
+
+    # --- reads ---
+
+    def current_streak(self, today=None):
+        """Streak as of today: it survives until a full day is missed"""
+        if self.last_check_in is None:
+            return 0
+        today = day_ordinal(today or date.today())
+        return self.streak if today - self.last_check_in <= 1 else 0
+
+    def last_check_in_date(self):
+        """Latest check-in as 'YYYY-MM-DD', or None before the first one"""
+        if self.last_check_in is None:
+            return None
+        return date.fromordinal(self.last_check_in).strftime('%Y-%m-%d')
+
+    def _window(self, window, today):
+        self._advance(day_ordinal(today or date.today()))
+        return self._windows[window]
+
+    def pain_average(self, window=7, today=None):
+        totals = self._window(window, today)
+        return totals[_PAIN_SUM] / totals[_PAIN_COUNT] if totals[_PAIN_COUNT] else None
+
+    def mood_average(self, window=7, today=None):
+        totals = self._window(window, today)
+        return totals[_MOOD_SUM] / totals[_MOOD_COUNT] if totals[_MOOD_COUNT] else None
+
+    def completion_rate(self, window=7, today=None):
+        """Share of days in the window with a check-in, counting only days since the first one"""
+        if self.first_day is None:
+            return None
+        totals = self._window(window, today)
+        days = min(window, self._newest - self.first_day + 1)
+        return totals[_CHECKED_IN] / days if days > 0 else None
+
+    # --- persistence ---
+
+    def to_dict(self):
+        return {
+            "streak": self.streak,
+            "best_streak": self.best_streak,
+            "last_check_in": self.last_check_in,
+            "total_checkins": self.total_checkins,
+            "total_pain_entries": self.total_pain_entries,
+            "total_mood_entries": self.total_mood_entries,
+            "first_day": self.first_day,
+            "newest": self._newest,
+            "buckets": {str(day): bucket for day, bucket in self._buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        for field in ("streak", "best_streak", "last_check_in", "total_checkins",
+                      "total_pain_entries", "total_mood_entries", "first_day"):
+            setattr(stats, field, data.get(field, getattr(stats, field)))
+        stats._newest = data.get("newest")
+        stats._buckets = {int(day): list(bucket) for day, bucket in data.get("buckets", {}).items()}
+        if stats._newest is not None:
+            for window, totals in stats._windows.items():
+                for day, bucket in stats._buckets.items():
+                    if day > stats._newest - window:
+                        for i in range(5):
+                            totals[i] += bucket[i]
+        return stats
+
+    @classmethod
+    def from_history(cls, progress_data):
+        """Rebuild from saved history, for data saved before stats were kept"""
+        name = progress_data.get('name')
+        person = progress_data.get(name) if name else None
+        entries = person.get('entries', []) if isinstance(person, dict) else []
+
+        # One check-in per day, from the per-name entries and the check-in history
+        check_ins = {}
+        for entry in list(entries) + list(progress_data.get('check_in_history', [])):
+            if isinstance(entry, dict) and entry.get('date'):
+                check_ins[entry['date']] = entry
+        pain = {}
+        for entry in progress_data.get('pain_history', []):
+            if entry.get('date') and isinstance(entry.get('level'), (int, float)):
+                pain[entry['date']] = entry['level']
+        for day, entry in check_ins.items():
+            if day not in pain and isinstance(entry.get('pain_level'), (int, float)):
+                pain[day] = entry['pain_level']
+
+        events = [(day, 0, entry.get('mood', entry.get('emotional_state'))) for day, entry in check_ins.items()]
+        events += [(day, 1, level) for day, level in pain.items()]
+        events += [(entry.get('date'), 2, entry.get('mood')) for entry in progress_data.get('mood_history', [])
+                   if entry.get('date')]
+
+        stats = cls()
+        for day, kind, value in sorted(events, key=lambda e: (e[0], e[1])):
+            if kind == 0:
+                stats.record_check_in(day, mood=value)
+            elif kind == 1:
+                stats.record_pain(day, value)
+            else:
+                stats.record_mood(day, value)
+        return stats
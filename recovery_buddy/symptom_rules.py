@@ -0,0 +1,173 @@
+"""
+Expected-vs-reported symptom comparator.
+
+The free-text expectations in PROCEDURES ("moderate to severe (5-8)",
+"peak", "starting to fade", ...) are parsed once into numeric ranges per
+procedure and day. Comparing a reported symptom is then a table lookup and
+two integer comparisons, so whole recovery histories can be checked cheaply.
+"""
+
+import re
+
+# Results of comparing a reported symptom against what's typical
+ABOVE = "above"
+WITHIN = "within"
+BELOW = "below"
+
+# Reported swelling/bruising levels as used by the check-in forms
+SEVERITY_SCALE = {"none": 0, "mild": 1, "moderate": 2, "severe": 3}
+
+# Symptoms we can compare, and the check-in field holding the reported value
+COMPARED_SYMPTOMS = {"pain": "pain_level", "swelling": "swelling", "bruising": "bruising"}
+
+# Severity words on the 0-3 swelling/bruising scale
+GRADE_RANGES = {
+    "none": (0, 0),
+    "minimal": (0, 1),
+    "mild": (1, 1),
+    "moderate": (2, 2),
+    "significant": (2, 3),
+    "severe": (3, 3),
+}
+
+# Healing-phase phrases, checked in order when no severity word is present
+PHASE_RANGES = [
+    ("much improved", (0, 1)),
+    ("much better", (0, 1)),
+    ("mostly", (0, 1)),
+    ("resolving", (0, 1)),
+    ("possible", (0, 1)),
+    ("resolved", (0, 0)),
+    ("gone", (0, 0)),
+    ("peak", (2, 3)),
+    ("worst", (2, 3)),
+    ("dark", (2, 3)),
+    ("increas", (1, 3)),
+    ("develop", (1, 3)),
+    ("spreading", (1, 3)),
+    ("improv", (1, 2)),
+    ("decreas", (1, 2)),
+    ("fad", (1, 2)),
+    ("yellowing", (1, 2)),
+    ("noticeably", (1, 2)),
+]
+
+# Severity words on the 1-10 pain scale, used when no "(a-b)" range is given
+PAIN_RANGES = {
+    "none": (0, 1),
+    "minimal": (1, 2),
+    "mild": (1, 3),
+    "moderate": (3, 6),
+    "severe": (6, 10),
+}
+
+_PAIN_NUMBERS = re.compile(r"\((\d+)\s*-\s*(\d+)\)")
+_WORDS = re.compile(r"[a-z]+")
+
+
+def _union(ranges):
+    """Smallest range covering all the given ranges"""
+    return (min(lo for lo, _ in ranges), max(hi for _, hi in ranges))
+
+
+def parse_pain(text):
+    """Parse a pain expectation like 'moderate (4-6)' into a (low, high) range"""
+    match = _PAIN_NUMBERS.search(text)
+    if match:
+        return (int(match.group(1)), int(match.group(2)))
+    ranges = [PAIN_RANGES[w] for w in _WORDS.findall(text.lower()) if w in PAIN_RANGES]
+    return _union(ranges) if ranges else None
+
+
+def parse_severity(text):
+    """Parse a swelling/bruising expectation into a range on the 0-3 scale"""
+    text = text.lower()
+    ranges = [GRADE_RANGES[w] for w in _WORDS.findall(text) if w in GRADE_RANGES]
+    if ranges:
+        low, high = _union(ranges)
+    else:
+        for phrase, phase_range in PHASE_RANGES:
+            if phrase in text:
+                low, high = phase_range
+                break
+        else:
+            return None
+    if "if present" in text:
+        low = 0
+    return (low, high)
+
+
+def compile_expectations(expected):
+    """Numeric ranges for one day's expected symptoms"""
+    compiled = {}
+    for symptom in COMPARED_SYMPTOMS:
+        if symptom in expected:
+            parse = parse_pain if symptom == "pain" else parse_severity
+            parsed = parse(expected[symptom])
+            if parsed:
+                compiled[symptom] = parsed
+    return compiled
+
+
+def reported_level(symptom, value):
+    """Numeric level for a reported symptom value, or None if it can't be read"""
+    if value is None:
+        return None
+    if symptom == "pain":
+        return value if isinstance(value, int) else None
+    return SEVERITY_SCALE.get(str(value).strip().lower())
+
+
+class SymptomComparator:
+    """Compiled expected-symptom ranges for every procedure and recovery day"""
+
+    def __init__(self, procedures, max_day=365):
+        self.max_day = max_day
+        self._ranges = {}
+        self._closest_day = {}
+        for key, procedure in procedures.items():
+            normal = procedure.get('normal_symptoms', {})
+            if not normal:
+                continue
+            available = sorted(normal)
+            self._ranges[key] = {d: compile_expectations(normal[d]) for d in available}
+            # Closest documented day for every day of recovery
+            self._closest_day[key] = [min(available, key=lambda x: abs(x - day)) for day in range(max_day + 1)]
+
+    def closest_day(self, procedure, day):
+        """Closest day with documented expectations, or None for unknown procedures"""
+        days = self._closest_day.get(procedure)
+        if days is None:
+            return None
+        return days[min(max(day, 0), self.max_day)]
+
+    def expected(self, procedure, day):
+        """Expected (low, high) ranges by symptom for a procedure and day"""
+        closest = self.closest_day(procedure, day)
+        if closest is None:
+            return {}
+        return self._ranges[procedure][closest]
+
+    def compare(self, procedure, day, reported):
+        """Compare reported symptoms against what's typical.
+
+        Returns {symptom: ABOVE | WITHIN | BELOW} for each symptom that is
+        both reported and has a parsed expectation.
+        """
+        results = {}
+        for symptom, (low, high) in self.expected(procedure, day).items():
+            field = COMPARED_SYMPTOMS[symptom]
+            level = reported_level(symptom, reported.get(field, reported.get(symptom)))
+            if level is None:
+                continue
+            if level > high:
+                results[symptom] = ABOVE
+            elif level < low:
+                results[symptom] = BELOW
+            else:
+                results[symptom] = WITHIN
+        return results
+
+    def compare_history(self, procedure, entries):
+        """Comparison results for every entry in a recovery history"""
+        return [self.compare(procedure, entry.get('day', 1), entry) for entry in entries]
@@ -0,0 +1,148 @@
+"""
+Structured error telemetry.
+
+Captured exceptions are written as JSON records (type, message, stack, the
+step the session was on, timings and a hashed session id) into a fixed-size
+ring-buffer file: CAPACITY slots of SLOT_SIZE bytes, each holding one
+space-padded JSON line. A write touches one slot and the file never grows,
+so the newest records overwrite the oldest.
+
+Errors are sampled and then rate limited with a token bucket. During an
+error storm only a trickle of writes reach the disk; the number of errors
+skipped is carried in the next record that is written, so nothing vanishes
+without a trace.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+import traceback
+
+CAPACITY = 256
+SLOT_SIZE = 8 * 1024
+
+# Token bucket: sustained records per minute, and the burst allowed
+PER_MINUTE = 30
+BURST = 10
+
+STACK_FRAMES = 30
+
+logger = logging.getLogger("recovery_buddy")
+
+
+def hash_session_id(session_id, salt=""):
+    """Stable, non-reversible id for a session, so records can be grouped"""
+    if not session_id:
+        return None
+    return hashlib.sha256(f"{salt}:{session_id}".encode("utf-8")).hexdigest()[:16]
+
+
+def _encode(record):
+    """One slot's bytes, trimming the stack (then the rest) until the record fits"""
+    data = json.dumps(record, default=str).encode("utf-8") + b"\n"
+    while len(data) > SLOT_SIZE and len(record["stack"]) > 1:
+        # Keep the innermost frames, where the error was raised
+        record["stack"] = record["stack"][1:]
+        data = json.dumps(record, default=str).encode("utf-8") + b"\n"
+    if len(data) > SLOT_SIZE:
+        record.update(message=record["message"][:500], stack=[line[:500] for line in record["stack"]],
+                      timings={}, context={})
+        data = json.dumps(record, default=str).encode("utf-8") + b"\n"
+    return data + b" " * (SLOT_SIZE - len(data))
+
+
+class ErrorReporter:
+    """Samples, rate limits and records exceptions to a ring-buffer file"""
+
+    def __init__(self, path, sample_rate=1.0, per_minute=PER_MINUTE, burst=BURST,
+                 capacity=CAPACITY, salt=""):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.capacity = capacity
+        self.salt = salt
+        self.dropped = 0
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._next_seq = None  # found by scanning the file on first write
+        self._lock = threading.Lock()
+
+    def _allow(self):
+        """Take a token from the bucket if one is available"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _scan(self):
+        """Sequence number to write next, after the newest record in the file"""
+        newest = -1
+        for record in self._read_slots():
+            newest = max(newest, record.get("seq", -1))
+        return newest + 1
+
+    def _read_slots(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            for _ in range(self.capacity):
+                slot = f.read(SLOT_SIZE)
+                if not slot:
+                    return
+                try:
+                    yield json.loads(slot)
+                except ValueError:
+                    continue  # never written, or torn by a crash mid-write
+
+    def capture(self, error, step=None, session_id=None, timings=None, context=None):
+        """Record an exception (subject to sampling and rate limiting); returns True if written"""
+        with self._lock:
+            if random.random() >= self.sample_rate or not self._allow():
+                self.dropped += 1
+                return False
+            stack = traceback.format_exception(type(error), error, error.__traceback__)
+            record = {
+                "seq": None,
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "type": f"{type(error).__module__}.{type(error).__qualname__}",
+                "message": str(error),
+                "step": step,
+                "session": hash_session_id(session_id, self.salt),
+                "timings": timings or {},
+                "context": context or {},
+                "dropped": self.dropped,
+                "stack": [line.rstrip("\n") for line in stack[-STACK_FRAMES:]],
+            }
+            try:
+                self._write(record)
+            except OSError:
+                logger.exception("Couldn't write error telemetry to %s", self.path)
+                return False
+            self.dropped = 0
+        logger.error("Recovery Buddy error %s on step %s (recorded as #%s)", record["type"], step, record["seq"])
+        return True
+
+    def _write(self, record):
+        if self._next_seq is None:
+            self._next_seq = self._scan()
+        record["seq"] = self._next_seq
+        data = _encode(record)
+        mode = "r+b" if os.path.exists(self.path) else "w+b"
+        with open(self.path, mode) as f:
+            f.seek((record["seq"] % self.capacity) * SLOT_SIZE)
+            f.write(data)
+        self._next_seq += 1
+
+    def records(self, limit=None):
+        """Recorded errors, newest first"""
+        with self._lock:
+            records = sorted(self._read_slots(), key=lambda r: r.get("seq", -1), reverse=True)
+        return records[:limit] if limit else records
@@ -0,0 +1,223 @@
+"""
+Pain and mood trend analytics.
+
+Turns a history (pain_history, mood_history or check-in entries) into a
+per-day series, then computes rolling means, the current run of rising or
+falling days and a least-squares slope. Charts are downsampled with
+Largest-Triangle-Three-Buckets (LTTB), which keeps the peaks and dips that
+matter, so a chart sends the same handful of points whether the history has
+10 entries or 3,000.
+
+NumPy is used when it's installed, with plain Python fallbacks.
+"""
+
+from bisect import bisect_left
+from datetime import date
+
+from recovery_buddy.stats import day_ordinal, mood_score
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+# Points sent to a chart, however long the history
+CHART_POINTS = 120
+
+# Days in a row before a rise/fall is worth mentioning
+RUN_LENGTH = 3
+
+
+def daily_series(history, field, score=None):
+    """(day ordinals, values) with one averaged value per calendar day, in date order"""
+    totals = {}
+    for entry in history:
+        day, value = entry.get('date'), entry.get(field)
+        if score is not None:
+            value = score(value)
+        if not day or not isinstance(value, (int, float)):
+            continue
+        try:
+            ordinal = day_ordinal(day)
+        except ValueError:
+            continue
+        total = totals.setdefault(ordinal, [0.0, 0])
+        total[0] += value
+        total[1] += 1
+    days = sorted(totals)
+    return days, [totals[d][0] / totals[d][1] for d in days]
+
+
+class DailySeries:
+    """daily_series kept up to date one value at a time, instead of rebuilt from the whole history"""
+
+    __slots__ = ("days", "values", "_totals")
+
+    def __init__(self):
+        self.days = []
+        self.values = []
+        self._totals = {}
+
+    @classmethod
+    def from_history(cls, history, field):
+        series = cls()
+        for entry in history:
+            value = entry.get(field)
+            if not entry.get('date') or not isinstance(value, (int, float)):
+                continue
+            try:
+                series.add(day_ordinal(entry['date']), value)
+            except ValueError:
+                continue
+        return series
+
+    def add(self, ordinal, value):
+        """Add one value for a day (an ordinal), averaging it with that day's others"""
+        total = self._totals.setdefault(ordinal, [0.0, 0])
+        total[0] += value
+        total[1] += 1
+        i = bisect_left(self.days, ordinal)
+        if i < len(self.days) and self.days[i] == ordinal:
+            self.values[i] = total[0] / total[1]
+        else:
+            self.days.insert(i, ordinal)
+            self.values.insert(i, total[0] / total[1])
+
+
+def pain_series(history):
+    """Pain by day from pain_history ('level') or check-in entries ('pain_level')"""
+    days, values = daily_series(history, 'level')
+    return (days, values) if days else daily_series(history, 'pain_level')
+
+
+def mood_series(history):
+    """Mood scores (1-5) by day from mood_history"""
+    return daily_series(history, 'mood', score=mood_score)
+
+
+def rolling_mean(values, window=7):
+    """Trailing mean over up to `window` points (shorter at the start)"""
+    if not values:
+        return []
+    if np is not None:
+        data = np.asarray(values, dtype=float)
+        sums = np.cumsum(np.concatenate(([0.0], data)))
+        ends = np.arange(1, len(data) + 1)
+        starts = np.maximum(ends - window, 0)
+        return ((sums[ends] - sums[starts]) / (ends - starts)).tolist()
+    means, total = [], 0.0
+    for i, value in enumerate(values):
+        total += value
+        if i >= window:
+            total -= values[i - window]
+        means.append(total / min(i + 1, window))
+    return means
+
+
+def current_run(values):
+    """Length and direction of the latest run of strictly rising or falling values.
+
+    Returns (steps, direction) where direction is 1 for rising, -1 for falling
+    and 0 when the last two values are equal or there aren't two yet.
+    """
+    if len(values) < 2:
+        return 0, 0
+    if np is not None:
+        signs = np.sign(np.diff(np.asarray(values, dtype=float)))
+        direction = int(signs[-1])
+        if direction == 0:
+            return 0, 0
+        breaks = np.flatnonzero(signs != direction)
+        steps = len(signs) - (int(breaks[-1]) + 1 if len(breaks) else 0)
+        return steps, direction
+    direction = (values[-1] > values[-2]) - (values[-1] < values[-2])
+    if direction == 0:
+        return 0, 0
+    steps = 0
+    for i in range(len(values) - 1, 0, -1):
+        if (values[i] > values[i - 1]) - (values[i] < values[i - 1]) != direction:
+            break
+        steps += 1
+    return steps, direction
+
+
+def slope(days, values, window=7):
+    """Least-squares change per day over the last `window` points, or None"""
+    days, values = days[-window:], values[-window:]
+    if len(values) < 2:
+        return None
+    if np is not None:
+        x = np.asarray(days, dtype=float)
+        if np.ptp(x) == 0:
+            return None
+        return float(np.polyfit(x, np.asarray(values, dtype=float), 1)[0])
+    n = len(values)
+    mean_x, mean_y = sum(days) / n, sum(values) / n
+    var = sum((x - mean_x) ** 2 for x in days)
+    if var == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(days, values)) / var
+
+
+def lttb(xs, ys, threshold=CHART_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling to at most `threshold` points"""
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(xs), list(ys)
+    if np is not None:
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+    else:
+        x, y = xs, ys
+    every = (n - 2) / (threshold - 2)
+    keep = [0]
+    chosen = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        # Average of the next bucket (just the last point for the final bucket)
+        next_start, next_end = end, min(int((i + 2) * every) + 1, n)
+        if np is not None:
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+            areas = np.abs((x[chosen] - avg_x) * (y[start:end] - y[chosen])
+                           - (x[chosen] - x[start:end]) * (avg_y - y[chosen]))
+            chosen = start + int(areas.argmax())
+        else:
+            count = next_end - next_start
+            avg_x = sum(x[next_start:next_end]) / count
+            avg_y = sum(y[next_start:next_end]) / count
+            best = -1.0
+            for j in range(start, end):
+                area = abs((x[chosen] - avg_x) * (y[j] - y[chosen]) - (x[chosen] - x[j]) * (avg_y - y[chosen]))
+                if area > best:
+                    best, candidate = area, j
+            chosen = candidate
+        keep.append(chosen)
+    keep.append(n - 1)
+    return [xs[i] for i in keep], [ys[i] for i in keep]
+
+
+def chart_points(days, values, window=7, threshold=CHART_POINTS):
+    """Downsampled (dates, values, rolling means) ready for a compact chart"""
+    means = rolling_mean(values, window)
+    kept_days, kept_values = lttb(days, values, threshold)
+    index = {d: i for i, d in enumerate(days)}
+    return ([date.fromordinal(d) for d in kept_days], kept_values,
+            [means[index[d]] for d in kept_days])
+
+
+def describe_trend(days, values, label, higher_is_worse=True, run_length=RUN_LENGTH):
+    """(sentence, worsening) about the latest run, or None when nothing stands out"""
+    steps, direction = current_run(values)
+    if steps < run_length or direction == 0:
+        return None
+    verb = "risen" if direction > 0 else "fallen"
+    sentence = f"{label} has {verb} {steps} check-ins in a row"
+    per_day = slope(days, values)
+    if per_day is not None and abs(per_day) >= 0.1:
+        sentence += f" (about {abs(per_day):.1f} points per day)"
+    worsening = (direction > 0) == higher_is_worse
+    if worsening:
+        return sentence + ". Keep an eye on this and call your doctor if it continues.", True
+    return sentence + " - that's real progress!", False
@@ -0,0 +1,161 @@
+"""
+Symptom triage engine.
+
+Every symptom in the checker gets one bit, with normal symptoms in the lowest
+bits, then "call soon", then urgent. Because the tiers are stacked in order,
+the highest set bit of a symptom mask decides its tier, so classifying a
+check-in is a single bit_length() lookup. Batches of masks are classified
+together with NumPy when it is available.
+"""
+
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # the CLI can run without NumPy
+    np = None
+
+# Severity tiers from least to most serious
+TIERS = ("normal", "call_soon", "urgent")
+
+# Symptom checker data
+SYMPTOM_CHECKER = {
+    "normal": {
+        "symptoms": [
+            "Mild to moderate swelling",
+            "Bruising (yellow, purple, green)",
+            "Mild discomfort or tightness",
+            "Numbness or tingling",
+            "Itching around incisions",
+            "Fatigue or tiredness",
+            "Mild headache",
+            "Constipation (from pain meds)",
+            "Dry skin around incision"
+        ],
+        "message": "These symptoms are typically normal during recovery. Continue following your surgeon's instructions.",
+        "action": "Monitor and continue care",
+        "color": "#E8F5E8"
+    },
+    "call_soon": {
+        "symptoms": [
+            "Increasing pain not relieved by medication",
+            "Swelling that seems to be getting worse after day 3",
+            "Persistent nausea or vomiting",
+            "Drainage that changes color or smells bad",
+            "Redness spreading from incision",
+            "Low-grade fever (99-100.4°F)"
+        ],
+        "message": "These symptoms may need attention. Call your surgeon's office during business hours.",
+        "action": "Call surgeon within 24 hours",
+        "color": "#FFF8E7"
+    },
+    "urgent": {
+        "symptoms": [
+            "High fever (over 101°F)",
+            "Sudden severe pain",
+            "Heavy bleeding that won't stop",
+            "Signs of infection (hot, red, swollen)",
+            "Difficulty breathing",
+            "Chest pain",
+            "Severe dizziness or fainting",
+            "Calf pain or swelling (possible blood clot)"
+        ],
+        "message": "These symptoms require immediate attention!",
+        "action": "Call surgeon immediately or go to ER",
+        "color": "#FFE5E5"
+    }
+}
+
+# Check-in answers that map onto checker symptoms
+HEAVY_BLEEDING = "Heavy bleeding that won't stop"
+HIGH_FEVER = "High fever (over 101°F)"
+LOW_GRADE_FEVER = "Low-grade fever (99-100.4°F)"
+SWELLING = "Mild to moderate swelling"
+NUMBNESS = "Numbness or tingling"
+
+
+def parse_temperature(temperature):
+    """Parse a reported temperature like '100.5°F', returning None if unreadable"""
+    if not temperature:
+        return None
+    try:
+        return float(str(temperature).replace('°', '').replace('F', '').replace('f', '').strip())
+    except ValueError:
+        return None
+
+
+class SymptomTriage:
+    """Bitset encoding of SYMPTOM_CHECKER with one-step classification"""
+
+    def __init__(self, symptom_checker):
+        self.symptom_checker = symptom_checker
+        self.bits = {}
+        self.names = []
+        self.tier_masks = {}
+        # floors[i] is the lowest bit of tier i; any mask >= floors[i] has a
+        # symptom in tier i or above
+        self.floors = []
+        for tier in TIERS:
+            self.floors.append(1 << len(self.names))
+            tier_mask = 0
+            for symptom in symptom_checker[tier]["symptoms"]:
+                bit = 1 << len(self.names)
+                self.bits[symptom] = bit
+                self.names.append(symptom)
+                tier_mask |= bit
+            self.tier_masks[tier] = tier_mask
+        # Tier for each possible highest set bit (index 0 = empty mask)
+        self._tier_by_length = [None]
+        for index in range(len(self.names)):
+            self._tier_by_length.append(TIERS[bisect_right(self.floors, 1 << index) - 1])
+
+    def encode(self, symptoms):
+        """Symptom mask for a list of checker symptoms"""
+        mask = 0
+        for symptom in symptoms:
+            mask |= self.bits[symptom]
+        return mask
+
+    def encode_checkin(self, symptoms):
+        """Symptom mask for a physical check-in (swelling, bleeding, fever, ...)"""
+        mask = 0
+        if str(symptoms.get('bleeding', '')).lower() == 'heavy':
+            mask |= self.bits[HEAVY_BLEEDING]
+        if symptoms.get('fever'):
+            temp = parse_temperature(symptoms.get('temperature'))
+            if temp is not None and temp >= 101:
+                mask |= self.bits[HIGH_FEVER]
+            elif temp is not None and temp >= 99:
+                mask |= self.bits[LOW_GRADE_FEVER]
+        if str(symptoms.get('swelling', '')).lower() in ('mild', 'moderate'):
+            mask |= self.bits[SWELLING]
+        if symptoms.get('numbness'):
+            mask |= self.bits[NUMBNESS]
+        return mask
+
+    def classify(self, mask):
+        """Highest severity tier in a mask, or None for an empty mask"""
+        return self._tier_by_length[mask.bit_length()]
+
+    def symptoms_in(self, mask, tier):
+        """Names of the symptoms in a mask that belong to one tier"""
+        mask &= self.tier_masks[tier]
+        found = []
+        while mask:
+            low_bit = mask & -mask
+            found.append(self.names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return found
+
+    def classify_many(self, masks):
+        """Tiers for many masks at once (e.g. a user's whole check-in history)"""
+        if np is None:
+            return [self.classify(mask) for mask in masks]
+        levels = np.searchsorted(np.asarray(self.floors, dtype=np.uint64),
+                                 np.asarray(masks, dtype=np.uint64), side='right')
+        tiers = (None,) + TIERS
+        return [tiers[level] for level in levels.tolist()]
+
+    def score_history(self, checkins):
+        """Tier for every check-in in a history, oldest first"""
+        return self.classify_many([self.encode_checkin(c.get('symptoms', c)) for c in checkins])
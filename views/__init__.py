@@ -0,0 +1,6 @@
+"""
+Recovery Buddy's Streamlit pages.
+
+app.py is only a shim: Streamlit re-executes it on every rerun, while these
+modules are imported and compiled once per process.
+"""
@@ -0,0 +1,1239 @@
+"""
+The check-in flow: welcome -> get_info -> physical_checkin ->
+symptom_results -> emotional_checkin -> daily_tip -> complete.
+"""
+
+import streamlit as st
+from datetime import datetime
+
+from recovery_buddy.checkins import CheckInDraft, commit
+from recovery_buddy.copy_text import (AFFIRMATIONS, DAILY_CHECKLIST, DAILY_TIPS,
+                                      JOURNALING_PROMPTS, PROCEDURE_CATEGORIES, SURGEON_TEMPLATES)
+from recovery_buddy.engine import (HEAVY_BLEEDING, HIGH_FEVER, MOOD_LOW, MOOD_OKAY, PAIN_HIGH, PAIN_HIGH_EARLY,
+                                   PAIN_MANAGEABLE)
+from recovery_buddy.photos import FAILED, PROCESSING, READY, PhotoRejected
+from recovery_buddy.reminders import parse_time_of_day
+
+from views.common import (APP_VERSION, get_content, get_time_greeting, get_mascot_message, get_citation_index,
+                          get_checkin_engine, get_milestone_index, save_progress, get_photo_store,
+                          get_photo_comparer, get_journal_store, share_checkin, get_state)
+
+# How the app words the check-in engine's concerns
+CONCERN_MESSAGES = {
+    HEAVY_BLEEDING: "Heavy bleeding requires attention",
+    HIGH_FEVER: "Fever of {value}°F needs medical evaluation",
+}
+
+
+def show_welcome():
+    content = get_content()
+    state = get_state()
+
+    import random
+
+    # Check for returning user
+    saved_name = state.progress_data.get('name', '')
+    saved_procedure = state.progress_data.get('procedure', '')
+    is_returning = bool(saved_name)
+
+    # Calculate recovery day if surgery date is set
+    recovery_day = 0
+    surgery_date = state.progress_data.get('surgery_date')
+    if surgery_date:
+        try:
+            schedule = get_milestone_index().schedule(saved_procedure, surgery_date)
+            recovery_day = schedule.day_on(datetime.now().date())
+        except ValueError:
+            recovery_day = 0
+
+    # Welcome header
+    if is_returning:
+        greeting = get_time_greeting(saved_name)
+        st.header(greeting)
+
+        mascot = get_mascot_message(recovery_day) if recovery_day > 0 else {"emoji": "🌸", "message": "Welcome back to your recovery journey!"}
+        st.write(f"{mascot['emoji']} *\"{mascot['message']}\"*")
+
+        # Show recovery milestone if applicable
+        if recovery_day > 0:
+            milestone = get_milestone_index().recovery_milestone(recovery_day)
+            if milestone:
+                st.success(f"{milestone['icon']} **{milestone['title']}** — Day {recovery_day} of Recovery\n\n{milestone['message']}")
+
+        # Show stats
+        last_check = state.stats.last_check_in_date()
+        if last_check:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("📅 Last Check-in", last_check)
+            with col2:
+                st.metric("🔥 Streak", f"{state.stats.current_streak()} days")
+
+    else:
+        st.header("🌸 Welcome to Recovery Buddy")
+        st.write("I'm here to support you through your post-surgery healing journey.")
+
+    st.divider()
+
+    # Two column layout
+    col_left, col_right = st.columns(2)
+
+    with col_left:
+        st.subheader("✨ Today's Affirmation")
+        affirmation = random.choice(AFFIRMATIONS)
+        st.info(f"*\"{affirmation}\"*")
+
+        st.subheader("🌟 What We Do Together")
+        st.write("• Check your physical symptoms")
+        st.write("• Support your emotional wellbeing")
+        st.write("• Provide personalized daily tips")
+        st.write("• Track your healing progress")
+
+    with col_right:
+        # Daily Tip
+        daily_tip = DAILY_TIPS[state.daily_tip_index]
+        st.subheader(f"{daily_tip['icon']} Tip of the Day")
+        st.warning(daily_tip['tip'])
+
+        # Quick mood check using radio buttons
+        st.subheader("😊 Quick Mood Check")
+        mood_options = ["😢 Struggling", "😐 Okay", "🙂 Good", "😊 Great"]
+        selected_mood = st.radio(
+            "How are you feeling right now?",
+            options=mood_options,
+            horizontal=True,
+            key="quick_mood_radio",
+            label_visibility="collapsed"
+        )
+
+        if st.button("Log Mood", key="log_mood_btn", type="primary"):
+            # Parse the selection
+            emoji = selected_mood.split()[0]
+            label = selected_mood.split()[1]
+            mood_entry = {
+                'date': datetime.now().strftime('%Y-%m-%d'),
+                'time': datetime.now().strftime('%H:%M'),
+                'mood': label,
+                'emoji': emoji
+            }
+            state.mood_history.append(mood_entry)
+            state.progress_data['mood_history'] = state.mood_history
+            state.stats.record_mood(mood_entry['date'], mood_entry['mood'])
+            state.store_stats()
+            save_progress(state.progress_data)
+            st.success(f"✅ Mood logged: {emoji} {label}")
+
+    st.divider()
+
+    # Privacy and disclaimer
+    st.info("🔒 **Your data stays on your device** — We don't collect or store your personal information on external servers.")
+    st.caption(f"📚 Medical information last reviewed: {content.medical_review}")
+    st.caption("💚 Remember: I'm here to support you, not replace medical advice. Always follow your surgeon's instructions.")
+
+
+def show_get_info():
+    content = get_content()
+    state = get_state()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>📋 Tell Me About You</h3>
+        <p style="color: #3D4D3D;">Let's personalize your recovery experience.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Name input
+    name = st.text_input("What should I call you?", value=state.user_data.get('name', ''),
+                         placeholder="Enter your name", key="input_name")
+
+    if name and name in state.progress_data:
+        st.markdown(f"""
+        <div class="success-box">
+            <p>🌟 Welcome back, <strong>{name}</strong>! I have your previous check-ins saved.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Procedure selection
+    st.markdown("#### What procedure did you have?")
+
+    selected_procedure = state.user_data.get('procedure', '')
+
+    # Display procedures organized by category using expanders
+    for cat_key, cat_info in PROCEDURE_CATEGORIES.items():
+        with st.expander(f"{cat_info['name']}", expanded=False):
+            for proc_key in cat_info['procedures']:
+                if proc_key in content.procedures:
+                    proc = content.procedures[proc_key]
+                    # Format: Common Name (Medical Term)
+                    btn_label = f"{proc['name']} ({proc['medical_term']})"
+                    if st.button(btn_label, key=f"proc_{proc_key}", use_container_width=True):
+                        selected_procedure = proc_key
+                        state.user_data['procedure'] = proc_key
+                        st.rerun()
+
+    if selected_procedure and selected_procedure in content.procedures:
+        proc = content.procedures[selected_procedure]
+        st.success(f"Selected: **{proc['name']}** ({proc['medical_term']})")
+        st.caption(f"Recovery: {proc.get('recovery_timeline', 'Varies')}")
+        st.markdown(f"[View ASPS Information]({proc['asps_url']})")
+
+    st.markdown("---")
+
+    # Post-op day
+    st.markdown("#### What day of recovery are you on?")
+    day = st.number_input("Post-op day", min_value=1, max_value=365,
+                          value=state.user_data.get('day', 1),
+                          label_visibility="collapsed", key="input_day")
+
+    st.markdown(f"""
+    <p style="color: #3A4A3A; font-size: 0.9rem;">
+        Day {day} of your healing journey 🌱
+    </p>
+    """, unsafe_allow_html=True)
+
+    # Continue button
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    if name and selected_procedure:
+        state.user_data['name'] = name
+        state.user_data['day'] = day
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("Continue", key="btn_continue_info", type="primary", use_container_width=True):
+                state.step = 'physical_checkin'
+                st.rerun()
+    else:
+        st.markdown("""
+        <p style="text-align: center; color: #3A4A3A;">
+            Please enter your name and select your procedure to continue.
+        </p>
+        """, unsafe_allow_html=True)
+
+
+def show_physical_checkin():
+    state = get_state()
+
+    name = state.user_data.get('name', 'there')
+    day = state.user_data.get('day', 1)
+
+    st.markdown(f"""
+    <div class="wellness-card">
+        <h3>🩺 Physical Check-In</h3>
+        <p style="color: #3D4D3D;">Day {day} — Let's see how your body is healing, {name}.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Symptom checker disclaimer
+    st.markdown("""
+    <div style="background: #FFF8F0; border: 1px solid #E8B4BC; border-radius: 10px; padding: 0.75rem 1rem; margin: 0.5rem 0 1rem 0;">
+        <p style="color: #5A2D3A; font-size: 0.85rem; margin: 0;">
+            ⚠️ <strong>Not a Diagnosis Tool:</strong> This check-in helps you track symptoms for your records.
+            It does not diagnose conditions. Always consult your surgeon about any concerns.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Pain level with visual scale and dynamic colors
+    st.markdown("#### How's your pain level?")
+    pain_level = st.slider("Pain level", 1, 10, 5,
+                           help="1 = No pain, 10 = Worst imaginable",
+                           label_visibility="collapsed",
+                           key="slider_pain_level")
+
+    # Dynamic color based on pain level
+    if pain_level <= 3:
+        pain_color = "#2D7A2D"  # Green - doing great
+        pain_bg = "#E8F5E8"
+        pain_border = "#4CAF50"
+    elif pain_level <= 6:
+        pain_color = "#996B00"  # Orange/Yellow - moderate
+        pain_bg = "#FFF8E1"
+        pain_border = "#FFC107"
+    else:
+        pain_color = "#C62828"  # Red - high pain
+        pain_bg = "#FFEBEE"
+        pain_border = "#EF5350"
+
+    pain_descriptions = {
+        1: "😊 No pain", 2: "😌 Minimal", 3: "🙂 Mild", 4: "😐 Moderate-low",
+        5: "😕 Moderate", 6: "😟 Moderate-high", 7: "😣 Significant",
+        8: "😖 Severe", 9: "😫 Very severe", 10: "😰 Worst possible"
+    }
+
+    # Pain level display with dynamic color
+    st.markdown(f"""
+    <div style="background: {pain_bg}; border-left: 4px solid {pain_border};
+                border-radius: 12px; padding: 1rem; margin: 0.5rem 0; text-align: center;">
+        <p style="margin: 0; color: {pain_color}; font-size: 1.2rem; font-weight: 600;">
+            {pain_descriptions.get(pain_level, '')}
+        </p>
+        <p style="margin: 0.5rem 0 0 0; color: {pain_color}; font-size: 0.85rem;">
+            {'Excellent! Keep it up! 💚' if pain_level <= 3 else 'Manageable - stay on top of meds 💛' if pain_level <= 6 else 'Consider calling your surgeon if this persists ❤️'}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Symptoms in a clean layout
+    st.markdown("#### Current Symptoms")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        swelling = st.selectbox("💧 Swelling", ["None", "Mild", "Moderate", "Severe"], index=2, key="select_swelling")
+        bleeding = st.selectbox("🩸 Bleeding", ["None", "Spotting", "Light", "Heavy"], key="select_bleeding")
+
+    with col2:
+        bruising = st.selectbox("💜 Bruising", ["None", "Mild", "Moderate", "Severe"], index=1, key="select_bruising")
+
+    col_check1, col_check2 = st.columns(2)
+    with col_check1:
+        has_fever = st.checkbox("🌡️ Fever or feeling feverish", key="check_fever")
+    with col_check2:
+        numbness = st.checkbox("✋ Numbness in surgical area", key="check_numbness")
+
+    if has_fever:
+        temperature = st.text_input("Temperature if known", placeholder="e.g., 100.5°F", key="input_temperature")
+    else:
+        temperature = None
+
+    st.markdown("---")
+
+    other_concerns = st.text_area("Anything else you want to share?",
+                                   placeholder="Optional: describe any other symptoms or concerns...",
+                                   height=80, key="input_concerns")
+
+    # Store symptoms
+    state.user_data['symptoms'] = {
+        'pain_level': pain_level,
+        'swelling': swelling.lower(),
+        'bruising': bruising.lower(),
+        'bleeding': bleeding.lower(),
+        'fever': has_fever,
+        'temperature': temperature,
+        'numbness': numbness,
+        'other': other_concerns if other_concerns else None
+    }
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("See My Assessment", key="btn_see_assessment", type="primary", use_container_width=True):
+            # Start buffering this check-in; it's saved once at the complete step
+            state.check_in = CheckInDraft()
+            state.check_in.update("physical", symptoms=state.user_data['symptoms'])
+            state.step = 'symptom_results'
+            st.rerun()
+
+
+def show_symptom_results():
+    content = get_content()
+    state = get_state()
+
+    procedure_key = state.user_data.get('procedure', 'other')
+    day = state.user_data.get('day', 1)
+    symptoms = state.user_data.get('symptoms', {})
+    pain_level = symptoms.get('pain_level', 5)
+    engine = get_checkin_engine(content.generation)
+    assessment = engine.assess_symptoms(procedure_key, day, symptoms, pain_level)
+
+    # Render every citation box on this page in one pass
+    symptom_citation, timeline_citation, warning_citation = get_citation_index().boxes([
+        ("Symptom data from", ["asps", "realself", "webmd"]),
+        ("Timeline data from", ["asps", "cleveland", "realself"]),
+        ("Warning signs from", ["asps", "mayo"]),
+    ])
+
+    if procedure_key in content.procedures:
+        procedure = content.procedures[procedure_key]
+
+        st.markdown(f"""
+        <div class="wellness-card">
+            <h3>{procedure.get('emoji', '✨')} Your Day {day} Assessment</h3>
+            <p style="color: #3D4D3D;">{procedure['name']} Recovery</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Expected symptoms
+        st.markdown("#### What's Typical Right Now")
+
+        for symptom, expected_level in assessment.expected.items():
+            st.markdown(f"""
+            <div style="background: #F5F0E8; padding: 0.75rem 1rem; border-radius: 10px; margin: 0.5rem 0;">
+                <strong style="color: #3D6B3D;">{symptom.title()}</strong>
+                <span style="color: #3D4D3D; float: right;">{expected_level}</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # How the reported symptoms compare with what's typical
+        if state.check_in is not None:
+            state.check_in.update("symptom_results", comparison=assessment.comparison)
+        for symptom in assessment.comparison:
+            if symptom in assessment.above:
+                st.markdown(f"""
+                <div class="warning-box">
+                    <p>📈 Your {symptom} is higher than typical for Day {day}. Keep an eye on it and let your surgeon know if it doesn't settle.</p>
+                </div>
+                """, unsafe_allow_html=True)
+            elif symptom in assessment.below:
+                st.markdown(f"""
+                <div class="success-box">
+                    <p>📉 Your {symptom} is lower than typical for Day {day} - lovely progress!</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown(symptom_citation, unsafe_allow_html=True)
+
+        # Peak swelling notice
+        if assessment.peak_swelling:
+            st.markdown(f"""
+            <div class="warning-box">
+                <p>📍 <strong>Today is typically peak swelling day!</strong></p>
+                <p style="margin-top: 0.5rem;">What you see right now is NOT your final result. This is completely normal and will improve significantly over the coming days.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Timeline metrics - custom cards for better text display
+        st.markdown("#### Your Recovery Timeline")
+        st.markdown(f"""
+        <div style="display: flex; gap: 1rem; margin: 1rem 0; flex-wrap: wrap;">
+            <div style="flex: 1; min-width: 120px; background: #FFFFFF; border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.05);">
+                <p style="color: #5A7A5A; font-size: 0.85rem; margin: 0 0 0.5rem 0; font-weight: 500;">Peak Swelling</p>
+                <p style="color: #2D3A2D; font-size: 1.1rem; margin: 0; font-weight: 600;">Day {procedure['peak_swelling_day']}</p>
+            </div>
+            <div style="flex: 1; min-width: 120px; background: #FFFFFF; border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.05);">
+                <p style="color: #5A7A5A; font-size: 0.85rem; margin: 0 0 0.5rem 0; font-weight: 500;">Swelling Duration</p>
+                <p style="color: #2D3A2D; font-size: 1.1rem; margin: 0; font-weight: 600;">{procedure['swelling_duration'].split(',')[0]}</p>
+            </div>
+            <div style="flex: 1; min-width: 120px; background: #FFFFFF; border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.05);">
+                <p style="color: #5A7A5A; font-size: 0.85rem; margin: 0 0 0.5rem 0; font-weight: 500;">Final Results</p>
+                <p style="color: #2D3A2D; font-size: 1.1rem; margin: 0; font-weight: 600;">{procedure['final_results']}</p>
+            </div>
+        </div>
+        {timeline_citation}
+        """, unsafe_allow_html=True)
+
+    # Pain assessment
+    st.markdown("#### Pain Assessment")
+
+    if assessment.pain == PAIN_MANAGEABLE:
+        st.markdown("""
+        <div class="success-box">
+            <p>✅ Your pain level is manageable for this stage. Keep up with your medication schedule!</p>
+        </div>
+        """, unsafe_allow_html=True)
+    elif assessment.pain == PAIN_HIGH_EARLY:
+        st.markdown("""
+        <div class="warning-box">
+            <p>⚠️ Your pain is on the higher end, but this can be normal in the first few days. Make sure you're staying on top of your pain medication schedule.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    elif assessment.pain == PAIN_HIGH:
+        st.markdown("""
+        <div class="danger-box">
+            <p>🔔 Your pain seems higher than typical for this stage. If it's not improving or getting worse, please contact your surgeon's office.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="success-box">
+            <p>🌟 Low pain level - you're doing wonderfully!</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Warning signs check
+    warnings = engine.check_warnings(procedure_key, symptoms)
+    concerns = [CONCERN_MESSAGES[concern.kind].format(value=concern.value) for concern in warnings.concerns]
+
+    if concerns:
+        st.markdown("""
+        <div class="danger-box">
+            <p>🚨 <strong>Please contact your surgeon's office about:</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        for concern in concerns:
+            st.error(f"• {concern}")
+
+    # Warning signs to watch - using markdown box instead of expander
+    if warnings.watch_for:
+        st.markdown("""
+        <div class="warning-box">
+            <h4 style="margin: 0 0 0.75rem 0; color: #5C4813;">⚠️ Warning Signs to Watch For</h4>
+            <p style="margin: 0 0 0.5rem 0; color: #5C4813;"><strong>🚨 Monitor for these symptoms:</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        for sign in warnings.watch_for:
+            st.markdown(f"<p style='color: #5C4813; margin: 0.25rem 0; padding-left: 1rem;'>⚠️ {sign}</p>", unsafe_allow_html=True)
+        st.markdown(warning_citation, unsafe_allow_html=True)
+
+    # Consult doctor reminder
+    st.markdown("""
+    <div class="consult-doctor-reminder">
+        👩‍⚕️ <strong>Remember:</strong> Always consult your surgeon if you have concerns about your symptoms.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("📚 Medical Sources", key="btn_sources_symptom", use_container_width=True):
+            state.step = 'references'
+            st.rerun()
+    with col2:
+        if st.button("Continue to Emotional Check-In", key="btn_emotional", type="primary", use_container_width=True):
+            state.step = 'emotional_checkin'
+            st.rerun()
+
+
+def show_emotional_checkin():
+    content = get_content()
+    state = get_state()
+
+    name = state.user_data.get('name', 'there')
+    procedure_key = state.user_data.get('procedure', 'other')
+    day = state.user_data.get('day', 1)
+
+    st.markdown(f"""
+    <div class="wellness-card">
+        <h3>💭 Emotional Check-In</h3>
+        <p style="color: #3D4D3D;">How are you feeling emotionally today, {name}?</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Mood selection with emojis - use 3 columns on first row, 2 on second for better width
+    st.markdown("""
+    <style>
+    .mood-btn button {
+        white-space: nowrap !important;
+        min-width: 100px !important;
+        font-size: 0.85rem !important;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    col4, col5 = st.columns(2)
+
+    moods = [
+        ("😊", "Great", col1),
+        ("🙂", "Good", col2),
+        ("😐", "Okay", col3),
+        ("😔", "Down", col4),
+        ("😢", "Struggling", col5),
+    ]
+
+    selected_mood = state.user_data.get('emotional_state', None)
+
+    for emoji, label, col in moods:
+        with col:
+            btn_style = "primary" if selected_mood == label.lower() else "secondary"
+            if st.button(f"{emoji}\n{label}", key=f"mood_{label}", use_container_width=True):
+                selected_mood = label.lower()
+                state.user_data['emotional_state'] = selected_mood
+                st.rerun()
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Response based on mood
+    if selected_mood:
+        response = get_checkin_engine(content.generation).assess_mood(selected_mood, procedure_key, day)
+        if response.category == MOOD_LOW:
+            st.markdown("""
+            <div class="wellness-card" style="background: linear-gradient(135deg, #FDF2F4 0%, #FFFFFF 100%);">
+                <div class="emoji-large">💗</div>
+                <h3 style="text-align: center;">I hear you</h3>
+                <p style="text-align: center; color: #3D4D3D; line-height: 1.8;">
+                    What you're feeling is completely normal and valid. Post-surgical blues are incredibly common.
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown("""
+            <div class="info-box">
+                <p><strong>Here's why you might be feeling this way:</strong></p>
+                <p style="margin-top: 0.5rem; line-height: 1.8;">
+                    🧠 Anesthesia affects your brain chemistry for days<br>
+                    💊 Pain medications can cause mood changes<br>
+                    ⚡ Your body is using all its energy to heal<br>
+                    🏠 Limited mobility and isolation are hard<br>
+                    🪞 Swelling can make you look/feel unlike yourself
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            if response.final_results:
+                procedure = content.procedures[procedure_key]
+                st.markdown(f"""
+                <div class="tip-card">
+                    <h4>Remember</h4>
+                    <p>Final {procedure['name']} results take {response.final_results}. What you see right now is NOT what you'll look like when you're healed. 🌸</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        elif response.category == MOOD_OKAY:
+            st.markdown("""
+            <div class="success-box">
+                <p>💚 <strong>That's perfectly valid!</strong></p>
+                <p style="margin-top: 0.5rem;">Recovery is a marathon, not a sprint. "Okay" is absolutely acceptable when you're healing from surgery.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            if response.first_week:
+                st.markdown("""
+                <div class="info-box">
+                    <p>🌱 The first week is the hardest emotionally for most people. You're almost through it!</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        else:
+            st.markdown("""
+            <div class="success-box">
+                <p>🌟 <strong>That's wonderful to hear!</strong></p>
+                <p style="margin-top: 0.5rem;">A positive mindset can really help with healing. Just remember it's also okay to have down moments - recovery isn't linear.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Universal reminders - rotate randomly
+        import random
+        all_reminders = [
+            "🌸 Swelling distorts your results - don't judge what you see right now",
+            "🦋 Comparison is the thief of joy - everyone heals differently",
+            "📱 It's okay to limit social media and 'transformation' photos",
+            "💕 Reach out to friends, family, or your surgeon if you're struggling",
+            "🌱 Healing takes time - be patient with yourself",
+            "💚 Your body is working hard to heal",
+            "🌙 Rest is productive - don't feel guilty",
+            "☀️ Small progress is still progress",
+            "🌷 Trust the process - your body knows how to heal",
+            "💜 It's okay to have emotional ups and downs during recovery",
+        ]
+        # Show 4 random reminders each time
+        selected_reminders = random.sample(all_reminders, 4)
+
+        st.markdown("#### Gentle Reminders")
+        for reminder in selected_reminders:
+            st.write(reminder)
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("Continue to Daily Tips", key="btn_daily_tips", type="primary", use_container_width=True):
+                if state.check_in is not None:
+                    state.check_in.update("emotional_checkin", emotional_state=selected_mood)
+                state.step = 'daily_tip'
+                st.rerun()
+
+
+def show_daily_tip():
+    content = get_content()
+    state = get_state()
+
+    procedure_key = state.user_data.get('procedure', 'other')
+    day = state.user_data.get('day', 1)
+    name = state.user_data.get('name', 'there')
+    symptoms = state.user_data.get('symptoms', {})
+
+    # Get tip
+    tip = get_checkin_engine(content.generation).daily_tip(procedure_key, day).text
+
+    st.markdown(f"""
+    <div class="wellness-card">
+        <h3>💡 Your Daily Wisdom</h3>
+        <p style="color: #3D4D3D;">Personalized guidance for Day {day}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Main tip
+    st.markdown(f"""
+    <div class="tip-card">
+        <h4>Today's Tip</h4>
+        <p>{tip}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Recovery essentials
+    st.markdown("#### Recovery Essentials")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div style="background: #E8F0E8; padding: 1rem; border-radius: 12px; height: 100%;">
+            <p style="margin: 0; color: #2D4A2D;"><strong>💧 Hydration</strong></p>
+            <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #2D4A2D;">Water, herbal tea, clear broths</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div style="background: #FDF2F4; padding: 1rem; border-radius: 12px; margin-top: 0.75rem;">
+            <p style="margin: 0; color: #5A2D3A;"><strong>😴 Rest</strong></p>
+            <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #5A2D3A;">Healing is hard work!</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: #F5F0E8; padding: 1rem; border-radius: 12px; height: 100%;">
+            <p style="margin: 0; color: #4A3A2D;"><strong>🥩 Protein</strong></p>
+            <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #4A3A2D;">Helps your body heal</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div style="background: #E8F0E8; padding: 1rem; border-radius: 12px; margin-top: 0.75rem;">
+            <p style="margin: 0; color: #2D4A2D;"><strong>🚶 Movement</strong></p>
+            <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #2D4A2D;">Gentle walks prevent clots</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown(f"""
+    {get_citation_index().box("Recovery guidance from", ["mayo", "cleveland", "webmd"])}
+    <div class="consult-doctor-reminder">
+        👩‍⚕️ <strong>Tip:</strong> These are general guidelines. Your surgeon's specific instructions take priority.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ===== COUNTDOWN TIMERS =====
+    st.markdown("#### ⏱️ Recovery Milestones")
+
+    schedule = get_milestone_index().schedule(procedure_key)
+
+    # Find upcoming milestones
+    upcoming = schedule.upcoming(day)
+    completed = schedule.completed(day)
+
+    if completed:
+        st.markdown(f"""
+        <div class="success-box">
+            <p><strong>✅ Completed:</strong> {', '.join([f"{m['icon']} {m['milestone']}" for m in completed])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    if upcoming:
+        cols = st.columns(min(len(upcoming), 3))
+        for i, m in enumerate(upcoming[:3]):
+            with cols[i]:
+                days_until = m["days"] - day
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #FDF2F4 0%, #FFFFFF 100%);
+                            padding: 1rem; border-radius: 12px; text-align: center;">
+                    <div style="font-size: 2rem;">{m['icon']}</div>
+                    <p style="margin: 0.5rem 0 0 0; font-weight: 600; color: #2D3A2D;">{m['milestone']}</p>
+                    <p style="margin: 0.25rem 0 0 0; color: #5A2D3A; font-size: 1.2rem; font-weight: 700;">
+                        {days_until} {'day' if days_until == 1 else 'days'}
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ===== RECOVERY CHECKLIST =====
+    st.markdown("#### ✅ Daily Recovery Checklist")
+
+    today_key = datetime.now().strftime("%Y-%m-%d")
+    if today_key not in state.checklist:
+        state.checklist[today_key] = {}
+
+    # Group by time of day - using tabs instead of expanders to avoid key display bug
+    morning_tab, afternoon_tab, evening_tab = st.tabs(["🌅 Morning", "☀️ Afternoon", "🌙 Evening"])
+
+    for time_period, tab in [("morning", morning_tab), ("afternoon", afternoon_tab), ("evening", evening_tab)]:
+        tasks = [t for t in DAILY_CHECKLIST if t["time"] == time_period]
+
+        with tab:
+            for idx, task in enumerate(tasks):
+                task_key = f"checklist_{time_period}_{idx}_{hash(task['task']) % 10000}"
+                checked = st.checkbox(
+                    f"{task['icon']} {task['task']}",
+                    value=state.checklist[today_key].get(task['task'], False),
+                    key=task_key
+                )
+                state.checklist[today_key][task['task']] = checked
+
+    # Show completion percentage
+    total_tasks = len(DAILY_CHECKLIST)
+    completed_tasks = sum(1 for t in DAILY_CHECKLIST if state.checklist[today_key].get(t['task'], False))
+    completion_pct = int((completed_tasks / total_tasks) * 100)
+
+    if completion_pct == 100:
+        # Only show celebration ONCE when 100% is first reached
+        if not state.celebration_shown:
+            state.celebration_shown = True
+            celebration = state.celebration_style
+
+            # Built-in Streamlit animations
+            if "Balloons" in celebration:
+                st.balloons()
+            elif "Snow" in celebration:
+                st.snow()
+            else:
+                # Custom CSS animations for other celebration types
+                if "Bubbles" in celebration:
+                    animation_emoji = "🫧"
+                elif "Hearts" in celebration:
+                    animation_emoji = "❤️"
+                elif "Confetti" in celebration:
+                    animation_emoji = "🎊"
+                elif "Sparkles" in celebration:
+                    animation_emoji = "✨"
+                elif "Butterflies" in celebration:
+                    animation_emoji = "🦋"
+                else:
+                    animation_emoji = "🎉"
+
+                # Custom falling animation CSS
+                st.markdown(f"""
+                <style>
+                @keyframes fall {{
+                    0% {{ transform: translateY(-100vh) rotate(0deg); opacity: 1; }}
+                    100% {{ transform: translateY(100vh) rotate(720deg); opacity: 0; }}
+                }}
+                .celebration-particle {{
+                    position: fixed;
+                    top: -20px;
+                    font-size: 2rem;
+                    animation: fall 3s ease-in forwards;
+                    z-index: 9999;
+                    pointer-events: none;
+                }}
+                </style>
+                <div class="celebration-particle" style="left: 10%; animation-delay: 0s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 20%; animation-delay: 0.2s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 30%; animation-delay: 0.4s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 40%; animation-delay: 0.1s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 50%; animation-delay: 0.3s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 60%; animation-delay: 0.5s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 70%; animation-delay: 0.2s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 80%; animation-delay: 0.4s;">{animation_emoji}</div>
+                <div class="celebration-particle" style="left: 90%; animation-delay: 0.1s;">{animation_emoji}</div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="success-box">
+            <p>🎉 <strong>Amazing!</strong> You completed all your recovery tasks today!</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        # Reset celebration flag when not at 100% (allows celebration again tomorrow)
+        state.celebration_shown = False
+        st.progress(completion_pct / 100)
+        st.markdown(f"<p style='text-align: center; color: #3D4D3D;'>{completed_tasks}/{total_tasks} tasks completed ({completion_pct}%)</p>", unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ===== SURGEON MESSAGE TEMPLATES =====
+    st.markdown("#### 📝 Message Your Surgeon")
+
+    show_surgeon_template = st.checkbox("📝 Click to generate a message template", key="show_surgeon_template")
+    if show_surgeon_template:
+        template_type = st.selectbox(
+            "What do you need to communicate?",
+            ["General Post-Op Update", "Concerning Symptoms", "Medication Question", "Schedule Follow-up"],
+            key="select_template_type"
+        )
+
+        template_keys = {
+            "General Post-Op Update": "general_update",
+            "Concerning Symptoms": "concerning_symptoms",
+            "Medication Question": "medication_question",
+            "Schedule Follow-up": "schedule_followup"
+        }
+
+        template_key = template_keys[template_type]
+        template_data = SURGEON_TEMPLATES[template_key]
+
+        # Pre-fill template with user data
+        procedure_name = content.procedures.get(procedure_key, {}).get('name', 'my procedure')
+        pain_level = symptoms.get('pain_level', 5)
+        swelling = symptoms.get('swelling', 'unknown')
+        bruising = symptoms.get('bruising', 'unknown')
+
+        filled_template = template_data["template"]
+        filled_template = filled_template.replace("[NAME]", name if name else "[Your Name]")
+        filled_template = filled_template.replace("[DAY]", str(day))
+        filled_template = filled_template.replace("[PROCEDURE]", procedure_name)
+        filled_template = filled_template.replace("[PAIN]", str(pain_level))
+        filled_template = filled_template.replace("[SWELLING]", swelling.title())
+        filled_template = filled_template.replace("[BRUISING]", bruising.title())
+
+        # Use template_key in the widget key so it updates when selection changes
+        st.text_area(
+            "Copy and customize this message:",
+            value=filled_template,
+            height=300,
+            key=f"surgeon_template_{template_key}"
+        )
+
+        st.markdown("""
+        <p style="font-size: 0.85rem; color: #5C6B5C;">
+            💡 <em>Tip: Copy this template and customize the bracketed sections before sending.</em>
+        </p>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ===== SMART NOTIFICATIONS / CALENDAR EXPORT =====
+    st.markdown("#### 📅 Medication Reminder Schedule")
+
+    show_calendar = st.checkbox("📅 Click to create reminder schedule", key="show_calendar")
+    if show_calendar:
+        st.markdown("""
+        <p style="color: #3D4D3D;">Enter your medication schedule to generate calendar reminders:</p>
+        """, unsafe_allow_html=True)
+
+        med_name = st.text_input("Medication name", placeholder="e.g., Pain medication", key="input_med_name")
+        med_times = st.multiselect(
+            "Reminder times",
+            ["6:00 AM", "8:00 AM", "10:00 AM", "12:00 PM", "2:00 PM", "4:00 PM", "6:00 PM", "8:00 PM", "10:00 PM"],
+            default=["8:00 AM", "2:00 PM", "8:00 PM"],
+            key="multiselect_med_times"
+        )
+        med_days = st.slider("How many days of reminders?", 1, 14, 7, key="slider_med_days")
+
+        if st.button("Generate Calendar File", key="btn_gen_calendar"):
+            # Generate ICS content
+            from datetime import timedelta
+            ics_content = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Recovery Buddy//Medication Reminders//EN
+"""
+            base_date = datetime.now()
+
+            for d in range(med_days):
+                event_date = base_date + timedelta(days=d)
+                for time_str in med_times:
+                    hour, minute = parse_time_of_day(time_str)
+                    event_datetime = event_date.replace(hour=hour, minute=minute, second=0)
+                    dtstart = event_datetime.strftime("%Y%m%dT%H%M%S")
+                    dtend = (event_datetime + timedelta(minutes=15)).strftime("%Y%m%dT%H%M%S")
+
+                    ics_content += f"""BEGIN:VEVENT
+DTSTART:{dtstart}
+DTEND:{dtend}
+SUMMARY:💊 {med_name if med_name else 'Take Medication'}
+DESCRIPTION:Recovery Buddy Reminder - Day {d+1} of recovery
+BEGIN:VALARM
+TRIGGER:-PT5M
+ACTION:DISPLAY
+DESCRIPTION:Time to take your medication!
+END:VALARM
+END:VEVENT
+"""
+            ics_content += "END:VCALENDAR"
+
+            st.download_button(
+                label="📥 Download Calendar File",
+                data=ics_content,
+                file_name="medication_reminders.ics",
+                mime="text/calendar"
+            )
+
+            st.success("Calendar file ready! Import into your phone's calendar app.")
+
+    # Progress summary against the last saved check-in
+    person = state.progress_data.get(name)
+    entries = person.get('entries', []) if isinstance(person, dict) else []
+    if entries:
+        st.markdown("#### Your Progress")
+        prev = entries[-1]
+        if prev:
+            prev_pain = prev.get('pain_level', 5)
+            curr_pain = symptoms.get('pain_level', 5)
+
+            if curr_pain < prev_pain:
+                st.markdown(f"""
+                <div class="success-box">
+                    <p>📈 Your pain improved from {prev_pain} to {curr_pain}. That's progress!</p>
+                </div>
+                """, unsafe_allow_html=True)
+            elif curr_pain > prev_pain:
+                st.markdown(f"""
+                <div class="warning-box">
+                    <p>Pain increased from {prev_pain} to {curr_pain}. Keep monitoring and contact your doctor if it continues to rise.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("Complete Check-In", key="btn_complete", type="primary", use_container_width=True):
+            if state.check_in is not None:
+                state.check_in.update("daily_tip", tip=tip)
+            state.step = 'complete'
+            st.rerun()
+
+
+def show_complete():
+    content = get_content()
+    state = get_state()
+
+    import random
+
+    name = state.user_data.get('name', 'there')
+    day = state.user_data.get('day', 1)
+
+    # Commit the buffered check-in with a single save
+    if state.check_in is not None and commit(state.check_in, state.user_data, state.progress_data, state.stats):
+        save_progress(state.progress_data)
+        share_checkin(state.check_in.record(state.user_data), state.user_data.get('name'),
+                      get_checkin_engine(content.generation))
+        state.reload()
+
+    st.markdown(f"""
+    <div class="wellness-card" style="text-align: center; background: linear-gradient(135deg, #FFFFFF 0%, #E8F0E8 100%);">
+        <div class="emoji-large">🌸</div>
+        <h2 style="margin-bottom: 0.5rem;">You're All Set, {name}!</h2>
+        <p style="color: #3D4D3D; font-size: 1.1rem;">Day {day} check-in complete</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Affirmation
+    affirmation = random.choice(AFFIRMATIONS)
+    st.markdown(f"""
+    <div class="affirmation">{affirmation}</div>
+    """, unsafe_allow_html=True)
+
+    # Reminders
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="tip-card">
+            <h4 style="text-align: center;">Remember</h4>
+            <p style="text-align: center; line-height: 1.8;">
+                🌿 Rest is productive<br>
+                🕐 Healing takes time<br>
+                🌊 Trust the process<br>
+                📞 Call your surgeon with concerns
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="tip-card">
+            <h4 style="text-align: center;">What's Next</h4>
+            <p style="text-align: center; line-height: 1.8;">
+                Come back tomorrow<br>
+                for your next check-in!<br><br>
+                💚 Wishing you a<br>
+                smooth recovery
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ===== JOURNALING PROMPTS =====
+    st.markdown("#### 📝 Reflection Journal")
+
+    show_journal = st.checkbox("📓 Click to write in your recovery journal", key="show_journal")
+    if show_journal:
+        # Get random prompt - changes each time journal is opened
+        import random
+        import hashlib
+        # Use a combination of date and session to get different prompt each session
+        from datetime import datetime
+        seed_str = f"{datetime.now().strftime('%Y%m%d%H')}{id(st.session_state)}"
+        random.seed(int(hashlib.md5(seed_str.encode()).hexdigest(), 16) % (10**9))
+        today_prompt = random.choice(JOURNALING_PROMPTS)
+
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #FDF2F4 0%, #FFFFFF 100%);
+                    padding: 1.25rem; border-radius: 12px; margin-bottom: 1rem;">
+            <p style="color: #5A2D3A; font-weight: 600; margin: 0;">💭 Today's Prompt:</p>
+            <p style="color: #2D3A2D; font-size: 1.1rem; font-style: italic; margin: 0.5rem 0 0 0;">
+                "{today_prompt['prompt']}"
+            </p>
+            <p style="color: #555555; font-size: 0.75rem; margin-top: 0.5rem;">
+                <em>Prompts rotate randomly • {len(JOURNALING_PROMPTS)} prompts available</em>
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        journal = get_journal_store()
+        journal_entry = st.text_area(
+            "Your thoughts:",
+            value=journal.get(name, day),
+            height=150,
+            placeholder="Write freely - this is your private space to process your recovery journey...",
+            key=f"journal_input_{day}"
+        )
+
+        if st.button("Save Journal Entry", key="btn_save_journal"):
+            journal.save(name, day, journal_entry)
+            st.success("Journal entry saved! 💚")
+
+        # Show previous entries
+        recent = journal.page(name, 0, 3, with_text=False)
+        if recent:
+            st.markdown("---")
+            st.markdown("**Previous Entries:**")
+            for entry in recent:
+                st.markdown(f"""
+                <div style="background: #F5F0E8; padding: 0.75rem; border-radius: 8px; margin: 0.5rem 0;">
+                    <p style="color: #5C6B5C; font-size: 0.8rem; margin: 0;">Day {entry['day']}</p>
+                    <p style="color: #2D3A2D; margin: 0.25rem 0 0 0; font-size: 0.9rem;">{entry['preview']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ===== PHOTO PROGRESS TRACKER =====
+    st.markdown("#### 📸 Photo Progress Tracker")
+
+    show_photos = st.checkbox("📸 Click to track your visual progress", key="show_photos")
+    if show_photos:
+        photo_store = get_photo_store()
+
+        st.markdown("""
+        <div class="info-box">
+            <p>📱 <strong>Privacy Note:</strong> Photos are kept on the Recovery Buddy server with their
+            location and device details removed, and are deleted along with everything else when you choose Clear All Data.
+            This is your private record of your healing journey.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        uploaded_file = st.file_uploader(
+            f"Upload Day {day} photo",
+            type=['png', 'jpg', 'jpeg'],
+            help="Take a photo of your surgical area to track healing progress",
+            key="file_uploader_photo"
+        )
+
+        if uploaded_file is not None:
+            # Ingest each upload once; reruns only check on its processing status
+            upload_id = getattr(uploaded_file, "file_id", uploaded_file.name)
+            if state.photo_upload is None or state.photo_upload[0] != upload_id:
+                try:
+                    state.photo_upload = (upload_id, photo_store.ingest(uploaded_file), None)
+                except PhotoRejected as e:
+                    state.photo_upload = (upload_id, None, str(e))
+
+            _, photo_id, rejection = state.photo_upload
+            status = photo_store.status(photo_id) if photo_id else FAILED
+
+            if rejection:
+                st.error(f"⚠️ {rejection}")
+            elif status == PROCESSING:
+                st.info("⏳ Processing your photo... it will appear here in a moment.")
+                st.button("🔄 Refresh", key="btn_photo_refresh")
+            elif status == READY:
+                st.image(photo_store.variant(photo_id, "display"), caption=f"Day {day} - {datetime.now().strftime('%B %d, %Y')}", use_container_width=True)
+
+                photo_key = f"photo_{name}_{day}"
+                replaced = state.photos.get(photo_key)
+                if replaced != photo_id:
+                    state.photos[photo_key] = photo_id
+                    if replaced and replaced not in state.photos.values():
+                        photo_store.delete([replaced])
+                    state.progress_data['photos'] = state.photos
+                    save_progress(state.progress_data)
+
+                st.success(f"Photo saved for Day {day}! 📸")
+            else:
+                st.error("⚠️ We couldn't process that photo. Please try a different image.")
+
+        # Show comparison if multiple photos exist
+        if len(state.photos) > 1:
+            st.markdown("---")
+            st.markdown("**Compare Progress:**")
+
+            photo_days = sorted([int(k.split("_")[-1]) for k in state.photos.keys()])
+
+            if len(photo_days) >= 2:
+                comparer = get_photo_comparer()
+                view = st.radio("View:", ["Side by side", "Timelapse"], horizontal=True, key="compare_view")
+
+                if view == "Side by side":
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        day1 = st.selectbox("Compare Day:", photo_days[:-1], key="compare_day1")
+                    with col2:
+                        day2 = st.selectbox("With Day:", [d for d in photo_days if d > day1], key="compare_day2")
+
+                    if f"photo_{name}_{day1}" in state.photos and f"photo_{name}_{day2}" in state.photos:
+                        st.image(comparer.side_by_side(
+                            [state.photos[f"photo_{name}_{day1}"], state.photos[f"photo_{name}_{day2}"]],
+                            [f"Day {day1}", f"Day {day2}"],
+                        ), use_container_width=True)
+                else:
+                    timelapse_days = [d for d in photo_days if f"photo_{name}_{d}" in state.photos]
+                    if len(timelapse_days) >= 2:
+                        st.image(comparer.timelapse(
+                            [state.photos[f"photo_{name}_{d}"] for d in timelapse_days],
+                            [f"Day {d}" for d in timelapse_days],
+                        ), caption=f"Day {timelapse_days[0]} to Day {timelapse_days[-1]}")
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("Start New Check-In", key="btn_new_checkin", type="primary", use_container_width=True):
+            state.step = 'welcome'
+            state.user_data = {}
+            state.check_in = None
+            st.rerun()
+
+    # ===== FOOTER WITH COPYRIGHT, DISCLAIMER, LEGAL LINKS =====
+    st.markdown(f"""
+    <div class="app-footer">
+        <p class="copyright-text">
+            © 2026 Recovery Buddy. All rights reserved.<br>
+            For informational purposes only. Not a substitute for professional medical advice.
+        </p>
+        <p class="copyright-text">
+            Created with 💚 by Ashmita Sharma
+        </p>
+        <p class="copyright-text">
+            <a href="mailto:contact@recoverybuddy.app">Questions? Contact us</a>
+        </p>
+        <p class="version-text">v{APP_VERSION}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Medical review date
+    st.markdown(f"""
+    <p style="text-align: center; color: #555555; font-size: 0.75rem; margin-top: 0.5rem;">
+        📚 Medical information last reviewed: {content.medical_review} • 🔒 Data stored locally
+    </p>
+    """, unsafe_allow_html=True)
+
+    # Footer navigation links
+    st.markdown("<div style='text-align: center; margin-top: 0.5rem;'>", unsafe_allow_html=True)
+    footer_cols = st.columns([1, 1, 1, 1, 1, 1])
+    with footer_cols[0]:
+        if st.button("🏠 Home", key="footer_home"):
+            state.step = 'welcome'
+            st.rerun()
+    with footer_cols[1]:
+        if st.button("📊 Progress", key="footer_progress"):
+            state.step = 'dashboard'
+            st.rerun()
+    with footer_cols[2]:
+        if st.button("Terms", key="footer_terms"):
+            state.step = 'terms'
+            st.rerun()
+    with footer_cols[3]:
+        if st.button("Privacy", key="footer_privacy"):
+            state.step = 'privacy'
+            st.rerun()
+    with footer_cols[4]:
+        if st.button("References", key="footer_references"):
+            state.step = 'references'
+            st.rerun()
+    with footer_cols[5]:
+        if st.button("About", key="footer_about"):
+            state.step = 'about'
+            st.rerun()
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,176 @@
+"""
+Page chrome: stylesheets and embedded snippets, header, step progress bar
+and bottom navigation.
+"""
+
+import streamlit as st
+
+from views.common import inject_css, embed_html, STEPS, get_state, get_step_index
+
+
+def render_chrome():
+    """Stylesheets and snippets every run starts with"""
+    # Hide Streamlit branding for professional appearance
+    inject_css("branding")
+    # Google Analytics, injected into the parent frame for reliable tracking
+    embed_html("analytics")
+    # PWA (Progressive Web App) setup
+    embed_html("pwa")
+    # Custom CSS - luxury wellness spa aesthetic
+    inject_css("theme")
+
+
+def render_progress_bar():
+    state = get_state()
+
+    current_step = state.step
+    current_index = get_step_index(current_step)
+
+    # Use Streamlit columns for the progress bar
+    cols = st.columns(len(STEPS))
+
+    for i, step in enumerate(STEPS):
+        with cols[i]:
+            if i < current_index:
+                # Completed step
+                st.markdown(f"""
+                <div style="text-align: center;">
+                    <div style="width: 40px; height: 40px; border-radius: 50%;
+                         background: linear-gradient(135deg, #A8C5A8 0%, #5A7A5A 100%);
+                         color: white; display: flex; align-items: center; justify-content: center;
+                         margin: 0 auto 8px auto; font-size: 16px; font-weight: 600;">✓</div>
+                    <span style="font-size: 11px; color: #3A4A3A; font-weight: 500;">{step['label']}</span>
+                </div>
+                """, unsafe_allow_html=True)
+            elif i == current_index:
+                # Active step
+                st.markdown(f"""
+                <div style="text-align: center;">
+                    <div style="width: 44px; height: 44px; border-radius: 50%;
+                         background: linear-gradient(135deg, #F5D5DC 0%, #E8B4BC 100%);
+                         color: #2D3A2D; display: flex; align-items: center; justify-content: center;
+                         margin: 0 auto 8px auto; font-size: 18px;
+                         box-shadow: 0 4px 15px rgba(232, 180, 188, 0.4);">{step['icon']}</div>
+                    <span style="font-size: 11px; color: #2D3A2D; font-weight: 600;">{step['label']}</span>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                # Pending step
+                st.markdown(f"""
+                <div style="text-align: center;">
+                    <div style="width: 40px; height: 40px; border-radius: 50%;
+                         background: #F5F0E8; color: #6B7B6B;
+                         display: flex; align-items: center; justify-content: center;
+                         margin: 0 auto 8px auto; font-size: 16px;">{step['icon']}</div>
+                    <span style="font-size: 11px; color: #6B7B6B; font-weight: 500;">{step['label']}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+
+def render_bottom_nav():
+    """Render bottom navigation bar using native Streamlit components"""
+    state = get_state()
+
+    current_step = state.step
+
+    # Map current step to nav item for highlighting
+    step_to_nav = {
+        "welcome": "welcome",
+        "dashboard": "dashboard",
+        "get_info": "get_info",
+        "physical_checkin": "get_info",
+        "symptom_results": "get_info",
+        "emotional_checkin": "get_info",
+        "daily_tip": "get_info",
+        "complete": "get_info",
+        "mood_tracker": "mood_tracker",
+        "self_care": "mood_tracker",
+        "settings": "settings",
+        "about": "settings",
+        "surgery_resources": "dashboard",
+        "faq": "dashboard",
+        "symptom_checker": "get_info",
+        "emergency_contacts": "settings",
+    }
+
+    active_nav = step_to_nav.get(current_step, "welcome")
+
+    # Add divider before navigation
+    st.divider()
+
+    # Create bottom navigation with Streamlit columns
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        btn_type = "primary" if active_nav == "welcome" else "secondary"
+        if st.button("🏠 Home", key="nav_home", use_container_width=True, type=btn_type):
+            state.step = "welcome"
+            st.rerun()
+
+    with col2:
+        btn_type = "primary" if active_nav == "dashboard" else "secondary"
+        if st.button("📊 Progress", key="nav_progress", use_container_width=True, type=btn_type):
+            state.step = "dashboard"
+            st.rerun()
+
+    with col3:
+        btn_type = "primary" if active_nav == "get_info" else "secondary"
+        if st.button("✅ Check-in", key="nav_checkin", use_container_width=True, type=btn_type):
+            state.step = "get_info"
+            st.rerun()
+
+    with col4:
+        btn_type = "primary" if active_nav == "mood_tracker" else "secondary"
+        if st.button("😊 Mood", key="nav_mood", use_container_width=True, type=btn_type):
+            state.step = "mood_tracker"
+            st.rerun()
+
+    with col5:
+        btn_type = "primary" if active_nav == "settings" else "secondary"
+        if st.button("⚙️ Settings", key="nav_settings", use_container_width=True, type=btn_type):
+            state.step = "settings"
+            st.rerun()
+
+
+def render_header():
+    st.markdown("""
+    <div class="logo-header">
+        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 520 140" width="480" height="130" style="max-width: 100%;">
+          <defs>
+            <linearGradient id="hPetalG" x1="0%" y1="0%" x2="100%" y2="100%">
+              <stop offset="0%" style="stop-color:#A8C5A8;stop-opacity:1" />
+              <stop offset="100%" style="stop-color:#C8D8C8;stop-opacity:1" />
+            </linearGradient>
+            <linearGradient id="hPetalP" x1="0%" y1="0%" x2="100%" y2="100%">
+              <stop offset="0%" style="stop-color:#F5D5DC;stop-opacity:1" />
+              <stop offset="100%" style="stop-color:#FFEEF2;stop-opacity:1" />
+            </linearGradient>
+          </defs>
+          <!-- Outer petals (sage green) - enlarged -->
+          <ellipse cx="65" cy="45" rx="16" ry="38" fill="url(#hPetalG)" transform="rotate(-30 65 65)" opacity="0.8"/>
+          <ellipse cx="65" cy="45" rx="16" ry="38" fill="url(#hPetalG)" transform="rotate(30 65 65)" opacity="0.8"/>
+          <ellipse cx="65" cy="45" rx="16" ry="38" fill="url(#hPetalG)" transform="rotate(-60 65 65)" opacity="0.7"/>
+          <ellipse cx="65" cy="45" rx="16" ry="38" fill="url(#hPetalG)" transform="rotate(60 65 65)" opacity="0.7"/>
+          <!-- Middle petals (soft pink) - enlarged -->
+          <ellipse cx="65" cy="50" rx="13" ry="32" fill="url(#hPetalP)" transform="rotate(-20 65 65)" opacity="0.9"/>
+          <ellipse cx="65" cy="50" rx="13" ry="32" fill="url(#hPetalP)" transform="rotate(20 65 65)" opacity="0.9"/>
+          <ellipse cx="65" cy="50" rx="13" ry="32" fill="url(#hPetalP)" transform="rotate(-45 65 65)" opacity="0.85"/>
+          <ellipse cx="65" cy="50" rx="13" ry="32" fill="url(#hPetalP)" transform="rotate(45 65 65)" opacity="0.85"/>
+          <!-- Inner petals - enlarged -->
+          <ellipse cx="65" cy="55" rx="10" ry="24" fill="#FFEEF2" transform="rotate(-10 65 65)" opacity="0.95"/>
+          <ellipse cx="65" cy="55" rx="10" ry="24" fill="#FFEEF2" transform="rotate(10 65 65)" opacity="0.95"/>
+          <ellipse cx="65" cy="58" rx="8" ry="20" fill="#FDFBF7" opacity="0.9"/>
+          <!-- Center - enlarged -->
+          <circle cx="65" cy="65" r="13" fill="#FDFBF7" stroke="#E8B4BC" stroke-width="1.5"/>
+          <circle cx="65" cy="65" r="8" fill="#A8C5A8" opacity="0.6"/>
+          <circle cx="65" cy="65" r="4" fill="#5A7A5A" opacity="0.4"/>
+          <!-- Text: Recovery Buddy - larger -->
+          <text x="145" y="62" font-family="Georgia, serif" font-size="48" font-weight="600" fill="#5A7A5A">Recovery</text>
+          <text x="370" y="62" font-family="Georgia, serif" font-size="48" font-weight="600" fill="#8FB58F">Buddy</text>
+          <!-- Tagline - larger -->
+          <text x="145" y="100" font-family="Arial, sans-serif" font-size="16" fill="#8B9B8B">Bloom through your recovery journey</text>
+        </svg>
+    </div>
+    """, unsafe_allow_html=True)
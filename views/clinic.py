@@ -0,0 +1,79 @@
+"""
+Clinic page: every patient's latest check-in day, most severe first.
+
+Reads the patient summaries the JSON API keeps in its check-in database.
+Check-ins completed in the app are added to the same database when the app
+is started with it, so a clinician can see who logged high pain or an urgent symptom today across
+all patients a page at a time. Each filter is answered from an index on
+the patients table rather than by reading anyone's check-ins. It is a page
+of the staff console, so only signed-in staff can open it.
+"""
+
+import streamlit as st
+from datetime import date
+
+from recovery_buddy.checkin_store import CLINIC_PAGE_SIZE
+from recovery_buddy.engine import SEVERITY_HIGH_PAIN, SEVERITY_OK, SEVERITY_URGENT, SEVERITY_WATCH
+
+from views.common import get_checkin_store, get_content, get_profiler
+
+# Filter label -> lowest severity shown
+SEVERITY_FILTERS = {
+    "High pain or urgent": SEVERITY_HIGH_PAIN,
+    "Urgent only": SEVERITY_URGENT,
+    "Anything above typical": SEVERITY_WATCH,
+    "Everyone": SEVERITY_OK,
+}
+
+SEVERITY_LABELS = {
+    SEVERITY_URGENT: "🔴 Urgent",
+    SEVERITY_HIGH_PAIN: "🟠 High pain",
+    SEVERITY_WATCH: "🟡 Above typical",
+    SEVERITY_OK: "🟢 As expected",
+}
+
+
+def show_clinic():
+    """Paged list of patients by severity of their latest check-in day"""
+    store = get_checkin_store()
+
+    st.markdown("### 🏥 Clinic")
+    if store is None:
+        st.info("The clinic view is off. Start the app with RECOVERY_BUDDY_CLINIC_DB set to the API's "
+                "check-in database (recovery_checkins.db) to turn it on.")
+        return
+
+    procedures = get_content().procedures
+    date_col, filter_col, procedure_col, page_col = st.columns([2, 2, 2, 1])
+    with date_col:
+        checked_in = st.date_input("Checked in on", value=date.today(), key="clinic_date")
+        any_date = st.checkbox("Any date", value=False, key="clinic_any_date")
+    with filter_col:
+        show = st.selectbox("Show", list(SEVERITY_FILTERS), key="clinic_show")
+    with procedure_col:
+        procedure = st.selectbox("Procedure", [None] + sorted(procedures), key="clinic_procedure",
+                                 format_func=lambda key: "All procedures" if key is None
+                                 else procedures.get(key, {}).get('name', key))
+    with page_col:
+        page = st.number_input("Page", min_value=1, value=1, step=1, key="clinic_page")
+
+    with get_profiler().time("storage", "clinic_patients"):
+        patients, total = store.patients(None if any_date else checked_in.isoformat(), SEVERITY_FILTERS[show],
+                                         procedure, limit=CLINIC_PAGE_SIZE, offset=(page - 1) * CLINIC_PAGE_SIZE)
+
+    pages = max(1, -(-total // CLINIC_PAGE_SIZE))
+    st.caption(f"{total} patient{'' if total == 1 else 's'} • page {page} of {pages}")
+    if not patients:
+        st.write("No patients match." if total == 0 else "No patients on this page.")
+        return
+
+    st.dataframe([{
+        "Patient": patient['name'],
+        "Procedure": procedures.get(patient['procedure'], {}).get('name', patient['procedure']),
+        "Day": patient['day'],
+        "Last check-in": patient['last_check_in'],
+        "Status": SEVERITY_LABELS.get(patient['severity'], patient['severity']),
+        "Pain (latest)": patient['pain_level'],
+        "Worst pain that day": patient['max_pain'],
+        "Check-ins": patient['checkins'],
+    } for patient in patients], use_container_width=True, hide_index=True)
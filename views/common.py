@@ -0,0 +1,316 @@
+"""
+Shared resources and per-session state for the pages.
+
+Anything shared across sessions is created by a @st.cache_resource accessor.
+Anything specific to one session is reached through get_state() or
+get_content(). This module is imported once per process and its globals are
+seen by every session, so it must never hold per-user data.
+"""
+
+import streamlit as st
+import streamlit.components.v1 as components
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from recovery_buddy.assets import html_snippet, style_block
+from recovery_buddy.checkin_store import CheckInStore
+from recovery_buddy.citations import CitationIndex
+from recovery_buddy.content_store import ContentStore
+from recovery_buddy.copy_text import (AFFIRMATIONS, DAILY_TIPS, DEFAULT_TIPS, MEDICAL_SOURCES,
+                                      PROCEDURE_MILESTONES, RECOVERY_MILESTONES)
+from recovery_buddy.engine import CheckIn, CheckInEngine, assessment_record, build_symptoms
+from recovery_buddy.fileio import atomic_write
+from recovery_buddy.journal import JournalStore
+from recovery_buddy.milestones import MilestoneIndex
+from recovery_buddy.photo_compare import PhotoComparer
+from recovery_buddy.photos import PhotoStore
+from recovery_buddy.profiler import Profiler, serve_metrics
+from recovery_buddy.session import RecoveryState
+from recovery_buddy.telemetry import ErrorReporter
+from recovery_buddy.triage import SYMPTOM_CHECKER, SymptomTriage
+
+
+@st.cache_resource
+def get_profiler():
+    """Shared render profiler; off unless RECOVERY_BUDDY_PROFILE=1.
+
+    Set RECOVERY_BUDDY_METRICS_PORT as well to serve Prometheus text on /metrics.
+    """
+    profiler = Profiler(enabled=os.environ.get("RECOVERY_BUDDY_PROFILE") == "1")
+    port = os.environ.get("RECOVERY_BUDDY_METRICS_PORT")
+    if profiler.enabled and port:
+        serve_metrics(profiler, int(port))
+    return profiler
+
+
+def inject_css(name):
+    """Inject assets/<name>.css"""
+    with get_profiler().time("css", name):
+        st.markdown(style_block(name), unsafe_allow_html=True)
+
+
+def embed_html(name, height=0):
+    """Embed assets/<name>.html as a component"""
+    with get_profiler().time("component", name):
+        components.html(html_snippet(name), height=height)
+
+
+# App version
+APP_VERSION = "2.0.0"
+APP_CREATOR = "Ashmita Sharma"
+
+# Medical content (procedures, FAQs, review date) is hot-reloaded from content/
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "content")
+
+
+@st.cache_resource
+def get_content_store():
+    """Shared content store, loaded once per server process"""
+    return ContentStore(CONTENT_DIR)
+
+
+def get_content():
+    """Content snapshot this session is pinned to.
+
+    A session keeps the snapshot it started the current page with and only
+    moves to newer content when it navigates to another page.
+    """
+    store = get_content_store()
+    state = get_state()
+    if state.content_generation is None or state.content_step != state.step:
+        state.content_generation = store.latest().generation
+        state.content_step = state.step
+    return store.get(state.content_generation)
+
+
+# ============================================
+# COZY MESSAGES AND AFFIRMATIONS
+# ============================================
+
+def get_time_greeting(name):
+    """Get time-based greeting"""
+    hour = datetime.now().hour
+    if 5 <= hour < 12:
+        return f"Good morning, {name}! How are you feeling today? ☀️"
+    elif 12 <= hour < 17:
+        return f"Good afternoon, {name}! Hope you're having a gentle day 🌸"
+    elif 17 <= hour < 21:
+        return f"Good evening, {name}! Time to rest and heal 🌙"
+    else:
+        return f"Hey {name}, remember to get good sleep tonight 💤"
+
+# Mascot expressions based on recovery day
+def get_mascot_message(day):
+    """Get mascot message based on recovery day"""
+    if day <= 3:
+        return {"emoji": "🌸", "expression": "determined", "message": "Hang in there! The first few days are the hardest."}
+    elif day <= 7:
+        return {"emoji": "🌸", "expression": "encouraging", "message": "You're doing great! Keep resting!"}
+    elif day <= 14:
+        return {"emoji": "🌸", "expression": "happy", "message": "Look at you go! Over a week of healing!"}
+    elif day <= 30:
+        return {"emoji": "🌸", "expression": "proud", "message": "Amazing progress! You're a healing superstar!"}
+    else:
+        return {"emoji": "🌸", "expression": "celebrating", "message": "Look how far you've come! 🎉"}
+
+@st.cache_resource
+def get_symptom_triage():
+    """Shared symptom triage tables, built once per server process"""
+    return SymptomTriage(SYMPTOM_CHECKER)
+
+
+@st.cache_resource
+def get_citation_index():
+    """Shared citation index, built once per server process"""
+    return CitationIndex(MEDICAL_SOURCES)
+
+
+def get_citation_html(source_keys, inline=True):
+    """Generate citation HTML for given source keys"""
+    citations = get_citation_index()
+    if inline:
+        return citations.inline(source_keys)
+    return citations.anchors(source_keys)
+
+
+# File to store progress data
+PROGRESS_FILE = "recovery_progress.json"
+
+# Ring buffer of recent error reports (fixed size; oldest overwritten first)
+ERROR_LOG = os.environ.get("RECOVERY_BUDDY_ERROR_LOG", "recovery_errors.ring")
+
+# Folder for progress photos and their downscaled variants
+PHOTO_DIR = "recovery_photos"
+
+# Folder for journal entries and their indexes
+JOURNAL_DIR = "recovery_journal"
+JOURNAL_PAGE_SIZE = 5
+
+# The JSON API's check-in database; the clinic view is only offered when it's set
+CLINIC_DB = os.environ.get("RECOVERY_BUDDY_CLINIC_DB")
+
+# Access code for the staff console (?staff); the console stays locked without it
+STAFF_TOKEN = os.environ.get("RECOVERY_BUDDY_STAFF_TOKEN")
+
+# Steps configuration
+STEPS = [
+    {"key": "welcome", "label": "Welcome", "icon": "👋"},
+    {"key": "get_info", "label": "About You", "icon": "📋"},
+    {"key": "physical_checkin", "label": "Physical", "icon": "🩺"},
+    {"key": "emotional_checkin", "label": "Emotional", "icon": "💭"},
+    {"key": "daily_tip", "label": "Tips", "icon": "💡"},
+    {"key": "complete", "label": "Complete", "icon": "✨"},
+]
+
+
+@st.cache_resource(max_entries=4)
+def get_checkin_engine(content_generation):
+    """Check-in engine (with its compiled symptom ranges) for a content snapshot, built once per process"""
+    procedures = get_content_store().get(content_generation).procedures
+    return CheckInEngine(procedures, DEFAULT_TIPS, get_symptom_triage())
+
+
+
+@st.cache_resource
+def get_milestone_index():
+    """Shared milestone schedules, built once per server process"""
+    return MilestoneIndex(PROCEDURE_MILESTONES, RECOVERY_MILESTONES)
+
+
+
+def load_progress():
+    with get_profiler().time("storage", "load_progress"):
+        if os.path.exists(PROGRESS_FILE):
+            try:
+                with open(PROGRESS_FILE, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                # Unreadable or corrupt: start fresh, but keep a record of why
+                report_error(e, step='load_progress', context={"file": PROGRESS_FILE})
+                return {}
+        return {}
+
+
+def save_progress(data):
+    # Written to a temp file and renamed into place so a save is all-or-nothing
+    with get_profiler().time("storage", "save_progress"):
+        atomic_write(PROGRESS_FILE, json.dumps(data, indent=2).encode('utf-8'))
+
+
+@st.cache_resource
+def get_checkin_store():
+    """Shared check-in database for the clinic view, or None when RECOVERY_BUDDY_CLINIC_DB isn't set"""
+    return CheckInStore(CLINIC_DB) if CLINIC_DB else None
+
+
+def share_checkin(record, name, engine):
+    """Add a committed check-in record to the clinic's check-in database, when one is configured.
+
+    The clinic page reads only that database, so without it check-ins made
+    in the app stay in the progress file.
+    """
+    store = get_checkin_store()
+    if store is None or not name or record['pain_level'] is None:
+        return
+    symptoms = build_symptoms(record['swelling'], record['bruising'], record['bleeding'], record['fever'],
+                              record['temperature'], record['numbness'], record['notes'])
+    check_in = CheckIn(name, engine.stored_procedure(record['procedure']), record['day'], record['pain_level'],
+                       symptoms, record['mood'], record['date'])
+    try:
+        with get_profiler().time("storage", "share_checkin"):
+            store.submit(check_in, lambda entries: assessment_record(engine.assess(check_in, entries)))
+    except sqlite3.Error as e:
+        # The patient's own save has already happened; the clinic copy is best effort
+        report_error(e, step='complete', context={"database": CLINIC_DB})
+
+
+@st.cache_resource
+def get_photo_store():
+    """Shared on-disk photo store"""
+    return PhotoStore(PHOTO_DIR)
+
+
+@st.cache_resource
+def get_photo_comparer():
+    """Shared comparison renderer with its on-disk cache"""
+    return PhotoComparer(get_photo_store())
+
+
+@st.cache_resource
+def get_journal_store():
+    """Shared journal store with its day-ordered and full-text indexes"""
+    return JournalStore(JOURNAL_DIR)
+
+
+@st.cache_resource
+def get_error_reporter():
+    """Shared error reporter; RECOVERY_BUDDY_ERROR_SAMPLE sets the share of errors kept"""
+    sample_rate = float(os.environ.get("RECOVERY_BUDDY_ERROR_SAMPLE", "1.0"))
+    # A per-process salt, so hashed session ids can't be matched across restarts
+    return ErrorReporter(ERROR_LOG, sample_rate=sample_rate, salt=os.urandom(8).hex())
+
+
+def current_session_id():
+    """Streamlit's id for the session running this script, if there is one"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except ImportError:
+        return None
+    return ctx.session_id if ctx else None
+
+
+def report_error(error, step=None, timings=None, context=None):
+    """Record an exception with the session's step and the page's usual timings"""
+    state = st.session_state.get('recovery')
+    if step is None and state is not None:
+        step = state.step
+    timings = dict(timings or {})
+    page = get_profiler().row("page", step) if step else None
+    if page:
+        timings.update(page_p50_ms=round(page["p50_ms"], 2), page_p95_ms=round(page["p95_ms"], 2))
+    get_error_reporter().capture(error, step=step, session_id=current_session_id(),
+                                 timings=timings, context=context)
+
+
+def migrate_journal(state):
+    """Move journal entries kept in the progress data (older saves, imports) into the journal store"""
+    entries = state.progress_data.pop('journal_entries', None)
+    if entries is not None:
+        get_journal_store().import_entries(entries)
+        save_progress(state.progress_data)
+
+
+def discard_export(state):
+    """Remove the session's prepared export file, if it has one"""
+    if state.export_file and os.path.exists(state.export_file[1]):
+        os.remove(state.export_file[1])
+    state.export_file = None
+
+
+def clear_all_data(state):
+    """Delete everything kept for this person: photos and their comparisons, journal, export and saved progress"""
+    discard_export(state)
+    get_photo_store().delete(set(state.photos.values()))
+    get_journal_store().clear(state.progress_data.get('name', ''))
+    state.clear_data()
+    if os.path.exists(PROGRESS_FILE):
+        os.remove(PROGRESS_FILE)
+
+
+def get_state():
+    """Typed state for this session, created on first use"""
+    state = st.session_state.get('recovery')
+    if state is None:
+        state = st.session_state.recovery = RecoveryState(load_progress(), len(DAILY_TIPS), len(AFFIRMATIONS))
+        migrate_journal(state)
+    return state
+
+
+def get_step_index(step_key):
+    for i, step in enumerate(STEPS):
+        if step["key"] == step_key:
+            return i
+    return 0
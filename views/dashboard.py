@@ -0,0 +1,406 @@
+"""
+Progress dashboard: stats, trends, medications, journal history, photo
+tracker, export/import and data reset.
+"""
+
+import streamlit as st
+import io
+import os
+from datetime import datetime
+
+from recovery_buddy.export import EXPORT_FORMATS, create_export, prune_exports
+from recovery_buddy.restore import RestoreError, restore
+from recovery_buddy.trends import chart_points, describe_trend, mood_series, pain_series
+
+from views.chrome import render_header
+from views.common import (APP_VERSION, get_content, JOURNAL_PAGE_SIZE, get_milestone_index, save_progress,
+                          get_journal_store, clear_all_data, discard_export, get_state)
+
+
+def render_trend(days, values, label, higher_is_worse=True):
+    """Compact downsampled chart with its 7-day average, plus a note on any run"""
+    import pandas as pd
+
+    dates, kept, means = chart_points(days, values)
+    df = pd.DataFrame({label: kept, "7-day average": means}, index=pd.Index(dates, name="Date"))
+    if len(df) > 1:
+        st.line_chart(df, height=200, use_container_width=True)
+    else:
+        st.bar_chart(df[label], height=200, use_container_width=True)
+
+    trend = describe_trend(days, values, f"Your {label.lower()}", higher_is_worse=higher_is_worse)
+    if trend:
+        note, worsening = trend
+        if worsening:
+            st.warning(f"⚠️ {note}")
+        else:
+            st.success(f"💚 {note}")
+
+
+def show_dashboard():
+    """My Data - Comprehensive view of all saved recovery data"""
+    content = get_content()
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>📊 My Data</h3>
+        <p style="color: #3D4D3D;">View and manage all your recovery information in one place.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Privacy notice
+    st.markdown("""
+    <div class="privacy-badge">
+        🔒 All data is stored locally on your device only - never sent to any server
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Get all user data
+    name = state.progress_data.get('name', 'Not set')
+    procedure_key = state.progress_data.get('procedure', '')
+    procedure_name = content.procedures.get(procedure_key, {}).get('name', procedure_key) if procedure_key else 'Not set'
+    surgery_date = state.progress_data.get('surgery_date', 'Not set')
+    day = state.user_data.get('day', state.progress_data.get('day', 0))
+    stats = state.stats
+    streak = stats.current_streak()
+    total_checkins = stats.total_checkins
+    journal = get_journal_store()
+    total_journals = journal.count(name)
+    medications = state.progress_data.get('medications', [])
+    schedule = get_milestone_index().schedule(procedure_key)
+    next_milestone = schedule.next_milestone(day)
+    days_to_milestone = schedule.days_remaining(day)
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # ===== STATS ROW =====
+    st.markdown("### 📈 Quick Stats")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-value">📅 {day}</div>
+            <div class="stat-label">Recovery Day</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-value">🔥 {streak}</div>
+            <div class="stat-label">Day Streak</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-value">📋 {total_checkins}</div>
+            <div class="stat-label">Check-ins</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-value">📝 {total_journals}</div>
+            <div class="stat-label">Journal Entries</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # ===== MY INFORMATION =====
+    st.markdown("### 👤 My Information")
+    info_col1, info_col2 = st.columns(2)
+
+    with info_col1:
+        st.markdown(f"""
+        <div style="background: #FFFFFF; border: 1px solid #E8F0E8; border-radius: 12px; padding: 1.25rem;">
+            <p style="margin: 0.5rem 0;"><strong>Name:</strong> {name}</p>
+            <p style="margin: 0.5rem 0;"><strong>Procedure:</strong> {procedure_name}</p>
+            <p style="margin: 0.5rem 0;"><strong>Surgery Date:</strong> {surgery_date}</p>
+            <p style="margin: 0.5rem 0;"><strong>Recovery Day:</strong> Day {day}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with info_col2:
+        st.markdown(f"""
+        <div style="background: #F5F0E8; border: 1px solid #E8D5C4; border-radius: 12px; padding: 1.25rem;">
+            <p style="margin: 0; font-weight: 600; color: #5A7A5A;">🎯 Recovery Progress</p>
+            <p style="margin: 0.5rem 0; color: #3D4D3D;">You've completed {total_checkins} check-in{'s' if total_checkins != 1 else ''}</p>
+            <p style="margin: 0.5rem 0; color: #3D4D3D;">You've written {total_journals} journal entr{'ies' if total_journals != 1 else 'y'}</p>
+            <p style="margin: 0.5rem 0; color: #3D4D3D;">Current streak: {streak} day{'s' if streak != 1 else ''}</p>
+            {f'<p style="margin: 0.5rem 0; color: #3D4D3D;">Next milestone: {next_milestone["icon"]} {next_milestone["milestone"]} in {days_to_milestone} day{"s" if days_to_milestone != 1 else ""}</p>' if next_milestone else ''}
+        </div>
+        """, unsafe_allow_html=True)
+
+    # ===== ROLLING AVERAGES =====
+    if total_checkins or stats.total_mood_entries:
+        st.markdown("#### 🗓️ Last 7 / 30 Days")
+
+        def format_window(value, scale="", percent=False):
+            if value is None:
+                return "—"
+            return f"{value:.0%}" if percent else f"{value:.1f}{scale}"
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Avg pain", f"{format_window(stats.pain_average(7), '/10')} · {format_window(stats.pain_average(30), '/10')}")
+        with col2:
+            st.metric("Avg mood", f"{format_window(stats.mood_average(7), '/5')} · {format_window(stats.mood_average(30), '/5')}")
+        with col3:
+            st.metric("Check-in rate", f"{format_window(stats.completion_rate(7), percent=True)} · {format_window(stats.completion_rate(30), percent=True)}")
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # ===== PAIN & MOOD TRENDS =====
+    st.markdown("### 📈 Pain Trend")
+    person = state.progress_data.get(name)
+    entries = person.get('entries', []) if isinstance(person, dict) else []
+    pain_days, pain_values = pain_series(state.pain_history or entries)
+    if pain_days:
+        render_trend(pain_days, pain_values, "Pain")
+
+        # Show average
+        avg_pain = stats.pain_average(30)
+        if avg_pain is not None:
+            st.markdown(f"**Average pain level (30 days):** {avg_pain:.1f}/10")
+    else:
+        st.markdown("""
+        <div style="background: #F5F5F5; padding: 1.5rem; border-radius: 12px; text-align: center;">
+            <p style="color: #666; margin: 0;">📊 No pain data recorded yet. Complete a daily check-in to start tracking your pain levels.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    mood_days, mood_values = mood_series(state.mood_history)
+    if mood_days:
+        st.markdown("### 😊 Mood Trend")
+        render_trend(mood_days, mood_values, "Mood", higher_is_worse=False)
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # ===== CHECK-IN HISTORY =====
+    st.markdown("### 📋 Check-in History")
+    if state.check_in_history and len(state.check_in_history) > 0:
+        # Show all check-ins in an expandable section
+        with st.expander(f"View all {len(state.check_in_history)} check-ins", expanded=False):
+            for i, checkin in enumerate(reversed(state.check_in_history)):
+                checkin_day = checkin.get('day', '?')
+                checkin_date = checkin.get('date', 'Unknown date')
+                pain_level = checkin.get('pain_level', 'N/A')
+                mood = checkin.get('mood', 'N/A')
+                symptoms = checkin.get('symptoms', [])
+
+                st.markdown(f"""
+                <div style="background: #FFFFFF; border: 1px solid #E8F0E8; border-radius: 8px; padding: 1rem; margin: 0.5rem 0;">
+                    <p style="font-weight: 600; color: #5A7A5A; margin: 0;">Day {checkin_day} - {checkin_date}</p>
+                    <p style="margin: 0.25rem 0; color: #3D4D3D;">Pain: {pain_level}/10 • Mood: {mood}</p>
+                    {f'<p style="margin: 0.25rem 0; color: #666; font-size: 0.9rem;">Symptoms: {", ".join(symptoms)}</p>' if symptoms else ''}
+                </div>
+                """, unsafe_allow_html=True)
+
+        # Show recent check-ins summary
+        st.markdown("**Recent check-ins:**")
+        for entry in state.check_in_history[-5:]:
+            checkin_date = entry.get('date', 'Unknown')
+            pain = entry.get('pain_level', 'N/A')
+            st.markdown(f"• Day {entry.get('day', '?')} ({checkin_date}): Pain {pain}/10")
+    else:
+        st.markdown("""
+        <div style="background: #F5F5F5; padding: 1.5rem; border-radius: 12px; text-align: center;">
+            <p style="color: #666; margin: 0;">📋 No check-ins recorded yet. Start your first daily check-in!</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # ===== JOURNAL ENTRIES =====
+    st.markdown("### 📝 Journal Entries")
+    if total_journals:
+        with st.expander(f"View all {total_journals} journal entries", expanded=False):
+            search_col, page_col = st.columns([3, 1])
+            with search_col:
+                query = st.text_input("🔍 Search your journal", placeholder="e.g. swelling, sleep, walk", key="journal_search")
+            with page_col:
+                page = st.number_input("Page", min_value=1, value=1, step=1, key="journal_page")
+
+            entries, matches = journal.search(name, query, page - 1, JOURNAL_PAGE_SIZE)
+            pages = max(1, -(-matches // JOURNAL_PAGE_SIZE))
+            st.caption(f"{matches} entr{'y' if matches == 1 else 'ies'} • page {page} of {pages}")
+            for entry in entries:
+                st.markdown(f"""
+                <div style="background: #FFF9F0; border-left: 4px solid #E8B4BC; border-radius: 0 8px 8px 0; padding: 1rem; margin: 0.5rem 0;">
+                    <p style="font-size: 0.8rem; color: #555555; margin: 0 0 0.5rem 0;">Day {entry['day']} • {entry['date']}</p>
+                    <p style="color: #2D3A2D; margin: 0; white-space: pre-wrap;">{entry['text']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        # Show recent entries
+        st.markdown("**Recent entries:**")
+        for entry in journal.page(name, 0, 3, with_text=False):
+            st.markdown(f"• *\"{entry['preview']}\"*")
+    else:
+        st.markdown("""
+        <div style="background: #F5F5F5; padding: 1.5rem; border-radius: 12px; text-align: center;">
+            <p style="color: #666; margin: 0;">📝 No journal entries yet. Express your thoughts in the Emotional Check-in section!</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # ===== MEDICATIONS =====
+    st.markdown("### 💊 Medications")
+    if medications:
+        for med in medications:
+            st.markdown(f"• {med}")
+    else:
+        st.markdown("""
+        <div style="background: #F5F5F5; padding: 1rem; border-radius: 12px;">
+            <p style="color: #666; margin: 0;">No medications recorded. You can add medications below.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Add medication input
+    with st.expander("➕ Add a medication"):
+        new_med = st.text_input("Medication name", key="new_medication_input", placeholder="e.g., Ibuprofen 400mg")
+        if st.button("Add Medication", key="btn_add_med"):
+            if new_med.strip():
+                if 'medications' not in state.progress_data:
+                    state.progress_data['medications'] = []
+                state.progress_data['medications'].append(new_med.strip())
+                save_progress(state.progress_data)
+                st.success(f"Added: {new_med}")
+                st.rerun()
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # ===== ACTION BUTTONS =====
+    st.markdown("### ⚡ Actions")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("✏️ Edit My Info", key="dash_edit", use_container_width=True):
+            state.step = 'get_info'
+            st.rerun()
+
+    with col2:
+        # Export data button
+        if st.button("📤 Export My Data", key="dash_export", use_container_width=True):
+            state.show_export = True
+
+    with col3:
+        st.markdown('<div class="danger-btn">', unsafe_allow_html=True)
+        if st.button("🗑️ Clear All Data", key="dash_clear", use_container_width=True):
+            state.show_clear_confirm = True
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Export data section
+    if state.show_export:
+        st.markdown("---")
+        st.markdown("#### 📤 Export Your Data")
+
+        export_format = st.radio(
+            "Format:",
+            list(EXPORT_FORMATS),
+            format_func=lambda fmt: EXPORT_FORMATS[fmt][0],
+            horizontal=True,
+            key="export_format"
+        )
+        label, ext, mime = EXPORT_FORMATS[export_format]
+
+        if st.button(f"Prepare {label} export", key="prepare_export"):
+            export_header = {
+                "exported_at": datetime.now().isoformat(),
+                "app_version": APP_VERSION,
+                "user_info": {
+                    "name": name,
+                    "procedure": procedure_name,
+                    "surgery_date": surgery_date,
+                    "recovery_day": day
+                },
+                "stats": {
+                    "streak": streak,
+                    "total_checkins": total_checkins,
+                    "total_journal_entries": total_journals
+                }
+            }
+            export_sections = {
+                "pain_history": state.pain_history,
+                "check_in_history": state.check_in_history,
+                "journal_entries": journal.texts(name),
+                "medications": medications
+            }
+            # Written straight to a temp file; the session keeps only its path. Files from
+            # sessions that ended with the panel open are pruned once they're an hour old
+            discard_export(state)
+            prune_exports()
+            state.export_file = (export_format, create_export(export_format, export_header, export_sections))
+
+        if state.export_file and state.export_file[0] == export_format and os.path.exists(state.export_file[1]):
+            with open(state.export_file[1], 'rb') as export_file:
+                st.download_button(
+                    label=f"⬇️ Download {label}",
+                    data=export_file,
+                    file_name=f"recovery_buddy_export_{datetime.now().strftime('%Y%m%d')}{ext}",
+                    mime=mime,
+                    key="download_export"
+                )
+
+        if st.button("Close Export", key="close_export"):
+            state.show_export = False
+            discard_export(state)
+            st.rerun()
+
+    # Import / restore section
+    with st.expander("📥 Import Data"):
+        st.markdown("Restore a Recovery Buddy export (`recovery_buddy_export_*.json` or `.jsonl`) or a progress file from the command-line version. Days you've already recorded here are kept as they are.")
+        import_file = st.file_uploader("Choose a file to import", type=['json', 'jsonl'], key="import_file")
+        if import_file is not None and st.button("Import", key="btn_import"):
+            text = io.TextIOWrapper(import_file, encoding='utf-8')
+            try:
+                counts = restore(text, state.progress_data, jsonl=import_file.name.endswith('.jsonl'),
+                                 journal_store=get_journal_store())
+            except RestoreError as e:
+                st.error(f"⚠️ {e}")
+            except UnicodeDecodeError:
+                st.error("⚠️ This file isn't a Recovery Buddy export.")
+            else:
+                if counts:
+                    save_progress(state.progress_data)
+                    state.reload()
+                    summary = ", ".join(f"{count} {section.replace('_', ' ')}" for section, count in counts.items())
+                    st.success(f"Imported {summary}! 💚")
+                else:
+                    st.info("Everything in this file is already here - nothing new to import.")
+            finally:
+                text.detach()
+
+    # Clear data confirmation
+    if state.show_clear_confirm:
+        st.markdown("---")
+        st.markdown("""
+        <div style="background: #FFF0F0; border: 2px solid #E74C3C; border-radius: 12px; padding: 1.5rem; margin: 1rem 0;">
+            <h4 style="color: #C0392B; margin: 0 0 0.5rem 0;">⚠️ Are you sure?</h4>
+            <p style="color: #333; margin: 0;">This will permanently delete all your recovery data including check-ins, journal entries, and progress history. This action cannot be undone.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        confirm_col1, confirm_col2 = st.columns(2)
+        with confirm_col1:
+            if st.button("❌ Cancel", key="cancel_clear", use_container_width=True):
+                state.show_clear_confirm = False
+                st.rerun()
+        with confirm_col2:
+            st.markdown('<div class="danger-btn">', unsafe_allow_html=True)
+            if st.button("🗑️ Yes, Delete Everything", key="confirm_clear", use_container_width=True):
+                clear_all_data(state)
+                state.show_clear_confirm = False
+                st.success("All data has been cleared.")
+                state.step = 'welcome'
+                st.rerun()
+            st.markdown('</div>', unsafe_allow_html=True)
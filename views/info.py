@@ -0,0 +1,332 @@
+"""
+Informational pages: terms, privacy policy, references, about, surgery
+resources and the FAQ.
+"""
+
+import streamlit as st
+
+from recovery_buddy.copy_text import SURGERY_RESOURCES
+
+from views.chrome import render_header
+from views.common import APP_VERSION, APP_CREATOR, get_content, get_state
+
+
+def show_terms_of_service():
+    """Display Terms of Service page"""
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="legal-page">
+        <h1>Terms of Service</h1>
+
+        <p>Welcome to Recovery Buddy. By using this application, you agree to the following terms and conditions.</p>
+
+        <h2>1. Informational Purpose Only</h2>
+        <p>Recovery Buddy is designed for informational and educational purposes only. The content provided in this app is intended to support your post-surgery recovery journey by offering general guidance, tracking tools, and emotional support resources.</p>
+
+        <h2>2. Not Medical Advice</h2>
+        <p>This app does not provide medical advice, diagnosis, or treatment. The information presented should never replace professional medical guidance. Always consult your surgeon, physician, or qualified healthcare provider with any questions about your medical condition, recovery progress, or treatment plan.</p>
+
+        <h2>3. Age Requirement</h2>
+        <p>Users must be 18 years of age or older to use this app. Users under 18 may use this app only with parental or guardian consent and supervision.</p>
+
+        <h2>4. Limitation of Liability</h2>
+        <p>Recovery Buddy, its creators, and affiliates are not liable for any decisions, actions, or outcomes based on information provided within this app. You assume full responsibility for how you use the information and tools provided.</p>
+
+        <h2>5. No Warranties</h2>
+        <p>We make no warranties or guarantees about recovery outcomes, timelines, or results. Every individual's recovery is unique and depends on many factors beyond the scope of this app.</p>
+
+        <h2>6. Updates and Modifications</h2>
+        <p>We reserve the right to update, modify, or discontinue any features of this app at any time. These Terms of Service may also be updated periodically. Continued use of the app constitutes acceptance of any changes.</p>
+
+        <h2>7. Intellectual Property</h2>
+        <p>All content, design, features, and functionality of Recovery Buddy are the intellectual property of Recovery Buddy and its creators. Users agree not to copy, reproduce, distribute, or create derivative works based on this app without express written permission.</p>
+
+        <h2>8. User Conduct</h2>
+        <p>Users agree to use this app responsibly and not attempt to reverse engineer, hack, or misuse any part of the application.</p>
+
+        <h2>9. Contact</h2>
+        <p>If you have questions about these Terms of Service, please contact us at <a href="mailto:legal@recoverybuddy.app">legal@recoverybuddy.app</a>.</p>
+
+        <p class="last-updated">Last updated: January 2026</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("← Back to App", key="btn_back_from_terms", type="primary", use_container_width=True):
+            state.step = 'welcome'
+            st.rerun()
+
+
+def show_privacy_policy():
+    """Display Privacy Policy page"""
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="legal-page">
+        <h1>Privacy Policy</h1>
+
+        <p>Your privacy is important to us. This Privacy Policy explains how Recovery Buddy handles your information.</p>
+
+        <h2>1. Information We Collect</h2>
+        <p>Recovery Buddy may collect the following types of information that you voluntarily provide:</p>
+        <ul>
+            <li>Your name (for personalized messages)</li>
+            <li>Procedure type and surgery date</li>
+            <li>Daily symptom check-ins (pain levels, swelling, bruising, etc.)</li>
+            <li>Mood and emotional well-being entries</li>
+            <li>Journal entries and notes</li>
+            <li>Photos you choose to upload for progress tracking</li>
+        </ul>
+
+        <h2>2. Local Storage Only</h2>
+        <p><strong>Your data stays on your device.</strong> All information you enter into Recovery Buddy is stored locally in your browser's storage. We do not transmit, upload, or store your personal data on external servers.</p>
+
+        <h2>3. No Data Selling or Sharing</h2>
+        <p>We do not sell, trade, rent, or share your personal information with third parties. Your recovery journey is private and stays that way.</p>
+
+        <h2>4. No Cross-Site Tracking</h2>
+        <p>We do not use tracking cookies, pixels, or any technology to track your activity across other websites. We do not build advertising profiles or share data with advertisers.</p>
+
+        <h2>5. Analytics</h2>
+        <p>We may collect anonymous, aggregated usage statistics (such as page views) to improve the app experience. This data cannot be used to identify individual users.</p>
+
+        <h2>6. Deleting Your Data</h2>
+        <p>You have full control over your data. To delete all your Recovery Buddy data:</p>
+        <ul>
+            <li>Clear your browser's local storage/site data for this website</li>
+            <li>Use your browser's "Clear browsing data" feature</li>
+            <li>Delete the recovery_progress.json file if running locally</li>
+        </ul>
+
+        <h2>7. Data Security</h2>
+        <p>Since your data is stored locally on your device, its security depends on your device's security. We recommend using a secure, password-protected device.</p>
+
+        <h2>8. Children's Privacy</h2>
+        <p>Recovery Buddy is not intended for use by children under 13. We do not knowingly collect information from children under 13 years of age.</p>
+
+        <h2>9. Changes to This Policy</h2>
+        <p>We may update this Privacy Policy from time to time. Any changes will be reflected on this page with an updated revision date.</p>
+
+        <h2>10. Contact Us</h2>
+        <p>If you have questions about this Privacy Policy or your data, please contact us at <a href="mailto:privacy@recoverybuddy.app">privacy@recoverybuddy.app</a>.</p>
+
+        <p class="last-updated">Last updated: January 2026</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("← Back to App", key="btn_back_from_privacy", type="primary", use_container_width=True):
+            state.step = 'welcome'
+            st.rerun()
+
+
+def show_references():
+    """Display Medical References page"""
+    content = get_content()
+    state = get_state()
+
+    render_header()
+
+    st.header("📚 Medical Sources & References")
+
+    st.success("✅ Information compiled from board-certified medical sources")
+
+    st.write("The medical information in Recovery Buddy is compiled from the following credible healthcare sources. Always consult with your healthcare provider for personalized medical advice.")
+
+    st.warning("⚠️ **Medical Disclaimer:** Recovery Buddy provides general information for educational purposes only. This app is not a substitute for professional medical advice, diagnosis, or treatment.")
+
+    st.subheader("Our Sources")
+
+    # Source information
+    st.write("**🏥 American Society of Plastic Surgeons (ASPS)**")
+    st.write("The largest plastic surgery specialty organization, providing patient safety information and procedural guidelines.")
+    st.write("Topics: Procedure information, recovery timelines, safety guidelines")
+    st.write("[Visit Website](https://www.plasticsurgery.org)")
+
+    st.divider()
+
+    st.write("**🏛️ Mayo Clinic**")
+    st.write("World-renowned nonprofit medical center providing expert health information reviewed by medical professionals.")
+    st.write("Topics: Symptoms, warning signs, general recovery guidance")
+    st.write("[Visit Website](https://www.mayoclinic.org)")
+
+    st.divider()
+
+    st.write("**💚 Cleveland Clinic**")
+    st.write("Top-ranked hospital providing trusted health information backed by their medical experts.")
+    st.write("Topics: Post-surgical care, pain management, healing timelines")
+    st.write("[Visit Website](https://my.clevelandclinic.org)")
+
+    st.divider()
+
+    st.write("**🌐 WebMD**")
+    st.write("Leading health information services platform with physician-reviewed content.")
+    st.write("Topics: General recovery tips, symptom tracking, wellness guidance")
+    st.write("[Visit Website](https://www.webmd.com)")
+
+    st.divider()
+
+    st.write("**✨ RealSelf**")
+    st.write("Trusted community platform with doctor-verified information about cosmetic procedures.")
+    st.write("Topics: Patient experiences, procedure-specific recovery, realistic expectations")
+    st.write("[Visit Website](https://www.realself.com)")
+
+    st.divider()
+
+    st.subheader("How We Use These Sources")
+    st.write("• **Recovery Timelines:** Based on clinical guidelines from ASPS and Cleveland Clinic")
+    st.write("• **Normal Symptoms:** Compiled from Mayo Clinic and WebMD patient education materials")
+    st.write("• **Warning Signs:** Sourced from ASPS safety guidelines and Cleveland Clinic emergency criteria")
+    st.write("• **Daily Tips:** Adapted from post-operative care instructions across all sources")
+    st.write("• **Emotional Support:** Informed by Mayo Clinic mental health resources")
+
+    st.subheader("Content Review")
+    st.write(f"Our recovery information is regularly reviewed and updated to ensure accuracy. Last content review: {content.medical_review}.")
+
+    st.subheader("Report an Issue")
+    st.write("If you notice any medical information that appears inaccurate or outdated, please contact us at medical@recoverybuddy.app")
+
+    st.caption(f"Last updated: {content.medical_review}")
+
+    st.divider()
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("← Back to App", key="btn_back_from_references", type="primary", use_container_width=True):
+            state.step = 'welcome'
+            st.rerun()
+
+
+def show_about():
+    """About page with app info and credits"""
+    content = get_content()
+    state = get_state()
+
+    render_header()
+
+    st.header("🌸 About Recovery Buddy")
+
+    # Two column layout
+    col_left, col_right = st.columns(2)
+
+    with col_left:
+        st.subheader("App Information")
+        st.write(f"**Version:** {APP_VERSION}")
+        st.write(f"**Created by:** {APP_CREATOR}")
+        st.write(f"**Medical Review Date:** {content.medical_review}")
+
+        st.subheader("Our Mission")
+        st.write("Recovery Buddy was created to provide compassionate support during your post-surgery recovery journey. We believe everyone deserves access to helpful recovery information and emotional support.")
+
+        st.subheader("Contact & Support")
+        st.write("📧 **Email:** support@recoverybuddy.app")
+        st.write("💬 **Feedback:** feedback@recoverybuddy.app")
+
+    with col_right:
+        st.subheader("Medical Sources")
+        st.write("Our information is compiled from board-certified medical sources:")
+        st.write("• American Society of Plastic Surgeons")
+        st.write("• Mayo Clinic")
+        st.write("• Cleveland Clinic")
+        st.write("• WebMD")
+        st.write("• RealSelf")
+
+        st.subheader("Privacy & Data")
+        st.info("🔒 **Your data stays on your device.** We do not collect, store, or share your personal information on external servers.")
+
+        st.subheader("Disclaimer")
+        st.warning("This app provides general information only and is NOT medical advice. Always consult your surgeon or healthcare provider.")
+
+    st.divider()
+
+    # Action buttons
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        if st.button("🏠 Home", key="about_home", use_container_width=True):
+            state.step = 'welcome'
+            st.rerun()
+    with col2:
+        if st.button("📜 Terms of Service", key="about_terms", use_container_width=True):
+            state.step = 'terms'
+            st.rerun()
+    with col3:
+        if st.button("🔒 Privacy Policy", key="about_privacy", use_container_width=True):
+            state.step = 'privacy'
+            st.rerun()
+    with col4:
+        if st.button("📚 Medical References", key="about_refs", use_container_width=True):
+            state.step = 'references'
+            st.rerun()
+
+    # Share and feedback section
+    st.divider()
+    st.subheader("💝 Share & Support")
+
+    share_col1, share_col2 = st.columns(2)
+    with share_col1:
+        st.success("💌 **Know someone recovering from surgery?** Share Recovery Buddy with them!")
+    with share_col2:
+        st.info("📝 **Have feedback?** We'd love to hear from you!")
+
+
+def show_surgery_resources():
+    """Surgery Resources page with links to official sources"""
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>📚 Surgery Resources</h3>
+        <p style="color: #333;">Find official information about your procedure from trusted medical sources.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="info-box">
+        <p>📋 These links go to official medical websites with detailed information about each procedure,
+        recovery timelines, and what to expect. Always consult your surgeon for personalized advice.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    for proc_key, proc_info in SURGERY_RESOURCES.items():
+        with st.expander(f"📖 {proc_info['name']}", expanded=False):
+            st.markdown(f"**Recovery Time:** {proc_info['recovery_time']}")
+            st.markdown(f"**Common Symptoms:** {proc_info['common_symptoms']}")
+            st.markdown("**Official Resources:**")
+            for link in proc_info['links']:
+                st.markdown(f"- [{link['source']}]({link['url']})")
+
+
+
+def show_faq():
+    """FAQ page with common questions"""
+    content = get_content()
+
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>❓ Frequently Asked Questions</h3>
+        <p style="color: #333;">Common questions about post-surgery recovery.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Search box
+    search_query = st.text_input("🔍 Search questions", placeholder="Type to search...", key="faq_search")
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    for faq in content.faq:
+        # Filter by search
+        if search_query and search_query.lower() not in faq['question'].lower() and search_query.lower() not in faq['answer'].lower():
+            continue
+
+        with st.expander(f"❓ {faq['question']}", expanded=False):
+            st.markdown(faq['answer'])
+            st.markdown(f"*Source: {faq['source']}*")
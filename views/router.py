@@ -0,0 +1,270 @@
+"""
+One script run: page chrome, disclaimer, sidebar and the active page.
+
+Pages are looked up by step in PAGES, so a rerun calls only the page the
+session is on. Staff pages are not among them: ?staff on the URL runs the
+staff console (views/staff.py) instead of the patient app.
+"""
+
+import streamlit as st
+import time
+
+from recovery_buddy.copy_text import EMERGENCY_INFO
+
+from views.checkin import (show_welcome, show_get_info, show_physical_checkin, show_symptom_results,
+                           show_emotional_checkin, show_daily_tip, show_complete)
+from views.chrome import render_chrome, render_progress_bar, render_bottom_nav, render_header
+from views.common import get_profiler, inject_css, save_progress, report_error, get_state
+from views.dashboard import show_dashboard
+from views.info import (show_terms_of_service, show_privacy_policy, show_references, show_about,
+                        show_surgery_resources, show_faq)
+from views.tools import (show_settings, show_symptom_checker_page, show_emergency_contacts, show_self_care,
+                         show_mood_tracker)
+from views.staff import run_staff
+
+
+# Step -> page function
+PAGES = {
+    'welcome': show_welcome,
+    'get_info': show_get_info,
+    'physical_checkin': show_physical_checkin,
+    'symptom_results': show_symptom_results,
+    'emotional_checkin': show_emotional_checkin,
+    'daily_tip': show_daily_tip,
+    'complete': show_complete,
+    'dashboard': show_dashboard,
+    'about': show_about,
+    'settings': show_settings,
+    'surgery_resources': show_surgery_resources,
+    'faq': show_faq,
+    'symptom_checker': show_symptom_checker_page,
+    'emergency_contacts': show_emergency_contacts,
+    'self_care': show_self_care,
+    'mood_tracker': show_mood_tracker,
+}
+
+LEGAL_PAGES = {
+    'terms': show_terms_of_service,
+    'privacy': show_privacy_policy,
+    'references': show_references,
+}
+
+
+def main():
+    # Session state is created once per session; reruns only look it up
+    if 'recovery' not in st.session_state:
+        st.markdown("""
+        <div class="loading-screen">
+            <div class="loading-icon">🌸</div>
+            <div class="loading-text">Loading Recovery Buddy</div>
+        </div>
+        """, unsafe_allow_html=True)
+    state = get_state()
+
+    # Show disclaimer popup on first visit
+    if not state.disclaimer_accepted:
+        st.header("⚠️ Important Medical Disclaimer")
+
+        st.warning("🏥 This app provides **general recovery information only** and is NOT medical advice.")
+
+        st.write("**Recovery Buddy does NOT:**")
+        st.write("• Provide medical diagnosis or treatment recommendations")
+        st.write("• Replace professional medical advice from your surgeon")
+        st.write("• Serve as an emergency medical resource")
+
+        st.write("**Always consult your surgeon or healthcare provider** for personalized medical guidance about your recovery.")
+
+        st.error("🚨 **MEDICAL EMERGENCY?** Call 911 or go to the nearest emergency room immediately.")
+
+        st.caption("*Information compiled from board-certified medical sources including the American Society of Plastic Surgeons, Mayo Clinic, Cleveland Clinic, WebMD, and RealSelf.*")
+
+        st.divider()
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("I Understand - Continue to App", key="btn_accept_disclaimer", type="primary", use_container_width=True):
+                state.disclaimer_accepted = True
+                st.rerun()
+        return  # Don't show rest of app until disclaimer accepted
+
+    # Save dark mode preference when it changes
+    if state.progress_data.get('dark_mode') != state.dark_mode:
+        state.progress_data['dark_mode'] = state.dark_mode
+        save_progress(state.progress_data)
+
+    # Apply dark mode if enabled
+    if state.dark_mode:
+        inject_css("dark_mode")
+
+    # Sidebar with dark mode and emergency info
+    with st.sidebar:
+        st.markdown("### 📊 Navigation")
+        if st.button("🏠 Home", key="sidebar_home", use_container_width=True):
+            state.step = 'welcome'
+            st.rerun()
+        if st.button("📊 My Data", key="sidebar_my_data", use_container_width=True):
+            state.step = 'dashboard'
+            st.rerun()
+        if st.button("😊 Mood Tracker", key="sidebar_mood", use_container_width=True):
+            state.step = 'mood_tracker'
+            st.rerun()
+        if st.button("✅ Self-Care", key="sidebar_selfcare", use_container_width=True):
+            state.step = 'self_care'
+            st.rerun()
+        if st.button("🩺 Symptom Checker", key="sidebar_symptoms", use_container_width=True):
+            state.step = 'symptom_checker'
+            st.rerun()
+        if st.button("📞 Emergency Contacts", key="sidebar_contacts", use_container_width=True):
+            state.step = 'emergency_contacts'
+            st.rerun()
+        if st.button("📚 Surgery Resources", key="sidebar_resources", use_container_width=True):
+            state.step = 'surgery_resources'
+            st.rerun()
+        if st.button("❓ FAQ", key="sidebar_faq", use_container_width=True):
+            state.step = 'faq'
+            st.rerun()
+
+        st.markdown("---")
+        st.markdown("### ⚙️ Settings")
+        dark_mode = st.toggle("🌙 Dark Mode", value=state.dark_mode, key="toggle_dark_mode")
+        if dark_mode != state.dark_mode:
+            state.dark_mode = dark_mode
+            st.rerun()
+
+        # Celebration style selector
+        celebration_options = [
+            "🎈 Balloons",
+            "❄️ Snow",
+            "🫧 Bubbles",
+            "❤️ Hearts",
+            "🎊 Confetti",
+            "✨ Sparkles",
+            "🦋 Butterflies"
+        ]
+        current_index = celebration_options.index(state.celebration_style) if state.celebration_style in celebration_options else 0
+        celebration_style = st.selectbox(
+            "🎉 Celebration Style",
+            celebration_options,
+            index=current_index,
+            key="select_celebration_style"
+        )
+        if celebration_style != state.celebration_style:
+            state.celebration_style = celebration_style
+
+        st.markdown("---")
+
+        # PROMINENT Emergency Warning Banner
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #FFE5E5 0%, #FFCCCC 100%);
+                    border: 2px solid #E74C3C; border-radius: 10px; padding: 0.75rem; margin-bottom: 1rem; text-align: center;">
+            <p style="color: #C0392B; font-weight: 700; margin: 0; font-size: 0.9rem;">
+                🚨 MEDICAL EMERGENCY?
+            </p>
+            <p style="color: #E74C3C; margin: 0.25rem 0 0 0; font-size: 0.85rem; font-weight: 600;">
+                Call 911 or go to the ER
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Emergency Info Box - Always visible
+        st.markdown("### 🚨 Emergency Info")
+
+        # Call 911 section - more prominent
+        st.markdown("""
+        <p style="color: #C0392B; font-weight: 600; font-size: 0.9rem; margin-bottom: 0.5rem;">
+            🔴 <strong>Call 911 Immediately If:</strong>
+        </p>
+        """, unsafe_allow_html=True)
+        show_911 = st.checkbox("Show 911 warning signs", key="show_911", value=False)
+        if show_911:
+            for item in EMERGENCY_INFO["call_911"]:
+                st.markdown(f"<p style='color: #C0392B; font-size: 0.85rem; margin: 0.25rem 0 0.25rem 1rem;'>🔴 {item}</p>", unsafe_allow_html=True)
+
+        # Call Surgeon Urgently section
+        st.markdown("""
+        <p style="color: #E67E22; font-weight: 600; font-size: 0.9rem; margin: 0.75rem 0 0.5rem 0;">
+            🟠 <strong>Call Surgeon Urgently If:</strong>
+        </p>
+        """, unsafe_allow_html=True)
+        show_urgent = st.checkbox("Show urgent warning signs", key="show_urgent", value=False)
+        if show_urgent:
+            for item in EMERGENCY_INFO["call_surgeon_urgent"]:
+                st.markdown(f"<p style='color: #E67E22; font-size: 0.85rem; margin: 0.25rem 0 0.25rem 1rem;'>🟠 {item}</p>", unsafe_allow_html=True)
+
+        # Call Surgeon Soon section
+        st.markdown("""
+        <p style="color: #F1C40F; font-weight: 600; font-size: 0.9rem; margin: 0.75rem 0 0.5rem 0;">
+            🟡 <strong>Call Surgeon Soon If:</strong>
+        </p>
+        """, unsafe_allow_html=True)
+        show_soon = st.checkbox("Show other warning signs", key="show_soon", value=False)
+        if show_soon:
+            for item in EMERGENCY_INFO["call_surgeon_soon"]:
+                st.markdown(f"<p style='color: #B7950B; font-size: 0.85rem; margin: 0.25rem 0 0.25rem 1rem;'>🟡 {item}</p>", unsafe_allow_html=True)
+
+        st.markdown("---")
+        st.markdown("""
+        <p style="font-size: 0.8rem; color: #444;">
+        💚 <strong>Your Surgeon's Office:</strong><br>
+        <em>Add your surgeon's contact info here</em>
+        </p>
+        """, unsafe_allow_html=True)
+
+        st.markdown("---")
+        st.markdown("### 📚 Medical Info")
+        st.markdown("""
+        <p style="font-size: 0.75rem; color: #444; line-height: 1.4;">
+        Information sourced from <strong>ASPS</strong>, <strong>Mayo Clinic</strong>,
+        <strong>Cleveland Clinic</strong>, <strong>WebMD</strong>, and <strong>RealSelf</strong>.
+        </p>
+        <p style="font-size: 0.75rem; color: #555; margin-top: 0.5rem;">
+        ⚠️ <em>This app provides general information only and is not a substitute for professional medical advice.</em>
+        </p>
+        """, unsafe_allow_html=True)
+
+    # Render header and progress
+    render_header()
+    render_progress_bar()
+
+    # Every page is timed under its step name when profiling is on
+    with get_profiler().time("page", state.step):
+        # Legal pages have their own layout, without the bottom navigation
+        if state.step in LEGAL_PAGES:
+            LEGAL_PAGES[state.step]()
+            return
+        page = PAGES.get(state.step)
+        if page is not None:
+            page()
+
+    # Render bottom navigation bar (mobile-style)
+    render_bottom_nav()
+
+
+def run_with_error_handling():
+    """Wrapper to catch errors and show friendly messages"""
+    started = time.perf_counter()
+    try:
+        main()
+    except Exception as e:
+        st.markdown("""
+        <div class="friendly-error">
+            <p style="font-size: 2rem;">😟</p>
+            <p><strong>Oops! Something went wrong.</strong></p>
+            <p>Please refresh the page to try again.</p>
+            <p style="font-size: 0.8rem; margin-top: 1rem;">
+                If this keeps happening, try clearing your browser cache<br>
+                or contact us at feedback@recoverybuddy.app
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        # Record the actual error for debugging (won't show to user)
+        report_error(e, timings={"rerun_ms": round((time.perf_counter() - started) * 1e3, 2)})
+
+
+def run():
+    """Everything one run of app.py does after set_page_config"""
+    render_chrome()
+    if "staff" in st.query_params:
+        run_staff()
+    else:
+        run_with_error_handling()
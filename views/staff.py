@@ -0,0 +1,106 @@
+"""
+Staff console: the clinic and performance pages, kept out of the patient app.
+
+Opened with ?staff on the app's URL (http://localhost:8501/?staff). It runs
+in the same process as the patient app, so it reads the same shared
+resources, but nothing in the patient sidebar links to it and each session
+has to enter the access code in RECOVERY_BUDDY_STAFF_TOKEN before any page
+is shown. Without that variable the console stays locked.
+"""
+
+import hmac
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from views.clinic import show_clinic
+from views.common import STAFF_TOKEN, get_error_reporter, get_profiler, get_state, report_error
+
+# Pause after a wrong access code, to slow down guessing
+SIGN_IN_DELAY = 1.0
+
+
+def show_profiler():
+    """The render profiler's histograms and recent error reports"""
+    profiler = get_profiler()
+
+    st.markdown("### ⏱️ Performance")
+    if not profiler.enabled:
+        st.info("Profiling is off. Start the app with RECOVERY_BUDDY_PROFILE=1 to collect timings.")
+        return
+
+    since = datetime.fromtimestamp(profiler.started).strftime('%Y-%m-%d %H:%M')
+    st.caption(f"Timings from every session since {since}, slowest p95 first.")
+    rows = profiler.rows()
+    if rows:
+        st.dataframe([{key: round(value, 2) if isinstance(value, float) else value for key, value in row.items()}
+                      for row in rows], use_container_width=True, hide_index=True)
+    else:
+        st.write("No timings yet.")
+
+    with st.expander("Prometheus metrics"):
+        metrics = profiler.prometheus_text()
+        st.code(metrics, language="text")
+        st.download_button("Download metrics", metrics, file_name="recovery_buddy_metrics.txt",
+                           mime="text/plain", key="btn_download_metrics")
+
+    with st.expander("Recent errors"):
+        errors = get_error_reporter().records(limit=20)
+        if not errors:
+            st.write("No errors recorded.")
+        for error in errors:
+            dropped = f" ({error['dropped']} skipped before it)" if error.get('dropped') else ""
+            st.markdown(f"**{error['type']}** on `{error.get('step')}` at {error['time']}{dropped}")
+            st.code("\n".join(error.get('stack', [])), language="text")
+
+    if st.button("Reset Timings", key="btn_reset_profiler"):
+        profiler.reset()
+        st.rerun()
+
+
+# Label -> page function
+STAFF_PAGES = {
+    "🏥 Clinic": show_clinic,
+    "⏱️ Performance": show_profiler,
+}
+
+
+def show_sign_in(state):
+    """Access-code form; returns True once this session has signed in"""
+    if state.staff_signed_in:
+        return True
+
+    st.markdown("### 🔒 Staff sign-in")
+    if not STAFF_TOKEN:
+        st.info("The staff console is locked. Start the app with RECOVERY_BUDDY_STAFF_TOKEN set to an access "
+                "code to turn it on.")
+        return False
+
+    with st.form("staff_sign_in"):
+        code = st.text_input("Access code", type="password", key="staff_code")
+        if st.form_submit_button("Sign in"):
+            if hmac.compare_digest(code.encode("utf-8"), STAFF_TOKEN.encode("utf-8")):
+                state.staff_signed_in = True
+                st.rerun()
+            time.sleep(SIGN_IN_DELAY)
+            st.error("That access code isn't right.")
+    return False
+
+
+def run_staff():
+    """One run of the staff console: sign-in, then the chosen page"""
+    state = get_state()
+    try:
+        if not show_sign_in(state):
+            return
+        with st.sidebar:
+            label = st.radio("Staff pages", list(STAFF_PAGES), key="staff_page")
+            if st.button("Sign out", key="staff_sign_out", use_container_width=True):
+                state.staff_signed_in = False
+                st.rerun()
+        with get_profiler().time("page", f"staff:{label}"):
+            STAFF_PAGES[label]()
+    except Exception as e:
+        st.error("Something went wrong loading this page. Please refresh to try again.")
+        report_error(e, step="staff")
@@ -0,0 +1,351 @@
+"""
+Tool pages: settings, symptom checker, emergency contacts, self-care, mood
+tracker and the performance page.
+"""
+
+import streamlit as st
+from datetime import datetime
+
+from recovery_buddy.copy_text import AFFIRMATIONS, MOOD_OPTIONS, SELF_CARE_CHECKLIST
+from recovery_buddy.triage import SYMPTOM_CHECKER
+
+from views.chrome import render_header
+from views.common import get_symptom_triage, save_progress, get_journal_store, clear_all_data, get_state
+
+
+def show_settings():
+    """Settings page with data management"""
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>⚙️ Settings</h3>
+        <p style="color: #3D4D3D;">Manage your preferences and data.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Two column layout
+    col_left, col_right = st.columns(2)
+
+    with col_left:
+        st.markdown("#### 🎨 Appearance")
+
+        # Dark mode toggle
+        dark_mode = st.toggle("🌙 Dark Mode", value=state.dark_mode, key="settings_dark_mode")
+        if dark_mode != state.dark_mode:
+            state.dark_mode = dark_mode
+            st.rerun()
+
+        # Celebration style
+        celebration_options = [
+            "🎈 Balloons", "❄️ Snow", "🫧 Bubbles", "❤️ Hearts",
+            "🎊 Confetti", "✨ Sparkles", "🦋 Butterflies"
+        ]
+        current_index = celebration_options.index(state.celebration_style) if state.celebration_style in celebration_options else 0
+        celebration = st.selectbox("🎉 Celebration Style", celebration_options, index=current_index, key="settings_celebration")
+        if celebration != state.celebration_style:
+            state.celebration_style = celebration
+
+        st.markdown("#### 📱 Notifications")
+        st.markdown("*Push notifications coming soon!*")
+
+    with col_right:
+        st.markdown("#### 🔒 Data & Privacy")
+
+        st.markdown("""
+        <div class="privacy-badge" style="margin-bottom: 1rem;">
+            🔒 All your data is stored locally on this device only
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("##### Your Saved Data:")
+        st.markdown(f"""
+        - **Name:** {state.progress_data.get('name', 'Not set')}
+        - **Procedure:** {state.progress_data.get('procedure', 'Not set')}
+        - **Journal entries:** {get_journal_store().count(state.progress_data.get('name', ''))}
+        - **Check-ins:** {len(state.check_in_history)}
+        """)
+
+        st.markdown("##### Data Management:")
+
+        st.markdown('<div class="danger-btn">', unsafe_allow_html=True)
+        if st.button("🗑️ Clear All My Data", key="clear_data", use_container_width=True):
+            state.show_clear_confirm = True
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        if state.show_clear_confirm:
+            st.warning("⚠️ This will permanently delete all your saved data. This cannot be undone.")
+            confirm_col1, confirm_col2 = st.columns(2)
+            with confirm_col1:
+                st.markdown('<div class="danger-btn">', unsafe_allow_html=True)
+                if st.button("Yes, Delete Everything", key="confirm_delete"):
+                    clear_all_data(state)
+                    state.show_clear_confirm = False
+                    st.success("✅ All data cleared!")
+                    st.rerun()
+                st.markdown('</div>', unsafe_allow_html=True)
+            with confirm_col2:
+                if st.button("Cancel", key="cancel_delete"):
+                    state.show_clear_confirm = False
+                    st.rerun()
+
+
+def show_symptom_checker_page():
+    """Symptom checker - Is this normal?"""
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>🩺 Symptom Checker</h3>
+        <p style="color: #333;">Not sure if what you're experiencing is normal? Check here.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="warning-box">
+        <p>⚠️ <strong>Disclaimer:</strong> This is for informational purposes only and is NOT medical advice.
+        When in doubt, always call your surgeon's office.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("### Select any symptoms you're experiencing:")
+
+    # Selected symptoms are collected as a bitmask
+    triage = get_symptom_triage()
+    selected_mask = 0
+
+    st.markdown("#### 🟢 Typically Normal Symptoms")
+    for symptom in SYMPTOM_CHECKER['normal']['symptoms']:
+        if st.checkbox(symptom, key=f"sym_normal_{symptom}"):
+            selected_mask |= triage.bits[symptom]
+
+    st.markdown("#### 🟡 May Need Attention")
+    for symptom in SYMPTOM_CHECKER['call_soon']['symptoms']:
+        if st.checkbox(symptom, key=f"sym_soon_{symptom}"):
+            selected_mask |= triage.bits[symptom]
+
+    st.markdown("#### 🔴 Urgent - Seek Immediate Care")
+    for symptom in SYMPTOM_CHECKER['urgent']['symptoms']:
+        if st.checkbox(symptom, key=f"sym_urgent_{symptom}"):
+            selected_mask |= triage.bits[symptom]
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # Highest severity
+    level = triage.classify(selected_mask)
+    if level:
+        if level == 'urgent':
+            st.markdown(f"""
+            <div style="background: {SYMPTOM_CHECKER['urgent']['color']}; padding: 1.5rem; border-radius: 12px; border-left: 4px solid #E74C3C;">
+                <h4 style="color: #C0392B; margin: 0 0 0.5rem 0;">🚨 {SYMPTOM_CHECKER['urgent']['action']}</h4>
+                <p style="color: #333; margin: 0;">{SYMPTOM_CHECKER['urgent']['message']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        elif level == 'call_soon':
+            st.markdown(f"""
+            <div style="background: {SYMPTOM_CHECKER['call_soon']['color']}; padding: 1.5rem; border-radius: 12px; border-left: 4px solid #F5C842;">
+                <h4 style="color: #856404; margin: 0 0 0.5rem 0;">📞 {SYMPTOM_CHECKER['call_soon']['action']}</h4>
+                <p style="color: #333; margin: 0;">{SYMPTOM_CHECKER['call_soon']['message']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+            <div style="background: {SYMPTOM_CHECKER['normal']['color']}; padding: 1.5rem; border-radius: 12px; border-left: 4px solid #28A745;">
+                <h4 style="color: #155724; margin: 0 0 0.5rem 0;">✅ {SYMPTOM_CHECKER['normal']['action']}</h4>
+                <p style="color: #333; margin: 0;">{SYMPTOM_CHECKER['normal']['message']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <p style="font-size: 0.85rem; color: #666; margin-top: 1rem; text-align: center;">
+            <em>Source: American Society of Plastic Surgeons (ASPS), Mayo Clinic, Cleveland Clinic</em>
+        </p>
+        """, unsafe_allow_html=True)
+
+    st.divider()
+
+    if st.button("📞 Emergency Contacts", key="symptom_emergency", use_container_width=True):
+        state.step = 'emergency_contacts'
+        st.rerun()
+
+
+def show_emergency_contacts():
+    """Emergency contacts page"""
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>📞 Emergency Contacts</h3>
+        <p style="color: #333;">Keep your important contacts handy.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Emergency banner
+    st.markdown("""
+    <div style="background: #FFE5E5; border: 2px solid #E74C3C; border-radius: 12px; padding: 1rem; margin-bottom: 1.5rem; text-align: center;">
+        <p style="color: #C0392B; font-weight: 700; font-size: 1.2rem; margin: 0;">
+            🚨 Medical Emergency? Call 911
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Surgeon info
+    st.markdown("### 👨‍⚕️ Your Surgeon")
+    surgeon_name = st.text_input("Surgeon's Name", value=state.emergency_contacts.get('surgeon_name', ''), key="surgeon_name_input")
+    surgeon_phone = st.text_input("Surgeon's Phone", value=state.emergency_contacts.get('surgeon_phone', ''), key="surgeon_phone_input")
+
+    st.markdown("### 👥 Emergency Contact")
+    emergency_name = st.text_input("Contact Name", value=state.emergency_contacts.get('emergency_name', ''), key="emergency_name_input")
+    emergency_phone = st.text_input("Contact Phone", value=state.emergency_contacts.get('emergency_phone', ''), key="emergency_phone_input")
+
+    if st.button("💾 Save Contacts", key="save_contacts", type="primary"):
+        state.emergency_contacts = {
+            'surgeon_name': surgeon_name,
+            'surgeon_phone': surgeon_phone,
+            'emergency_name': emergency_name,
+            'emergency_phone': emergency_phone
+        }
+        state.progress_data['emergency_contacts'] = state.emergency_contacts
+        save_progress(state.progress_data)
+        st.success("✅ Contacts saved!")
+
+    # Quick dial buttons if contacts exist
+    if surgeon_phone:
+        st.markdown("### 📱 Quick Dial")
+        st.markdown(f"""
+        <a href="tel:{surgeon_phone}" style="display: inline-block; background: #A8C5A8; color: white;
+           padding: 0.75rem 1.5rem; border-radius: 25px; text-decoration: none; margin-right: 1rem;">
+            📞 Call Surgeon
+        </a>
+        """, unsafe_allow_html=True)
+
+
+
+def show_self_care():
+    """Daily self-care checklist"""
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>💚 Daily Self-Care Checklist</h3>
+        <p style="color: #333;">Take care of yourself today! Check off what you've done.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Get today's date
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    # Show affirmation
+    affirmation = AFFIRMATIONS[state.affirmation_index]
+    st.markdown(f"""
+    <div class="info-box" style="text-align: center;">
+        <p style="font-size: 1.1rem; font-style: italic;">✨ {affirmation}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+
+    # Checklist
+    completed_count = 0
+    for item in SELF_CARE_CHECKLIST:
+        checked = st.checkbox(
+            f"{item['icon']} {item['label']}",
+            value=state.self_care_today.get(item['id'], False),
+            key=f"selfcare_{item['id']}"
+        )
+        state.self_care_today[item['id']] = checked
+        if checked:
+            completed_count += 1
+
+    # Save progress
+    state.progress_data['self_care_today'] = state.self_care_today
+    state.progress_data['self_care_date'] = today
+    save_progress(state.progress_data)
+
+    # Progress indicator
+    total_items = len(SELF_CARE_CHECKLIST)
+    progress_pct = (completed_count / total_items) * 100
+
+    st.markdown(f"""
+    <div style="background: #E8F5E8; padding: 1rem; border-radius: 12px; margin-top: 1rem; text-align: center;">
+        <p style="margin: 0; color: #2C5530; font-weight: 600;">
+            {completed_count}/{total_items} completed today ({progress_pct:.0f}%)
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Celebration if all complete
+    if completed_count == total_items:
+        st.balloons()
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #A8C5A8 0%, #C8D8C8 100%); padding: 1.5rem; border-radius: 12px; text-align: center; margin-top: 1rem;">
+            <p style="font-size: 1.5rem; margin: 0;">🎉 Amazing! You completed all your self-care tasks! 🎉</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+
+def show_mood_tracker():
+    """Mood tracker page"""
+    state = get_state()
+
+    render_header()
+
+    st.markdown("""
+    <div class="wellness-card">
+        <h3>😊 How Are You Feeling?</h3>
+        <p style="color: #333;">Track your emotional wellbeing during recovery.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("### Select your mood today:")
+
+    cols = st.columns(4)
+    selected_mood = None
+
+    for i, mood in enumerate(MOOD_OPTIONS):
+        with cols[i]:
+            if st.button(
+                f"{mood['emoji']}\n{mood['label']}",
+                key=f"mood_{mood['label']}",
+                use_container_width=True
+            ):
+                selected_mood = mood
+
+    if selected_mood:
+        # Save mood
+        mood_entry = {
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'time': datetime.now().strftime('%H:%M'),
+            'mood': selected_mood['label'],
+            'emoji': selected_mood['emoji']
+        }
+        state.mood_history.append(mood_entry)
+        state.progress_data['mood_history'] = state.mood_history
+        state.stats.record_mood(mood_entry['date'], mood_entry['mood'])
+        state.store_stats()
+        save_progress(state.progress_data)
+
+        # Show response
+        st.markdown(f"""
+        <div style="background: {selected_mood['color']}; padding: 1.5rem; border-radius: 12px; margin-top: 1rem; text-align: center;">
+            <p style="font-size: 2rem; margin: 0 0 0.5rem 0;">{selected_mood['emoji']}</p>
+            <p style="color: #333; margin: 0;">{selected_mood['response']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Show mood history
+    if state.mood_history:
+        st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+        st.markdown("### Recent Mood History")
+
+        for entry in reversed(state.mood_history[-7:]):
+            st.markdown(f"{entry['emoji']} **{entry['date']}** - {entry['mood']}")